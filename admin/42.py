@@ -1,4 +1,5 @@
 #!/usr/bin/env python
+import argparse
 import sys
 import shutil
 from pathlib import Path
@@ -16,16 +17,13 @@ try:
     # Attempt to import the project's validation logic.
     try:
         from src.validation.validator import validate_admin_environment
-        from src.data.implementations.sqllite.seed_data import seed_data
-        from src.business.ai.pricing_engine.scorer import score_regions
+        # Seeders and the scorer are imported inside seed_database()/score_tshirt(),
+        # so the console does not load the data and pricing stack just to show a menu.
 
     except ImportError:
         # Provide a graceful fallback if the validator isn't available.
         # This allows the console to run even if the validation module is under development.
         validate_admin_environment = lambda: (True, "Validator not found, skipping.")
-    from InquirerPy import inquirer
-    from InquirerPy.base.control import Choice
-    from InquirerPy.separator import Separator
     from presentation_utils import get_platform_paths
     
     # Import check_apps functions from the same directory
@@ -33,16 +31,6 @@ try:
     import os
     sys.path.insert(0, os.path.dirname(__file__))
     from check_apps import check_app_status, test_app_status
-    
-    from InquirerPy.utils import color_print
-    from admin_utils import (
-        print_header,
-        _pause_for_acknowledgement,
-        run_command,
-        SEPARATOR_LINE,
-        console,
-        print_formatted_help
-    )
 except ImportError as e:
     print(f"\n\033[91mFATAL ERROR: A required package is missing: {e.name}\033[0m")
     print("This usually means your Conda environment is out of sync with 'environment.yaml'.")
@@ -50,6 +38,33 @@ except ImportError as e:
     print(f"  pip install -r requirements.txt")
     sys.exit(1)
 
+
+def _load_console_ui():
+    """
+    Imports the menu UI (InquirerPy, and rich through admin_utils) once the console
+    actually starts, so `--help` and importing this module for profiling skip them.
+    """
+    global inquirer, Choice, Separator, color_print
+    global print_header, _pause_for_acknowledgement, run_command, SEPARATOR_LINE, console, print_formatted_help
+    try:
+        from InquirerPy import inquirer
+        from InquirerPy.base.control import Choice
+        from InquirerPy.separator import Separator
+        from InquirerPy.utils import color_print
+        from admin_utils import (
+            print_header,
+            _pause_for_acknowledgement,
+            run_command,
+            SEPARATOR_LINE,
+            console,
+            print_formatted_help
+        )
+    except ImportError as e:
+        print(f"\n\033[91mFATAL ERROR: A required package is missing: {e.name}\033[0m")
+        print("\nTo fix this, please ensure your environment is active and run:")
+        print(f"  pip install -r requirements.txt")
+        sys.exit(1)
+
 PY_EXEC = f'"{sys.executable}"'
 ALLURE_EXEC = "allure"
 
@@ -390,6 +405,7 @@ def _handle_designer_menu():
                 Separator(SEPARATOR_LINE),
                 Choice("inject", "🎨  Apply Brand to an Application"),
                 Choice("compile", "🎨  Compile Styles for an Application"),
+                Choice("build_assets", "🖼️  Build Flask Brand Assets (hashed, resized, WebP)"),
                 Separator(SEPARATOR_LINE),
                 Choice("critique", "🖌️  Critique All Design Work (test_designer.py)"),
             ],
@@ -411,6 +427,8 @@ def _handle_designer_menu():
                     run_command(f'{PY_EXEC} "{PROJECT_ROOT / "admin" / "inject_brand_assets.py"}" --target {platform_key}')
                 elif action == "compile":
                     run_command(f'{PY_EXEC} "{PROJECT_ROOT / "admin" / "compile_scss.py"}" --target {platform_key}')
+        elif action == "build_assets":
+            run_command(f'{PY_EXEC} "{PROJECT_ROOT / "admin" / "build_brand_assets.py"}"')
         elif action == "critique":
             test_file = str(PROJECT_ROOT / "src" / "presentation" / "tests" / "test_designer.py")
             _run_test_sequence(target=test_file, with_allure=False, is_regression=False, serve_report=False)
@@ -452,6 +470,7 @@ def _handle_qa_engineer_menu():
                 Choice(None, "⬅️  Back to Persona Selection"),
                 Separator(SEPARATOR_LINE),
                 Choice("critique", "🔬  Critique Testability & Quality Contracts (test_qa_engineer.py)"),
+                Choice("load_test", "📈  Load Test the API Server (RPS, p50/p95/p99)"),
             ],
             qmark="🔬"
         ).execute()
@@ -467,6 +486,10 @@ def _handle_qa_engineer_menu():
         if action == "critique":
             test_file = str(PROJECT_ROOT / "src" / "presentation" / "tests" / "test_qa_engineer.py")
             _run_test_sequence(target=test_file, with_allure=False, is_regression=False, serve_report=False)
+        elif action == "load_test":
+            url = inquirer.text(message="Server URL (leave empty to test the app in-process):", default="").execute().strip()
+            target = f' --url "{url}"' if url else ""
+            run_command(f'{PY_EXEC} "{PROJECT_ROOT / "admin" / "load_test.py"}"{target}')
 
         _pause_for_acknowledgement()
 
@@ -590,6 +613,8 @@ def _handle_diagnostics_menu():
                 Separator(SEPARATOR_LINE),
                 Choice("check_deps", "⚙️  Check System Dependencies"),
                 Choice("check_logs", "📄  Check Logs"),
+                Choice("profile_imports", "⏱️  Profile Startup Imports"),
+                Choice("container_stats", "🧩  Show Container Construction Times"),
                 Separator(SEPARATOR_LINE),
                 Choice("test_all", "🧪  Run All Tests"),
                 Choice("test_all_report", "📊  Run All Tests & Report"),
@@ -609,6 +634,10 @@ def _handle_diagnostics_menu():
             run_command(f'{PY_EXEC} "{PROJECT_ROOT / "admin" / "check_dependencies.py"}"')
         elif action == "check_logs":
             run_command(f'{PY_EXEC} "{PROJECT_ROOT / "admin" / "check_logs.py"}"')
+        elif action == "profile_imports":
+            run_command(f'{PY_EXEC} "{PROJECT_ROOT / "admin" / "profile_imports.py"}"')
+        elif action == "container_stats":
+            run_command(f'{PY_EXEC} "{PROJECT_ROOT / "admin" / "show_container_stats.py"}"')
         elif action == "test_all":
             _run_test_sequence(target="PERSONA_CRITIQUES", with_allure=False, is_regression=False, serve_report=False)
         elif action == "test_all_report":
@@ -844,10 +873,22 @@ def score_tshirt():
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="JennAI persona-driven console.")
+    parser.add_argument("--profile", nargs="?", const="", default=None, metavar="PATH",
+                        help="Run the console under the sampling profiler and write collapsed stacks "
+                             "(default: logs/profiles/profile-<timestamp>.collapsed) on exit.")
+    args = parser.parse_args()
+
     setup_logging(debug_mode=config.DEBUG_MODE)
+    _load_console_ui()
+    if args.profile is not None:
+        from core.sampling_profiler import profiler
+        profiler.start()
     try:
         main()
     except KeyboardInterrupt:
         print("\n\nExiting console. Goodbye!")
     finally:
+        if args.profile is not None:
+            print(f"Flame graph input: {profiler.stop_and_dump(args.profile or None)}")
         stop_file_logging()
\ No newline at end of file
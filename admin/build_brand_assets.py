@@ -0,0 +1,194 @@
+#!/usr/bin/env python
+"""
+Builds the Flask app's brand assets for production serving.
+
+For every image under src/presentation/api_server/brand/ it writes, into
+flask_app/static/brand/:
+  - a content-hashed copy (logo.3f2a9c1b04.png), safe to cache forever
+  - resized variants for each BRAND_ASSET_WIDTHS narrower than the original,
+    plus WebP versions of the original and every size (requires Pillow)
+  - .gz/.br siblings for compressible files (icons, SVG, web manifests)
+and a manifest.json mapping source names to those files, which the templates
+read through asset_url()/asset_srcset().
+
+Without Pillow only the hashed copies and precompressed files are produced.
+
+Examples:
+    python admin/build_brand_assets.py
+    python admin/build_brand_assets.py --widths 640 1280 --webp-quality 75
+"""
+import argparse
+import gzip
+import hashlib
+import io
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+# --- Root Project Path Setup ---
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from config import config
+from config.loguru_setup import setup_logging, logger
+
+try:
+    from PIL import Image
+except ImportError: # Optional: without Pillow no resized or WebP variants are built
+    Image = None
+
+try:
+    import brotli
+except ImportError: # Optional: only .gz siblings are written
+    brotli = None
+
+ASSET_SUFFIXES = {".jpg", ".jpeg", ".png", ".webp", ".gif", ".ico", ".svg", ".webmanifest"}
+RASTER_SUFFIXES = {".jpg", ".jpeg", ".png"}
+PRECOMPRESS_SUFFIXES = {".ico", ".svg", ".webmanifest"} # JPEG/PNG/WebP are already compressed
+MANIFEST_VERSION = 1
+
+
+def _hashed_name(stem: str, suffix: str, data: bytes) -> str:
+    return f"{stem}.{hashlib.sha256(data).hexdigest()[:10]}{suffix}"
+
+
+def _write_once(output_dir: Path, name: str, data: bytes) -> bool:
+    """Writes a content-addressed file unless it already exists. Returns True if written."""
+    path = output_dir / name
+    if path.exists():
+        return False
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+    return True
+
+
+def _precompress(output_dir: Path, name: str, data: bytes) -> List[str]:
+    """Writes .gz (and .br) siblings when they are meaningfully smaller. Returns the encodings written."""
+    encodings = []
+    candidates = [("gzip", ".gz", lambda d: gzip.compress(d, compresslevel=9, mtime=0))]
+    if brotli is not None:
+        candidates.insert(0, ("br", ".br", lambda d: brotli.compress(d, quality=11)))
+    for encoding, suffix, compress in candidates:
+        compressed = compress(data)
+        if len(compressed) < len(data) * 0.9:
+            _write_once(output_dir, name + suffix, compressed)
+            encodings.append(encoding)
+    return encodings
+
+
+def _encode(image, fmt: str, quality: int) -> bytes:
+    buffer = io.BytesIO()
+    if fmt == "JPEG":
+        image.convert("RGB").save(buffer, "JPEG", quality=quality, optimize=True, progressive=True)
+    elif fmt == "WEBP":
+        image.save(buffer, "WEBP", quality=quality, method=6)
+    else:
+        image.save(buffer, fmt, optimize=True)
+    return buffer.getvalue()
+
+
+def _raster_variants(source: Path, rel_stem: str, widths: Sequence[int], webp_quality: int,
+                     jpeg_quality: int, output_dir: Path) -> Dict[str, object]:
+    """Resized same-format and WebP variants of one image, smallest first."""
+    with Image.open(source) as original:
+        original.load()
+        width, height = original.size
+        fmt = "JPEG" if source.suffix.lower() in (".jpg", ".jpeg") else "PNG"
+        variants = []
+        for target in sorted({w for w in widths if w < width} | {width}):
+            if target == width:
+                image = original
+            else:
+                image = original.resize((target, round(height * target / width)), Image.LANCZOS)
+            if target != width: # The original is already served as-is under its hashed name
+                data = _encode(image, fmt, jpeg_quality)
+                name = _hashed_name(f"{rel_stem}-{target}w", source.suffix.lower(), data)
+                _write_once(output_dir, name, data)
+                variants.append({"file": name, "width": target, "format": source.suffix.lower().lstrip(".")})
+            webp = _encode(image, "WEBP", webp_quality)
+            name = _hashed_name(f"{rel_stem}-{target}w", ".webp", webp)
+            _write_once(output_dir, name, webp)
+            variants.append({"file": name, "width": target, "format": "webp"})
+    return {"width": width, "height": height, "variants": variants}
+
+
+def build_assets(source_dir: Path = config.API_BRAND_DIR, output_dir: Path = config.BRAND_BUILD_DIR,
+                 widths: Sequence[int] = config.BRAND_ASSET_WIDTHS, webp_quality: int = config.BRAND_WEBP_QUALITY,
+                 jpeg_quality: int = config.BRAND_JPEG_QUALITY, prune: bool = True) -> Dict[str, object]:
+    """
+    Builds every asset under `source_dir` and writes output_dir/manifest.json.
+    Output names are content hashes, so unchanged inputs are not rewritten and
+    a rebuild only adds files; `prune` then removes files the new manifest no
+    longer references.
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+    if Image is None:
+        logger.warning("WARNING - Pillow is not installed: building hashed copies only (no resized/WebP variants).")
+
+    assets: Dict[str, Dict[str, object]] = {}
+    for source in sorted(p for p in source_dir.rglob("*") if p.is_file() and p.suffix.lower() in ASSET_SUFFIXES):
+        rel = source.relative_to(source_dir).as_posix()
+        rel_stem = rel[: -len(source.suffix)]
+        data = source.read_bytes()
+        name = _hashed_name(rel_stem, source.suffix.lower(), data)
+        _write_once(output_dir, name, data)
+        entry: Dict[str, object] = {"file": name, "bytes": len(data), "variants": []}
+        if source.suffix.lower() in PRECOMPRESS_SUFFIXES:
+            entry["encodings"] = _precompress(output_dir, name, data)
+        if Image is not None and source.suffix.lower() in RASTER_SUFFIXES:
+            entry.update(_raster_variants(source, rel_stem, widths, webp_quality, jpeg_quality, output_dir))
+        assets[rel] = entry
+        logger.debug(f"DEBUG - {rel} -> {name} ({len(entry['variants'])} variants)")
+
+    manifest = {"version": MANIFEST_VERSION, "assets": assets}
+    manifest_path = output_dir / config.BRAND_MANIFEST_PATH.name
+    tmp = manifest_path.with_name(manifest_path.name + ".tmp")
+    tmp.write_text(json.dumps(manifest, indent=2, sort_keys=True), encoding="utf-8")
+    os.replace(tmp, manifest_path) # Running servers never read a half-written manifest
+
+    if prune:
+        _prune(output_dir, manifest, keep={manifest_path.name})
+    logger.success(f"SUCCESS - Built {len(assets)} brand assets into {output_dir}")
+    return manifest
+
+
+def _prune(output_dir: Path, manifest: Dict[str, object], keep: set) -> None:
+    referenced = set(keep)
+    for entry in manifest["assets"].values():
+        files = [entry["file"]] + [variant["file"] for variant in entry["variants"]]
+        for name in files:
+            referenced.add(name)
+            referenced.update(name + suffix for suffix in (".gz", ".br"))
+    for path in output_dir.rglob("*"):
+        if path.is_file() and path.relative_to(output_dir).as_posix() not in referenced:
+            path.unlink()
+            logger.debug(f"DEBUG - Pruned {path.relative_to(output_dir)}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Build hashed, resized and WebP brand assets plus a manifest.")
+    parser.add_argument("--source", type=Path, default=config.API_BRAND_DIR, help="Directory of source images.")
+    parser.add_argument("--output", type=Path, default=config.BRAND_BUILD_DIR, help="Build output directory.")
+    parser.add_argument("--widths", type=int, nargs="+", default=list(config.BRAND_ASSET_WIDTHS), help="Resized variant widths in pixels.")
+    parser.add_argument("--webp-quality", type=int, default=config.BRAND_WEBP_QUALITY)
+    parser.add_argument("--jpeg-quality", type=int, default=config.BRAND_JPEG_QUALITY)
+    parser.add_argument("--no-prune", action="store_true", help="Keep files from previous builds.")
+    args = parser.parse_args(argv)
+
+    if not args.source.is_dir():
+        logger.error(f"Source directory not found: {args.source}")
+        return 1
+    manifest = build_assets(args.source, args.output, args.widths, args.webp_quality, args.jpeg_quality, prune=not args.no_prune)
+    before = sum(entry["bytes"] for entry in manifest["assets"].values())
+    logger.info(f"INFO - {len(manifest['assets'])} assets, {before / 1024:.0f} KiB of originals.")
+    return 0
+
+
+if __name__ == "__main__":
+    setup_logging(debug_mode=config.DEBUG_MODE)
+    sys.exit(main())
@@ -1,6 +1,5 @@
 #!/usr/bin/env python
 
-import re
 from pathlib import Path
 import argparse
 from typing import Optional, List
@@ -10,40 +9,34 @@ import sys
 ROOT = Path(__file__).resolve().parent.parent
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
+ADMIN_DIR = Path(__file__).resolve().parent # Sibling admin scripts are imported directly, as in 42.py
+if str(ADMIN_DIR) not in sys.path:
+    sys.path.insert(0, str(ADMIN_DIR))
 
 from loguru import logger # Using logger for this script's own messages
 from config.loguru_setup import setup_logging
+from log_analyzer import scan_file
 # from config.config import DEBUG_MODE # If you want to use global debug mode
 
-def parse_log_file(log_file_path: Path, error_patterns: List[str], warning_patterns: Optional[List[str]] = None):
+def parse_log_file(log_file_path: Path, error_patterns: List[str], warning_patterns: Optional[List[str]] = None,
+                   max_examples: int = 10):
     """
     Parses a log file for specified error and warning patterns.
+
+    Scanning is delegated to admin/log_analyzer.py (one combined regex over large
+    chunks, .zip archives supported). Only the first `max_examples` matching lines
+    per category are returned; the counts cover the whole file.
     """
     if not log_file_path.exists():
         logger.error(f"Log file not found: {log_file_path}")
         return False, 0, 0, [], []
 
-    errors_found = []
-    warnings_found = []
-    error_count = 0
-    warning_count = 0
-
     logger.info(f"Scanning log file: {log_file_path}")
 
-    with open(log_file_path, 'r', encoding='utf-8') as f:
-        for line_number, line in enumerate(f, 1):
-            for pattern in error_patterns:
-                if re.search(pattern, line, re.IGNORECASE):
-                    errors_found.append(f"L{line_number}: {line.strip()}")
-                    error_count += 1
-                    break # Move to next line once an error pattern is found
-            
-            if warning_patterns:
-                for pattern in warning_patterns:
-                    if re.search(pattern, line, re.IGNORECASE):
-                        warnings_found.append(f"L{line_number}: {line.strip()}")
-                        warning_count +=1
-                        break # Move to next line
+    result = scan_file(log_file_path, error_patterns, warning_patterns, max_examples=max_examples)
+    error_count, warning_count = result.error_count, result.warning_count
+    errors_found = [line.split(":", 1)[1] for line in result.errors_found] # Drop the file label: "L<n>: text"
+    warnings_found = [line.split(":", 1)[1] for line in result.warnings_found]
 
     if error_count > 0:
         logger.error(f"Found {error_count} error(s) in {log_file_path}:")
@@ -76,11 +69,27 @@ if __name__ == "__main__":
         default="logs/jennai.log",  # Default to the main application/session log
         help="Path to the log file to scan (relative to project root, or absolute)."
     )
+    # Indexed queries: answered from logs/log_index.sqlite (updated incrementally first)
+    # instead of rescanning the log file and its rotated archives.
+    parser.add_argument("--request-id", help="Show all lines for this [Request ID: ...].")
+    parser.add_argument("--since", help="Only records at or after this minute (e.g. 2025-07-25T10:00).")
+    parser.add_argument("--until", help="Only records at or before this minute.")
+    parser.add_argument("--level", help="Only records at or above this level (e.g. ERROR).")
     args = parser.parse_args()
 
     # Use the standardized ROOT variable
     log_file_to_scan = ROOT / args.log_file
 
+    if any((args.request_id, args.since, args.until, args.level)):
+        from log_index import update_index
+        with update_index(log_file_to_scan) as index:
+            matches = 0
+            for record in index.query(request_id=args.request_id, since=args.since, until=args.until, level=args.level):
+                print(record.text)
+                matches += 1
+        logger.info(f"{matches} matching log record(s).")
+        sys.exit(0)
+
     # Define patterns to look for.
     # These are case-insensitive regular expressions.
     CRITICAL_ERROR_PATTERNS = [
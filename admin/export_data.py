@@ -0,0 +1,144 @@
+#!/usr/bin/env python
+"""
+Exports scoring tables to CSV or Parquet with bounded memory.
+
+Rows are read from SQLite in keyset-paginated chunks and written as they
+arrive, so exports of any size use one chunk of memory. --resume continues an
+interrupted CSV export from the last id already in the output file, up to the
+id bound the first attempt was pinned to (kept in <output>.until-id), so rows
+inserted in between are not picked up. The scores table is not resume-stable:
+rescoring a product replaces its rows with new ids, so restart score exports
+instead of resuming them.
+
+Examples:
+    python admin/export_data.py scores
+    python admin/export_data.py fx --since 2024-01-01 --until 2025-01-01
+    python admin/export_data.py supply --format parquet --output exports/supply.parquet
+    python admin/export_data.py scores --resume --output exports/scores.csv
+"""
+import argparse
+import os
+import sqlite3
+import sys
+import time
+from dataclasses import replace
+from pathlib import Path
+from typing import List, Optional
+
+# --- Root Project Path Setup ---
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from config import config
+from config.loguru_setup import setup_logging, logger
+from src.data.implementations.sqllite.export import (
+    DATASETS, EXPORT_FORMATS, ExportRange, connect_read_only, iter_csv, iter_parquet, pin_range,
+)
+
+
+def last_exported_id(path: Path) -> Optional[int]:
+    """The id on the last complete line of a CSV export (read from the end of the file), or None."""
+    with open(path, "rb") as f:
+        f.seek(max(0, f.seek(0, os.SEEK_END) - 64 * 1024))
+        tail = f.read()
+    complete = tail[: tail.rfind(b"\n") + 1] # A partially written last line is dropped and rewritten
+    for line in reversed(complete.splitlines()):
+        first = line.split(b",", 1)[0]
+        if first.isdigit():
+            return int(first)
+    return None
+
+
+def until_id_file(output: Path) -> Path:
+    """Where a CSV export records the until_id it was pinned to, for --resume."""
+    return output.with_name(output.name + ".until-id")
+
+
+def export(dataset: str, fmt: str, output: Path, export_range: ExportRange, chunk_rows: int,
+           db_path: Path = config.DB_PATH, resume: bool = False) -> int:
+    """Writes one export and returns the number of bytes written."""
+    conn = connect_read_only(db_path)
+    try:
+        if resume and output.exists():
+            if fmt != "csv":
+                raise ValueError("--resume is only supported for CSV; Parquet files cannot be appended to.")
+            if export_range.until_id is None:
+                export_range = replace(export_range, until_id=_pinned_until_id(output))
+            if dataset == "scores":
+                logger.warning("WARNING - Resumed score exports miss products rescored since the first attempt "
+                               "(their rows are replaced with new ids); restart the export for a consistent copy.")
+            after_id = last_exported_id(output)
+            if after_id is not None:
+                export_range = replace(export_range, after_id=after_id)
+                _truncate_partial_line(output)
+                logger.info(f"INFO - Resuming {output.name} after id {after_id}.")
+        else:
+            resume = False
+        export_range = pin_range(conn, DATASETS[dataset], export_range)
+        writer = iter_csv if fmt == "csv" else iter_parquet
+        kwargs = {"header": not resume} if fmt == "csv" else {}
+
+        output.parent.mkdir(parents=True, exist_ok=True)
+        if fmt == "csv":
+            until_id_file(output).write_text(f"{export_range.until_id}\n")
+        written = 0
+        with open(output, "ab" if resume else "wb") as f:
+            for block in writer(conn, DATASETS[dataset], export_range, chunk_rows, **kwargs):
+                f.write(block)
+                written += len(block)
+        return written
+    finally:
+        conn.close()
+
+
+def _pinned_until_id(output: Path) -> int:
+    try:
+        return int(until_id_file(output).read_text())
+    except (OSError, ValueError):
+        raise ValueError(f"Cannot resume {output.name}: {until_id_file(output).name} is missing or unreadable, "
+                         "so the id bound of the first attempt is unknown; pass --until-id.") from None
+
+
+def _truncate_partial_line(path: Path) -> None:
+    with open(path, "rb+") as f:
+        data_end = f.seek(0, os.SEEK_END)
+        f.seek(max(0, data_end - 64 * 1024))
+        tail = f.read()
+        cut = tail.rfind(b"\n")
+        if cut != len(tail) - 1:
+            f.truncate(data_end - len(tail) + cut + 1)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Stream a scoring table to CSV or Parquet.")
+    parser.add_argument("dataset", choices=sorted(DATASETS), help="Table to export.")
+    parser.add_argument("--format", choices=EXPORT_FORMATS, default="csv")
+    parser.add_argument("--output", type=Path, help="Output file (default: exports/<dataset>.<format>).")
+    parser.add_argument("--after-id", type=int, default=0, help="Export rows with id greater than this.")
+    parser.add_argument("--until-id", type=int, help="Export rows with id up to this (default: current maximum; "
+                                                      "with --resume, the bound the export started with).")
+    parser.add_argument("--since", help="Earliest timestamp/date to include (inclusive).")
+    parser.add_argument("--until", help="Latest timestamp/date to include (exclusive).")
+    parser.add_argument("--chunk-rows", type=int, default=config.EXPORT_CHUNK_ROWS, help="Rows per database read.")
+    parser.add_argument("--resume", action="store_true", help="Append to an existing CSV after its last id.")
+    parser.add_argument("--db", type=Path, default=config.DB_PATH, help="SQLite database to export from.")
+    args = parser.parse_args(argv)
+
+    output = args.output or config.EXPORT_DIR / f"{args.dataset}.{args.format}"
+    started = time.perf_counter()
+    try:
+        written = export(args.dataset, args.format, output,
+                         ExportRange(args.after_id, args.until_id, args.since, args.until),
+                         args.chunk_rows, db_path=args.db, resume=args.resume)
+    except (sqlite3.Error, RuntimeError, ValueError) as e:
+        logger.error(f"ERROR - Export failed: {e}")
+        return 1
+    logger.success(f"SUCCESS - Exported {args.dataset} to {output} "
+                   f"({written / 1024:.0f} KiB in {time.perf_counter() - started:.1f}s).")
+    return 0
+
+
+if __name__ == "__main__":
+    setup_logging(debug_mode=config.DEBUG_MODE)
+    sys.exit(main())
@@ -0,0 +1,294 @@
+#!/usr/bin/env python
+"""
+HTTP load test for the Flask API server.
+
+Runs `--concurrency` closed-loop clients for `--duration` seconds, each
+picking requests from a weighted mix, and reports throughput, p50/p95/p99
+latency and error rates overall and per request. Results are saved as JSON
+(logs/loadtests/ by default, named after the current commit) and can be
+diffed against an earlier run with --compare.
+
+Targets:
+  in-process (default)  the app from create_app() through Flask's test client;
+                        measures the app without a network, but client and
+                        server share one interpreter (and its GIL)
+  --url URL             a running server, e.g. `python main.py serve`, over
+                        keep-alive HTTP connections (one per client)
+
+Request mix: "METHOD /path [WEIGHT]" entries, e.g.
+    --mix "GET /api/scores/1 5" "GET /api/scores/top?k=10 2" "GET /healthz"
+
+Examples:
+    python admin/load_test.py --duration 20 --concurrency 16
+    python admin/load_test.py --url http://127.0.0.1:8000 --compare logs/loadtests/loadtest-abc1234.json
+"""
+import argparse
+import http.client
+import json
+import math
+import platform
+import random
+import subprocess
+import sys
+import threading
+import time
+from collections import Counter, defaultdict
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+from urllib.parse import urlsplit
+
+# --- Root Project Path Setup ---
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from config import config
+from config.loguru_setup import setup_logging, logger
+
+DEFAULT_MIX = ["GET /api/scores/1 4", "GET /api/scores/top?k=10 2", "GET /healthz 1"]
+
+# (method, path) -> status code; raises on connection errors
+Sender = Callable[[str, str], int]
+
+
+def parse_mix(entries: Sequence[str]) -> List[Tuple[str, str, float]]:
+    """["GET /api/scores/1 4", ...] -> [("GET", "/api/scores/1", 4.0), ...]. The weight defaults to 1."""
+    mix = []
+    for entry in entries:
+        parts = entry.split()
+        if len(parts) not in (2, 3) or not parts[1].startswith("/"):
+            raise ValueError(f"Invalid mix entry {entry!r}; expected 'METHOD /path [WEIGHT]'.")
+        try:
+            weight = float(parts[2]) if len(parts) == 3 else 1.0
+        except ValueError:
+            weight = 0.0
+        if weight <= 0:
+            raise ValueError(f"Invalid weight in mix entry {entry!r}; expected a positive number.")
+        mix.append((parts[0].upper(), parts[1], weight))
+    return mix
+
+
+def percentile(sorted_values: Sequence[float], q: float) -> float:
+    """Nearest-rank percentile of an already sorted sequence (0 for an empty one)."""
+    if not sorted_values:
+        return 0.0
+    return sorted_values[max(1, math.ceil(q / 100 * len(sorted_values))) - 1]
+
+
+def summarize(latencies: List[float], statuses: Counter, errors: int, elapsed_s: float) -> Dict[str, object]:
+    """Latencies in seconds -> a report in milliseconds. Failures are connection errors and 5xx responses."""
+    ordered = sorted(latencies)
+    total = len(ordered) + errors
+    failed = errors + sum(n for status, n in statuses.items() if status >= 500)
+    return {
+        "requests": total,
+        "rps": round(total / elapsed_s, 2) if elapsed_s else 0.0,
+        "errors": failed,
+        "error_rate": round(failed / total, 4) if total else 0.0,
+        "status_codes": {str(status): n for status, n in sorted(statuses.items())},
+        "latency_ms": {
+            "mean": round(sum(ordered) / len(ordered) * 1000, 3) if ordered else 0.0,
+            "p50": round(percentile(ordered, 50) * 1000, 3),
+            "p95": round(percentile(ordered, 95) * 1000, 3),
+            "p99": round(percentile(ordered, 99) * 1000, 3),
+            "max": round(ordered[-1] * 1000, 3) if ordered else 0.0,
+        },
+    }
+
+
+def run_load_test(sender_factory: Callable[[], Sender], mix: List[Tuple[str, str, float]], concurrency: int,
+                  duration_s: float, warmup_s: float = 0.0, seed: Optional[int] = None) -> Dict[str, object]:
+    """
+    Runs closed-loop clients (each sends its next request when the previous
+    one completes) and returns the overall and per-request summaries.
+    Requests started during the warm-up are sent but not recorded.
+    """
+    labels = [f"{method} {path}" for method, path, _ in mix]
+    weights = [weight for _, _, weight in mix]
+    latencies: Dict[str, List[float]] = defaultdict(list)
+    statuses: Dict[str, Counter] = defaultdict(Counter)
+    errors: Counter = Counter()
+    lock = threading.Lock()
+    started = time.perf_counter()
+    measure_from = started + warmup_s
+    stop_at = measure_from + duration_s
+
+    def client(index: int) -> None:
+        rng = random.Random(None if seed is None else seed + index)
+        send = sender_factory()
+        local_latencies, local_statuses, local_errors = defaultdict(list), defaultdict(Counter), Counter()
+        while True:
+            request_started = time.perf_counter()
+            if request_started >= stop_at:
+                break
+            choice = rng.choices(range(len(mix)), weights)[0]
+            method, path, _ = mix[choice]
+            try:
+                status = send(method, path)
+            except Exception as e:
+                if request_started >= measure_from:
+                    local_errors[labels[choice]] += 1
+                logger.debug(f"DEBUG - {labels[choice]} failed: {e}")
+                continue
+            if request_started >= measure_from:
+                local_latencies[labels[choice]].append(time.perf_counter() - request_started)
+                local_statuses[labels[choice]][status] += 1
+        with lock: # Merged once per client, so recording costs no lock traffic while measuring
+            for label in local_latencies:
+                latencies[label].extend(local_latencies[label])
+            for label in local_statuses:
+                statuses[label].update(local_statuses[label])
+            errors.update(local_errors)
+
+    threads = [threading.Thread(target=client, args=(i,), name=f"load-client-{i}") for i in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # Throughput over the measured window: only requests started inside it are recorded
+    all_statuses = sum(statuses.values(), Counter())
+    return {
+        "overall": summarize([v for values in latencies.values() for v in values], all_statuses,
+                             sum(errors.values()), duration_s),
+        "endpoints": {label: summarize(latencies[label], statuses[label], errors[label], duration_s)
+                      for label in labels},
+    }
+
+
+def in_process_sender_factory(app) -> Callable[[], Sender]:
+    """Senders that call the app in-process, one test client per load client."""
+    def factory() -> Sender:
+        client = app.test_client()
+
+        def send(method: str, path: str) -> int:
+            response = client.open(path, method=method)
+            response.close()
+            return response.status_code
+        return send
+    return factory
+
+
+def http_sender_factory(base_url: str, timeout_s: float = 30.0) -> Callable[[], Sender]:
+    """Senders over one persistent HTTP/1.1 connection each, reconnecting after errors."""
+    parts = urlsplit(base_url)
+    connection_class = http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+    prefix = parts.path.rstrip("/")
+
+    def factory() -> Sender:
+        connection = [connection_class(parts.netloc, timeout=timeout_s)]
+
+        def send(method: str, path: str) -> int:
+            try:
+                connection[0].request(method, prefix + path, headers={"Accept-Encoding": "gzip"})
+                response = connection[0].getresponse()
+                response.read()
+                return response.status
+            except (OSError, http.client.HTTPException):
+                connection[0].close()
+                connection[0] = connection_class(parts.netloc, timeout=timeout_s)
+                raise
+        return send
+    return factory
+
+
+def _git_commit() -> str:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def compare_results(current: Dict[str, object], baseline: Dict[str, object]) -> List[Dict[str, object]]:
+    """Per-request changes in throughput and tail latency (current - baseline) for requests in both runs."""
+    rows = []
+    for label in ["overall"] + sorted(set(current["endpoints"]) & set(baseline["endpoints"])):
+        now = current["overall"] if label == "overall" else current["endpoints"][label]
+        before = baseline["overall"] if label == "overall" else baseline["endpoints"][label]
+        rows.append({
+            "request": label,
+            "rps": (before["rps"], now["rps"]),
+            "p95_ms": (before["latency_ms"]["p95"], now["latency_ms"]["p95"]),
+            "p99_ms": (before["latency_ms"]["p99"], now["latency_ms"]["p99"]),
+            "error_rate": (before["error_rate"], now["error_rate"]),
+        })
+    return rows
+
+
+def _report(results: Dict[str, object]) -> None:
+    meta = results["meta"]
+    logger.info(f"=== {meta['target']}: {meta['concurrency']} clients for {meta['duration_s']}s "
+                f"(commit {meta['commit']}) ===")
+    for label, summary in [("overall", results["overall"])] + list(results["endpoints"].items()):
+        latency = summary["latency_ms"]
+        logger.info(f"  {label:<40} {summary['rps']:>9.1f} rps  p50 {latency['p50']:>8.2f}  p95 {latency['p95']:>8.2f}  "
+                    f"p99 {latency['p99']:>8.2f} ms  errors {summary['error_rate']:.2%}")
+
+
+def _report_comparison(rows: List[Dict[str, object]], baseline_commit: str) -> None:
+    logger.info(f"--- vs {baseline_commit} ---")
+    for row in rows:
+        (rps_before, rps_now), (p95_before, p95_now), (p99_before, p99_now) = row["rps"], row["p95_ms"], row["p99_ms"]
+        change = f"{(rps_now - rps_before) / rps_before:+.1%}" if rps_before else "n/a"
+        logger.info(f"  {row['request']:<40} rps {rps_before:.1f} -> {rps_now:.1f} ({change})  "
+                    f"p95 {p95_before:.2f} -> {p95_now:.2f} ms  p99 {p99_before:.2f} -> {p99_now:.2f} ms")
+
+
+def _in_process_app():
+    from core.bootstrap import prewarm_container
+    from src.presentation.api_server.flask_app.app import create_app
+
+    return create_app(prewarm_container())
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Load test the Flask API: throughput, tail latency, error rate.")
+    parser.add_argument("--url", help="Base URL of a running server (default: the app in-process).")
+    parser.add_argument("--concurrency", "-c", type=int, default=config.LOAD_TEST_CONCURRENCY)
+    parser.add_argument("--duration", "-d", type=float, default=config.LOAD_TEST_DURATION_S, help="Seconds to measure.")
+    parser.add_argument("--warmup", type=float, default=config.LOAD_TEST_WARMUP_S, help="Unrecorded seconds first.")
+    parser.add_argument("--mix", nargs="+", default=DEFAULT_MIX, help="Weighted requests, 'METHOD /path [WEIGHT]'.")
+    parser.add_argument("--seed", type=int, help="Seed the request mix for repeatable runs.")
+    parser.add_argument("--output", type=Path, help="Results JSON (default: logs/loadtests/loadtest-<commit>-<time>.json).")
+    parser.add_argument("--compare", type=Path, help="Earlier results JSON to compare against.")
+    args = parser.parse_args(argv)
+
+    try:
+        mix = parse_mix(args.mix)
+    except ValueError as e:
+        logger.error(str(e))
+        return 2
+    if args.url:
+        sender_factory, target = http_sender_factory(args.url), args.url
+    else:
+        try:
+            sender_factory, target = in_process_sender_factory(_in_process_app()), "in-process"
+        except ImportError as e:
+            logger.error(f"ERROR - Could not build the Flask app in-process ({e}); use --url against a running server.")
+            return 1
+
+    results = run_load_test(sender_factory, mix, args.concurrency, args.duration, args.warmup, args.seed)
+    results["meta"] = {
+        "target": target, "commit": _git_commit(), "started_at": datetime.now(timezone.utc).isoformat(),
+        "concurrency": args.concurrency, "duration_s": args.duration, "warmup_s": args.warmup, "mix": args.mix,
+        "python": platform.python_version(), "platform": platform.platform(),
+    }
+    _report(results)
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+        _report_comparison(compare_results(results, baseline), baseline.get("meta", {}).get("commit", str(args.compare)))
+
+    timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+    output = args.output or config.LOAD_TEST_DIR / f"loadtest-{results['meta']['commit']}-{timestamp}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(results, indent=2), encoding="utf-8")
+    logger.success(f"SUCCESS - Results saved to {output}")
+    return 1 if results["overall"]["requests"] == 0 else 0
+
+
+if __name__ == "__main__":
+    setup_logging(debug_mode=config.DEBUG_MODE)
+    sys.exit(main())
@@ -0,0 +1,269 @@
+#!/usr/bin/env python
+"""
+Streaming log analyzer for the loguru text logs (logs/jennai.log and its rotated archives).
+
+- All error and warning patterns are compiled into ONE alternation regex with a
+  named group per category, run over large binary chunks instead of line by line.
+- Rotated archives written by loguru (`*.log.zip`) are read in place.
+- Counts are aggregated by level, module and time bucket from the log line header.
+- Only the first `max_examples` matching lines per category are kept in memory.
+- Several files are scanned in parallel in a process pool.
+
+Examples:
+    python admin/log_analyzer.py                        # logs/jennai.log and its rotated archives
+    python admin/log_analyzer.py logs/pytest_session.log --bucket hour
+    python admin/log_analyzer.py --workers 8 --top 20
+"""
+import argparse
+import re
+import sys
+import zipfile
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import BinaryIO, Iterator, List, Optional, Sequence, Tuple
+
+# --- Root Project Path Setup ---
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from config import config
+from config.loguru_setup import setup_logging, logger
+
+CHUNK_SIZE = 8 * 1024 * 1024 # Bytes read per iteration; large reads keep the regex engine busy, not the Python loop
+
+DEFAULT_ERROR_PATTERNS = [
+    r"ERROR",
+    r"CRITICAL",
+    r"Traceback \(most recent call last\)",
+    r"ModuleNotFoundError",
+    r"Exception:",
+]
+DEFAULT_WARNING_PATTERNS = [
+    r"WARNING",
+]
+
+# Header of config.loguru_setup.FILE_FORMAT: "{time} | {level} | {name}:{function}:{line} | {message}"
+# e.g. "2025-07-25T10:04:31.123456+0000 | INFO | core.bootstrap:get_configured_container:11 | ..."
+# The time group captures only as much of the timestamp as the bucket needs.
+BUCKET_PATTERNS = {
+    "day": rb"\d{4}-\d\d-\d\d",
+    "hour": rb"\d{4}-\d\d-\d\d[T ]\d\d",
+    "minute": rb"\d{4}-\d\d-\d\d[T ]\d\d:\d\d",
+}
+_HEADERS = {
+    bucket: re.compile(rb"^(" + time_pattern + rb")\S* \| ([A-Z]+) *\| ([^:| ]+):", re.MULTILINE)
+    for bucket, time_pattern in BUCKET_PATTERNS.items()
+}
+_QUANTIFIERS = "?*{+"
+
+
+@dataclass
+class LogScanResult:
+    """Aggregated result of scanning one or more log files."""
+    files: List[str] = field(default_factory=list)
+    lines: int = 0
+    bytes: int = 0
+    error_count: int = 0
+    warning_count: int = 0
+    errors_found: List[str] = field(default_factory=list)   # First max_examples lines, as "file:L<n>: text"
+    warnings_found: List[str] = field(default_factory=list)
+    levels: Counter = field(default_factory=Counter)
+    modules: Counter = field(default_factory=Counter)
+    buckets: Counter = field(default_factory=Counter)
+
+    def merge(self, other: "LogScanResult", max_examples: int) -> "LogScanResult":
+        self.files.extend(other.files)
+        self.lines += other.lines
+        self.bytes += other.bytes
+        self.error_count += other.error_count
+        self.warning_count += other.warning_count
+        self.errors_found.extend(other.errors_found[:max(0, max_examples - len(self.errors_found))])
+        self.warnings_found.extend(other.warnings_found[:max(0, max_examples - len(self.warnings_found))])
+        self.levels.update(other.levels)
+        self.modules.update(other.modules)
+        self.buckets.update(other.buckets)
+        return self
+
+
+def _first_char(pattern: str) -> Optional[str]:
+    """The literal character every match of `pattern` starts with, if it is obvious from the source."""
+    if not pattern or "|" in pattern or not (pattern[0].isalnum() or pattern[0] in " _-:<>"):
+        return None
+    if len(pattern) > 1 and pattern[1] in _QUANTIFIERS:
+        return None
+    return pattern[0]
+
+
+def compile_patterns(error_patterns: Sequence[str], warning_patterns: Optional[Sequence[str]] = None) -> "re.Pattern[bytes]":
+    """
+    Compiles every pattern into a single case-insensitive alternation:
+    (?P<error>e1|e2|...)|(?P<warning>w1|...). Each match is attributed to the
+    first category whose pattern matches at that position.
+
+    When every pattern starts with a literal character, the alternation is
+    prefixed with a lookahead on that character set, so the regex engine skips
+    most positions with a single set test instead of trying each alternative.
+    """
+    groups = []
+    for name, patterns in (("error", error_patterns), ("warning", warning_patterns or [])):
+        if patterns:
+            alternation = "|".join(f"(?:{pattern})" for pattern in patterns)
+            groups.append(f"(?P<{name}>{alternation})")
+    if not groups:
+        raise ValueError("At least one error or warning pattern is required.")
+    combined = "|".join(groups)
+
+    first_chars = [_first_char(pattern) for pattern in list(error_patterns) + list(warning_patterns or [])]
+    if all(first_chars):
+        charset = "".join(sorted({c for char in first_chars for c in (char.lower(), char.upper())}))
+        combined = f"(?=[{re.escape(charset)}])(?:{combined})"
+    return re.compile(combined.encode("utf-8"), re.IGNORECASE | re.MULTILINE)
+
+
+def _iter_chunks(stream: BinaryIO, chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    """Yields chunks that always end on a line boundary (the partial tail is carried over)."""
+    tail = b""
+    while True:
+        block = stream.read(chunk_size)
+        if not block:
+            break
+        block = tail + block
+        cut = block.rfind(b"\n") + 1
+        if cut == 0: # A single line longer than chunk_size: keep reading
+            tail = block
+            continue
+        tail = block[cut:]
+        yield block[:cut]
+    if tail:
+        yield tail
+
+
+def _open_streams(path: Path) -> Iterator[Tuple[str, BinaryIO]]:
+    """Opens a plain log file, or every member of a rotated `.zip` archive."""
+    if path.suffix == ".zip":
+        with zipfile.ZipFile(path) as archive:
+            for member in archive.infolist():
+                if not member.is_dir():
+                    with archive.open(member) as stream:
+                        yield f"{path.name}!{member.filename}", stream
+    else:
+        with open(path, "rb") as stream:
+            yield path.name, stream
+
+
+def scan_file(path: Path, error_patterns: Sequence[str], warning_patterns: Optional[Sequence[str]] = None,
+              bucket: str = "minute", max_examples: int = 10, chunk_size: int = CHUNK_SIZE) -> LogScanResult:
+    """
+    Scans one log file (or rotated .zip archive) in `chunk_size` binary chunks.
+    A line counts once per category, however many patterns it matches.
+    """
+    matcher = compile_patterns(error_patterns, warning_patterns)
+    header = _HEADERS[bucket]
+    result = LogScanResult(files=[str(path)])
+
+    for label, stream in _open_streams(Path(path)):
+        line_number = 1 # Line number at `counted_to`
+        for chunk in _iter_chunks(stream, chunk_size):
+            result.bytes += len(chunk)
+            # Count distinct (time bucket, level, module) headers first: far fewer keys to decode.
+            for (time_key, level, module), count in Counter(header.findall(chunk)).items():
+                result.levels[level.decode("ascii")] += count
+                result.modules[module.decode("utf-8", "replace")] += count
+                result.buckets[time_key.decode("ascii").replace(" ", "T")] += count
+
+            counted_to = 0
+            last_line_start = {"error": -1, "warning": -1}
+            for match in matcher.finditer(chunk):
+                category = match.lastgroup
+                start = chunk.rfind(b"\n", 0, match.start()) + 1
+                if last_line_start[category] == start:
+                    continue # This line was already counted for this category
+                last_line_start[category] = start
+                line_number += chunk.count(b"\n", counted_to, start)
+                counted_to = start
+                if category == "error":
+                    result.error_count += 1
+                    examples = result.errors_found
+                else:
+                    result.warning_count += 1
+                    examples = result.warnings_found
+                if len(examples) < max_examples:
+                    end = chunk.find(b"\n", match.end())
+                    text = chunk[start:end if end != -1 else len(chunk)].decode("utf-8", "replace").strip()
+                    examples.append(f"{label}:L{line_number}: {text}")
+            newlines = chunk.count(b"\n")
+            line_number += chunk.count(b"\n", counted_to)
+            result.lines += newlines if chunk.endswith(b"\n") else newlines + 1
+    return result
+
+
+def find_log_files(log_file: Path, include_rotated: bool = True) -> List[Path]:
+    """The log file plus, optionally, the archives loguru rotated out of it (oldest first)."""
+    files = []
+    if include_rotated and log_file.parent.exists():
+        files.extend(sorted(log_file.parent.glob(f"{log_file.stem}.*{log_file.suffix}*")))
+    if log_file.exists():
+        files.append(log_file)
+    return files
+
+
+def analyze_files(paths: Sequence[Path], error_patterns: Sequence[str] = DEFAULT_ERROR_PATTERNS,
+                  warning_patterns: Optional[Sequence[str]] = DEFAULT_WARNING_PATTERNS, bucket: str = "minute",
+                  max_examples: int = 10, workers: Optional[int] = None) -> LogScanResult:
+    """Scans several files, in parallel across processes when there is more than one."""
+    result = LogScanResult()
+    if len(paths) <= 1 or workers == 1:
+        for path in paths:
+            result.merge(scan_file(path, error_patterns, warning_patterns, bucket, max_examples), max_examples)
+        return result
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(scan_file, path, error_patterns, warning_patterns, bucket, max_examples) for path in paths]
+        for future in futures: # Merge in submission order, so examples stay in file order
+            result.merge(future.result(), max_examples)
+    return result
+
+
+def report(result: LogScanResult, top: int = 10) -> None:
+    logger.info(f"Scanned {len(result.files)} file(s), {result.lines} lines, {result.bytes / 1e6:.1f} MB.")
+    logger.info(f"Errors: {result.error_count}, warnings: {result.warning_count}")
+    for title, counter in (("level", result.levels), ("module", result.modules)):
+        logger.info(f"By {title}:")
+        for name, count in counter.most_common(top):
+            logger.info(f"  {count:>8}  {name}")
+    logger.info("Busiest time buckets:")
+    for name, count in result.buckets.most_common(top):
+        logger.info(f"  {count:>8}  {name}")
+    for line in result.errors_found:
+        logger.error(f"  {line}")
+    for line in result.warnings_found:
+        logger.warning(f"  {line}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Analyze loguru log files and their rotated archives.")
+    parser.add_argument("paths", nargs="*", type=Path, help=f"Log files or .zip archives (default: {config.LOG_FILE.name} and its archives).")
+    parser.add_argument("--no-rotated", action="store_true", help="Ignore rotated archives of the default log file.")
+    parser.add_argument("--bucket", choices=sorted(BUCKET_PATTERNS), default="minute", help="Time bucket size.")
+    parser.add_argument("--workers", type=int, help="Processes used to scan files in parallel (default: CPU count).")
+    parser.add_argument("--top", type=int, default=10, help="Rows shown per breakdown.")
+    parser.add_argument("--examples", type=int, default=10, help="Matching lines kept per category.")
+    args = parser.parse_args(argv)
+
+    paths = [path if path.is_absolute() else ROOT / path for path in args.paths] \
+        or find_log_files(config.LOG_FILE, include_rotated=not args.no_rotated)
+    missing = [path for path in paths if not path.exists()]
+    if missing or not paths:
+        logger.error(f"Log file(s) not found: {', '.join(map(str, missing)) or config.LOG_FILE}")
+        return 1
+
+    result = analyze_files(paths, bucket=args.bucket, max_examples=args.examples, workers=args.workers)
+    report(result, args.top)
+    return 1 if result.error_count else 0
+
+
+if __name__ == "__main__":
+    setup_logging(debug_mode=config.DEBUG_MODE)
+    sys.exit(main())
@@ -0,0 +1,355 @@
+#!/usr/bin/env python
+"""
+Incremental SQLite index over the loguru text logs (logs/jennai.log and its rotated archives).
+
+Every log record (a header line plus any continuation lines such as tracebacks)
+is stored once with its file, byte offset and length, minute bucket, level,
+module and `[Request ID: ...]` (written by LoggingAIDecorator). Queries by
+request id, time range, level or module then read only the matching byte
+ranges instead of rescanning gigabytes of logs.
+
+Each run indexes only the bytes appended since the previous run. A file that
+shrank or whose first line changed (loguru rotated it) is re-indexed from the
+start; rotated `.zip` archives are indexed once.
+
+Examples:
+    python admin/log_index.py                          # update the index
+    python admin/log_index.py --request-id 1f3a...     # update, then query
+    python admin/log_index.py --level ERROR --since 2025-07-25T10:00 --until "2025-07-25 12:30"
+"""
+import argparse
+import hashlib
+import re
+import sqlite3
+import sys
+import zipfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+# --- Root Project Path Setup ---
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+ADMIN_DIR = Path(__file__).resolve().parent # Sibling admin scripts are imported directly, as in 42.py
+if str(ADMIN_DIR) not in sys.path:
+    sys.path.insert(0, str(ADMIN_DIR))
+
+from config import config
+from config.loguru_setup import setup_logging, logger
+from log_analyzer import CHUNK_SIZE, find_log_files
+
+# loguru's built-in severities, used for "this level and above" queries
+LEVEL_NUMBERS = {"TRACE": 5, "DEBUG": 10, "INFO": 20, "SUCCESS": 25, "WARNING": 30, "ERROR": 40, "CRITICAL": 50}
+
+_RECORD = re.compile(rb"^(\d{4}-\d\d-\d\d)[T ](\d\d:\d\d)\S* \| ([A-Z]+) *\| ([^:| ]+):", re.MULTILINE)
+_REQUEST_ID = re.compile(rb"\[Request ID: ([^\]\s]+)\]")
+_SIGNATURE_BYTES = 256 # Hash of (at most) this much of the first line identifies a file across rotations
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    path TEXT NOT NULL UNIQUE,      -- file path, or "archive.zip!member" for rotated archives
+    signature TEXT,
+    indexed_bytes INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS records (
+    file_id INTEGER NOT NULL,
+    offset INTEGER NOT NULL,
+    length INTEGER NOT NULL,
+    minute TEXT NOT NULL,           -- "YYYY-MM-DDTHH:MM"
+    level_no INTEGER NOT NULL,
+    module TEXT NOT NULL,
+    request_id TEXT,
+    FOREIGN KEY (file_id) REFERENCES files(id)
+);
+CREATE INDEX IF NOT EXISTS idx_records_request ON records (request_id) WHERE request_id IS NOT NULL;
+CREATE INDEX IF NOT EXISTS idx_records_minute ON records (minute, level_no);
+CREATE INDEX IF NOT EXISTS idx_records_file ON records (file_id, offset);
+"""
+
+
+@dataclass
+class LogRecord:
+    path: str
+    offset: int
+    minute: str
+    level: str
+    module: str
+    request_id: Optional[str]
+    text: str
+
+
+def _minute_bound(value: Optional[str]) -> Optional[str]:
+    """Normalizes "2025-07-25 10:00[:ss]" / "2025-07-25T10:00" / "2025-07-25" to the index's minute format."""
+    if value is None:
+        return None
+    return value.strip().replace(" ", "T")[:16]
+
+
+def _level_name(level_no: int) -> str:
+    for name, number in LEVEL_NUMBERS.items():
+        if number == level_no:
+            return name
+    return str(level_no)
+
+
+class LogIndex:
+    """SQLite index of log records; see the module docstring."""
+
+    def __init__(self, db_path: Path = config.LOG_INDEX_PATH):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(self.db_path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=OFF") # The index can always be rebuilt from the logs
+        self.conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    # ------------------------------------------------------------------
+    # Indexing
+    # ------------------------------------------------------------------
+    def update(self, paths: Sequence[Path]) -> int:
+        """Indexes new bytes in each file (and each member of .zip archives). Returns the records added."""
+        self._prune()
+        added = 0
+        for path in paths:
+            path = Path(path)
+            if path.suffix == ".zip":
+                with zipfile.ZipFile(path) as archive:
+                    for member in archive.infolist():
+                        if member.is_dir():
+                            continue
+                        key = f"{path}!{member.filename}"
+                        if self._file_row(key) is None: # Archives never change: index each member once
+                            with archive.open(member) as stream:
+                                added += self._index_stream(key, stream, None, 0)
+            else:
+                added += self._index_plain_file(path)
+        return added
+
+    def _prune(self) -> None:
+        """Drops files that no longer exist (e.g. archives removed by loguru's retention)."""
+        with self.conn:
+            for (key,) in self.conn.execute("SELECT path FROM files").fetchall():
+                if not Path(key.split("!", 1)[0]).exists():
+                    self._forget(key)
+
+    def _file_row(self, key: str) -> Optional[Tuple[int, str, int]]:
+        return self.conn.execute("SELECT id, signature, indexed_bytes FROM files WHERE path = ?", (key,)).fetchone()
+
+    def _index_plain_file(self, path: Path) -> int:
+        with open(path, "rb") as stream:
+            # The first line never changes while loguru appends, but differs after rotation.
+            signature = hashlib.blake2b(stream.readline(_SIGNATURE_BYTES), digest_size=16).hexdigest()
+            size = path.stat().st_size
+            row = self._file_row(str(path))
+            start = 0
+            if row is not None:
+                _, known_signature, indexed_bytes = row
+                if known_signature == signature and indexed_bytes <= size:
+                    start = indexed_bytes
+                else:
+                    logger.info(f"{path.name} was rotated or truncated; re-indexing it.")
+                    self._forget(str(path))
+            stream.seek(start)
+            return self._index_stream(str(path), stream, signature, start)
+
+    def _forget(self, key: str) -> None:
+        row = self._file_row(key)
+        if row is not None:
+            self.conn.execute("DELETE FROM records WHERE file_id = ?", (row[0],))
+            self.conn.execute("DELETE FROM files WHERE id = ?", (row[0],))
+
+    def _index_stream(self, key: str, stream, signature: Optional[str], start: int) -> int:
+        """
+        Indexes complete lines from `start`. A trailing partial line is left for the
+        next run. Bytes that precede the first header (continuation lines of the last
+        record from the previous run) extend that record.
+        """
+        with self.conn: # One transaction per file
+            row = self._file_row(key)
+            if row is None:
+                file_id = self.conn.execute(
+                    "INSERT INTO files (path, signature, indexed_bytes) VALUES (?, ?, ?)", (key, signature, start)
+                ).lastrowid
+            else:
+                file_id = row[0]
+
+            pending: Optional[list] = None # [offset, minute, level_no, module, request_id] of the open record
+            position = start              # Absolute offset of the start of `buffer`
+            buffer = b""
+            batch: List[tuple] = []
+            added = 0
+            while True:
+                block = stream.read(CHUNK_SIZE)
+                if not block:
+                    break
+                buffer += block
+                cut = buffer.rfind(b"\n") + 1
+                if cut == 0:
+                    continue
+                chunk, buffer = buffer[:cut], buffer[cut:]
+                for match in _RECORD.finditer(chunk):
+                    offset = position + match.start()
+                    if pending is None and offset > start: # Continuation lines of the previous run's last record
+                        self._extend_last_record(file_id, offset - start)
+                    if pending is not None:
+                        batch.append((file_id, pending[0], offset - pending[0], *pending[1:]))
+                    line_end = chunk.find(b"\n", match.end())
+                    request = _REQUEST_ID.search(chunk, match.end(), line_end)
+                    pending = [
+                        offset,
+                        f"{match.group(1).decode('ascii')}T{match.group(2).decode('ascii')}",
+                        LEVEL_NUMBERS.get(match.group(3).decode("ascii"), 0),
+                        match.group(4).decode("utf-8", "replace"),
+                        request.group(1).decode("utf-8", "replace") if request else None,
+                    ]
+                    added += 1
+                position += len(chunk)
+                if len(batch) >= 10000:
+                    self._insert(batch)
+                    batch = []
+
+            if pending is not None:
+                batch.append((file_id, pending[0], position - pending[0], *pending[1:]))
+            elif position > start:
+                self._extend_last_record(file_id, position - start)
+            self._insert(batch)
+            self.conn.execute("UPDATE files SET indexed_bytes = ?, signature = COALESCE(?, signature) WHERE id = ?",
+                              (position, signature, file_id))
+        return added
+
+    def _insert(self, batch: List[tuple]) -> None:
+        if batch:
+            self.conn.executemany(
+                "INSERT INTO records (file_id, offset, length, minute, level_no, module, request_id) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                batch,
+            )
+
+    def _extend_last_record(self, file_id: int, extra_bytes: int) -> None:
+        self.conn.execute(
+            "UPDATE records SET length = length + ? WHERE file_id = ? AND offset = (SELECT MAX(offset) FROM records WHERE file_id = ?)",
+            (extra_bytes, file_id, file_id),
+        )
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+    def query(self, request_id: Optional[str] = None, since: Optional[str] = None, until: Optional[str] = None,
+              level: Optional[str] = None, module: Optional[str] = None, limit: Optional[int] = None) -> Iterator[LogRecord]:
+        """
+        Yields matching records in time order, reading only their byte ranges.
+
+        Args:
+            request_id: Exact request id.
+            since, until: Inclusive minute bounds ("2025-07-25T10:00" or "2025-07-25 10:00").
+            level: Minimum level name (e.g. "ERROR" also returns CRITICAL).
+            module: Module name or dotted prefix (e.g. "src.data").
+        """
+        clauses, params = [], []
+        if request_id:
+            clauses.append("r.request_id = ?")
+            params.append(request_id)
+        if since:
+            clauses.append("r.minute >= ?")
+            params.append(_minute_bound(since))
+        if until:
+            clauses.append("r.minute <= ?")
+            params.append(_minute_bound(until))
+        if level:
+            level = level.upper()
+            if level not in LEVEL_NUMBERS:
+                raise ValueError(f"Unknown level '{level}'. Allowed: {list(LEVEL_NUMBERS)}")
+            clauses.append("r.level_no >= ?")
+            params.append(LEVEL_NUMBERS[level])
+        if module:
+            clauses.append("(r.module = ? OR r.module LIKE ? ESCAPE '\\')")
+            params.extend([module, module.replace("_", "\\_").replace("%", "\\%") + ".%"])
+        sql = ("SELECT f.path, r.offset, r.length, r.minute, r.level_no, r.module, r.request_id "
+               "FROM records r JOIN files f ON f.id = r.file_id")
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY r.minute, f.path, r.offset"
+        if limit:
+            sql += f" LIMIT {int(limit)}"
+
+        readers: Dict[str, "_RangeReader"] = {}
+        try:
+            for path, offset, length, minute, level_no, module_name, rid in self.conn.execute(sql, params).fetchall():
+                reader = readers.get(path)
+                if reader is None:
+                    reader = readers[path] = _RangeReader(path)
+                text = reader.read(offset, length).decode("utf-8", "replace").rstrip("\n")
+                yield LogRecord(path, offset, minute, _level_name(level_no), module_name, rid, text)
+        finally:
+            for reader in readers.values():
+                reader.close()
+
+
+class _RangeReader:
+    """Reads byte ranges from a log file, or from a member of a rotated .zip archive."""
+
+    def __init__(self, key: str):
+        self._data: Optional[bytes] = None
+        self._file = None
+        if "!" in key and key.split("!", 1)[0].endswith(".zip"):
+            archive_path, member = key.split("!", 1)
+            with zipfile.ZipFile(archive_path) as archive:
+                self._data = archive.read(member) # Compressed streams cannot seek; decompress once per query
+        else:
+            self._file = open(key, "rb")
+
+    def read(self, offset: int, length: int) -> bytes:
+        if self._data is not None:
+            return self._data[offset:offset + length]
+        self._file.seek(offset)
+        return self._file.read(length)
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+
+
+def update_index(log_file: Path = config.LOG_FILE, db_path: Path = config.LOG_INDEX_PATH) -> LogIndex:
+    """Opens the index and brings it up to date with `log_file` and its rotated archives."""
+    index = LogIndex(db_path)
+    added = index.update(find_log_files(log_file))
+    logger.debug(f"Log index updated: {added} new records.")
+    return index
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Update and query the SQLite index over the log files.")
+    parser.add_argument("log_file", nargs="?", type=Path, default=config.LOG_FILE, help="Log file (its rotated archives are included).")
+    parser.add_argument("--request-id", help="Show every record for this request id.")
+    parser.add_argument("--since", help="Start minute, inclusive (e.g. 2025-07-25T10:00).")
+    parser.add_argument("--until", help="End minute, inclusive.")
+    parser.add_argument("--level", help="Minimum level (e.g. WARNING, ERROR).")
+    parser.add_argument("--module", help="Module name or dotted prefix.")
+    parser.add_argument("--limit", type=int, help="Maximum records to show.")
+    args = parser.parse_args(argv)
+
+    log_file = args.log_file if args.log_file.is_absolute() else ROOT / args.log_file
+    with update_index(log_file) as index:
+        if not any((args.request_id, args.since, args.until, args.level, args.module)):
+            return 0
+        count = 0
+        for record in index.query(args.request_id, args.since, args.until, args.level, args.module, args.limit):
+            print(record.text)
+            count += 1
+        logger.info(f"{count} matching record(s).")
+    return 0
+
+
+if __name__ == "__main__":
+    setup_logging(debug_mode=config.DEBUG_MODE)
+    sys.exit(main())
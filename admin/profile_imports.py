@@ -0,0 +1,155 @@
+#!/usr/bin/env python
+"""
+Startup import-time profiler.
+
+Runs `python -X importtime` on one or more targets in fresh subprocesses,
+aggregates the per-module import cost by top-level package, and optionally
+saves the result as a baseline or diffs it against a previous baseline.
+
+Examples:
+    python admin/profile_imports.py                              # default targets
+    python admin/profile_imports.py main admin/42.py --repeat 5
+    python admin/profile_imports.py --save-baseline
+    python admin/profile_imports.py --baseline logs/importtime/baseline.json
+"""
+import argparse
+import json
+import subprocess
+import sys
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# --- Root Project Path Setup ---
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from config import config
+from config.loguru_setup import setup_logging, logger
+
+DEFAULT_TARGETS = ["main", "core.bootstrap", "admin/42.py", "src/presentation/api_server/flask_app/app.py"]
+DEFAULT_BASELINE = config.IMPORT_PROFILE_DIR / "baseline.json"
+
+
+def _import_statement(target: str) -> str:
+    """Python source that imports a module name or a script path without running its __main__ block."""
+    if target.endswith(".py"):
+        path = (ROOT / target).resolve()
+        return (
+            f"import sys, importlib; sys.path.insert(0, {str(ROOT)!r}); sys.path.insert(0, {str(path.parent)!r}); "
+            f"importlib.import_module({path.stem!r})"
+        )
+    return f"import sys, importlib; sys.path.insert(0, {str(ROOT)!r}); importlib.import_module({target!r})"
+
+
+def parse_importtime(stderr: str) -> Dict[str, Dict[str, int]]:
+    """
+    Parses `-X importtime` output into {module: {"self_us": ..., "cumulative_us": ..., "depth": ...}}.
+    """
+    modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        try:
+            self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        except ValueError:
+            continue
+        depth = (len(name) - len(name.lstrip(" ")) - 1) // 2 # One separator space, then two per nesting level
+        modules[name.strip()] = {"self_us": int(self_us), "cumulative_us": int(cumulative_us), "depth": depth}
+    return modules
+
+
+def profile_target(target: str, repeat: int = 3) -> Dict[str, object]:
+    """
+    Imports `target` in `repeat` fresh interpreters and keeps, per module, the
+    fastest observation (the least noisy estimate of the real cost).
+    """
+    best: Dict[str, Dict[str, int]] = {}
+    for _ in range(repeat):
+        process = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", _import_statement(target)],
+            capture_output=True, text=True, cwd=ROOT,
+        )
+        if process.returncode != 0:
+            raise RuntimeError(f"Importing {target} failed:\n{process.stderr[-2000:]}")
+        for name, stats in parse_importtime(process.stderr).items():
+            if name not in best or stats["self_us"] < best[name]["self_us"]:
+                best[name] = stats
+
+    packages: Dict[str, int] = defaultdict(int)
+    for name, stats in best.items():
+        packages[name.split(".")[0]] += stats["self_us"]
+
+    return {
+        "target": target,
+        "total_us": sum(stats["self_us"] for stats in best.values()),
+        "module_count": len(best),
+        "packages": dict(sorted(packages.items(), key=lambda item: item[1], reverse=True)),
+        "modules": best,
+    }
+
+
+def diff_profiles(current: Dict[str, object], baseline: Dict[str, object]) -> List[Dict[str, object]]:
+    """Per-package self-time change (current - baseline), largest absolute change first."""
+    names = set(current["packages"]) | set(baseline["packages"])
+    rows = []
+    for name in names:
+        before = baseline["packages"].get(name, 0)
+        after = current["packages"].get(name, 0)
+        if before != after:
+            rows.append({"package": name, "baseline_us": before, "current_us": after, "delta_us": after - before})
+    return sorted(rows, key=lambda row: abs(row["delta_us"]), reverse=True)
+
+
+def _report(profile: Dict[str, object], top: int) -> None:
+    logger.info(f"=== {profile['target']}: {profile['total_us'] / 1000:.1f} ms across {profile['module_count']} modules ===")
+    for name, self_us in list(profile["packages"].items())[:top]:
+        logger.info(f"  {self_us / 1000:>8.1f} ms  {name}")
+
+
+def _report_diff(target: str, rows: List[Dict[str, object]], current_total: int, baseline_total: int, top: int) -> None:
+    delta = current_total - baseline_total
+    logger.info(f"--- {target} vs baseline: {baseline_total / 1000:.1f} ms -> {current_total / 1000:.1f} ms ({delta / 1000:+.1f} ms)")
+    for row in rows[:top]:
+        logger.info(f"  {row['delta_us'] / 1000:>+8.1f} ms  {row['package']}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Profile startup import time (python -X importtime) per package.")
+    parser.add_argument("targets", nargs="*", default=DEFAULT_TARGETS, help="Module names or script paths (relative to the project root).")
+    parser.add_argument("--repeat", type=int, default=3, help="Fresh interpreter runs per target; the fastest sample per module is kept.")
+    parser.add_argument("--top", type=int, default=15, help="Number of packages to show.")
+    parser.add_argument("--baseline", type=Path, help="Baseline JSON to diff against.")
+    parser.add_argument("--save-baseline", nargs="?", const=DEFAULT_BASELINE, type=Path, metavar="PATH",
+                        help=f"Save results as a baseline (default: {DEFAULT_BASELINE.relative_to(ROOT)}).")
+    args = parser.parse_args(argv)
+
+    results = {}
+    for target in args.targets:
+        try:
+            results[target] = profile_target(target, args.repeat)
+        except RuntimeError as e:
+            logger.error(str(e))
+            return 1
+        _report(results[target], args.top)
+
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        for target, profile in results.items():
+            if target not in baseline:
+                logger.warning(f"No baseline recorded for {target}.")
+                continue
+            rows = diff_profiles(profile, baseline[target])
+            _report_diff(target, rows, profile["total_us"], baseline[target]["total_us"], args.top)
+
+    if args.save_baseline:
+        args.save_baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.save_baseline.write_text(json.dumps(results, indent=2), encoding="utf-8")
+        logger.success(f"Baseline saved to {args.save_baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    setup_logging(debug_mode=config.DEBUG_MODE)
+    sys.exit(main())
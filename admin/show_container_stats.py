@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+"""
+Shows what the DependencyContainer builds during bootstrap and how long each
+registration takes to construct, slowest first.
+
+Examples:
+    python admin/show_container_stats.py
+    python admin/show_container_stats.py --top 5 --no-resolve
+    python admin/show_container_stats.py --graph dot --output logs/container.dot
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import List, Optional
+
+from rich.console import Console
+from rich.table import Table
+
+# --- Root Project Path Setup ---
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from config import config
+from config.loguru_setup import setup_logging, logger
+
+
+def show_container_stats(top: int = 10, resolve_all: bool = True, graph_format: Optional[str] = None,
+                         output: Optional[Path] = None, console: Optional[Console] = None) -> int:
+    """
+    Bootstraps the container, optionally resolves every registration (so lazy
+    singletons are actually built), and prints the slowest registrations.
+    """
+    from core.bootstrap import get_configured_container # Timed below, so imported here
+
+    console = console or Console()
+    started = time.perf_counter()
+    container = get_configured_container()
+    bootstrap_ms = (time.perf_counter() - started) * 1000
+
+    if resolve_all:
+        for interface in container.registered_interfaces():
+            try:
+                container.resolve(interface)
+            except Exception as e: # Scoped services and broken registrations are reported, not fatal
+                logger.warning(f"Could not resolve {interface}: {e}")
+
+    stats = container.get_resolution_stats()
+    table = Table(title=f"[bold]Container registrations[/bold] (bootstrap {bootstrap_ms:.1f} ms)",
+                  show_header=True, header_style="bold magenta")
+    table.add_column("Registration", style="cyan")
+    table.add_column("Lifetime", style="green")
+    table.add_column("Resolves", justify="right")
+    table.add_column("Builds", justify="right")
+    table.add_column("Total ms", justify="right", style="bold")
+    table.add_column("Self ms", justify="right")
+    table.add_column("Max ms", justify="right")
+    table.add_column("Dependencies", style="dim")
+    for item in stats[:top]:
+        table.add_row(
+            item["name"], item["lifetime"], str(item["resolve_count"]), str(item["construct_count"]),
+            f"{item['construct_total_ms']:.2f}", f"{item['construct_self_ms']:.2f}", f"{item['construct_max_ms']:.2f}",
+            ", ".join(name.rsplit(".", 1)[-1] for name in item["dependencies"]) or "-",
+        )
+    console.print(table)
+
+    if graph_format:
+        graph = container.export_graph(graph_format)
+        if output:
+            output.parent.mkdir(parents=True, exist_ok=True)
+            output.write_text(graph, encoding="utf-8")
+            logger.success(f"Dependency graph ({graph_format}) written to {output}")
+        else:
+            console.print(graph, markup=False, highlight=False)
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Show DependencyContainer construction times and dependency graph.")
+    parser.add_argument("--top", type=int, default=10, help="Number of registrations to show.")
+    parser.add_argument("--no-resolve", action="store_true",
+                        help="Only bootstrap; do not resolve registrations (lazy singletons stay unbuilt).")
+    parser.add_argument("--graph", choices=("json", "dot"), help="Also export the dependency graph in this format.")
+    parser.add_argument("--output", type=Path, help="Write the graph to this file instead of the console.")
+    args = parser.parse_args(argv)
+    return show_container_stats(top=args.top, resolve_all=not args.no_resolve,
+                                graph_format=args.graph, output=args.output)
+
+
+if __name__ == "__main__":
+    setup_logging(debug_mode=config.DEBUG_MODE)
+    sys.exit(main())
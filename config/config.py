@@ -43,6 +43,22 @@ SAMPLE_DATA_DIR   = DATA_DIR / "samples" # Renamed for clarity
 # 3. LOGGING
 # ============================================================================
 LOG_FILE = LOGS_DIR / "jennai.log"
+IMPORT_PROFILE_DIR = LOGS_DIR / "importtime" # Baselines written by admin/profile_imports.py
+
+# Logging profile used by config/loguru_setup.setup_logging():
+#   development - colorized synchronous console, text file with diagnose=True
+#   production  - enqueued (non-blocking) console, JSON-lines file, diagnose off, sampled DEBUG
+LOG_PROFILES = ["development", "production"]
+LOG_PROFILE = os.getenv("LOG_PROFILE", "development").lower()
+LOG_JSON_FILE = LOGS_DIR / "jennai.jsonl"
+LOG_INDEX_PATH = LOGS_DIR / "log_index.sqlite" # Incremental index used by admin/log_index.py and check_logs queries
+LOG_DEBUG_SAMPLE_RATE = float(os.getenv("LOG_DEBUG_SAMPLE_RATE", "0.1"))    # production: fraction of DEBUG/TRACE records kept per logger
+LOG_DEBUG_RATE_LIMIT_PER_S = float(os.getenv("LOG_DEBUG_RATE_LIMIT_PER_S", "50"))  # production: max DEBUG/TRACE records per second per logger (0 = unlimited)
+# Per-logger overrides of the sample rate, as "module.prefix=rate" pairs, e.g. "core.logging_decorator=0.01,src.data=1"
+LOG_DEBUG_SAMPLE_RATES = {
+    name.strip(): float(rate)
+    for name, _, rate in (item.partition("=") for item in os.getenv("LOG_DEBUG_SAMPLE_RATES", "").split(",") if "=" in item)
+}
 
 # ============================================================================
 # 4. DATABASE CONFIGURATION
@@ -197,6 +213,193 @@ class ArchitecturalPersona(Enum):
 
 # Maintain backward compatibility
 ROLES_PRESENTATION = list(ARCHITECTURAL_PERSONAS.keys())
+
+# ============================================================================
+# 13. VECTOR SEARCH (APPROXIMATE NEAREST NEIGHBOUR INDEX)
+# ============================================================================
+# Defaults for the in-project IVF index over IAIInterface.embed_text vectors.
+# ANN_N_PROBE is the recall/latency knob: more probed lists -> higher recall, slower queries.
+ANN_INDEX_DIR     = DATA_DIR / "vector_index"
+ANN_N_LISTS       = int(os.getenv("ANN_N_LISTS", "0"))  # 0 = derive from dataset size (~4 * sqrt(N))
+ANN_N_PROBE       = int(os.getenv("ANN_N_PROBE", "8"))
+ANN_TRAIN_SAMPLE  = int(os.getenv("ANN_TRAIN_SAMPLE", "100000"))  # Max vectors used to train the coarse quantizer
+
+# ============================================================================
+# 14. AI PROVIDER SELECTION
+# ============================================================================
+# Which IAIInterface implementation DependencyContainer registers.
+#   "gemini" - GeminiAPIService (requires GEMINI_API_KEY for live calls)
+#   "stub"   - LocalStubAIService, an offline provider for load tests and benchmarks
+# A comma-separated list (e.g. "gemini,stub") registers a RoutingAIService that
+# routes across all listed providers with health tracking, failover and hedging.
+AI_PROVIDERS = ["gemini", "stub"]
+AI_PROVIDER = os.getenv("AI_PROVIDER", "gemini").lower()
+
+# RoutingAIService settings (only used when AI_PROVIDER lists several providers).
+AI_ROUTING_POLICY            = os.getenv("AI_ROUTING_POLICY", "latency")  # latency | cost | balanced
+AI_ROUTING_HEDGE_AFTER_MS    = float(os.getenv("AI_ROUTING_HEDGE_AFTER_MS", "0"))  # 0 disables hedged requests
+AI_ROUTING_EWMA_ALPHA        = float(os.getenv("AI_ROUTING_EWMA_ALPHA", "0.2"))
+AI_ROUTING_FAILURE_THRESHOLD = int(os.getenv("AI_ROUTING_FAILURE_THRESHOLD", "3"))  # Consecutive failures before a backend is benched
+AI_ROUTING_COOLDOWN_S        = float(os.getenv("AI_ROUTING_COOLDOWN_S", "30"))
+AI_PROVIDER_COSTS = {  # Relative cost per call
+    "gemini": 1.0,
+    "stub": 0.0,
+}
+
+# LocalStubAIService behaviour. Latencies are in milliseconds.
+STUB_AI_LATENCY_DISTRIBUTION = os.getenv("STUB_AI_LATENCY_DISTRIBUTION", "lognormal")  # constant | uniform | normal | lognormal | exponential
+STUB_AI_LATENCY_MS           = float(os.getenv("STUB_AI_LATENCY_MS", "120"))    # Mean base latency per call
+STUB_AI_LATENCY_JITTER_MS    = float(os.getenv("STUB_AI_LATENCY_JITTER_MS", "40"))  # Spread (std dev / half-width) of the base latency
+STUB_AI_MS_PER_TOKEN         = float(os.getenv("STUB_AI_MS_PER_TOKEN", "2"))    # Added per input + output token
+STUB_AI_ERROR_RATE           = float(os.getenv("STUB_AI_ERROR_RATE", "0.0"))    # Probability that a call raises
+STUB_AI_EMBEDDING_DIM        = int(os.getenv("STUB_AI_EMBEDDING_DIM", "768"))
+STUB_AI_SEED                 = int(os.getenv("STUB_AI_SEED", "42"))
+
+# ============================================================================
+# 15. TRACING
+# ============================================================================
+# core/tracing.py keeps finished spans in an in-memory ring buffer and exports
+# them as Chrome trace JSON (open in chrome://tracing or https://ui.perfetto.dev).
+TRACING_ENABLED   = os.getenv("TRACING_ENABLED", "True").lower() in ('true', '1', 't')
+TRACE_BUFFER_SIZE = int(os.getenv("TRACE_BUFFER_SIZE", "10000"))  # Most recent finished spans kept for export
+TRACE_DIR         = LOGS_DIR / "traces"
+
+# ============================================================================
+# 16. METRICS
+# ============================================================================
+# core/metrics.py keeps counters, gauges and histograms in process; the Flask
+# app serves them at /metrics in the Prometheus text format.
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "True").lower() in ('true', '1', 't')  # Serve /metrics
+METRICS_LATENCY_BUCKETS = (  # Histogram upper bounds in seconds (+Inf is implicit)
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+
+# ============================================================================
+# 17. SAMPLING PROFILER
+# ============================================================================
+# core/sampling_profiler.py samples every thread's stack while switched on and
+# writes collapsed stacks for flame graphs. Off by default; start it with
+# `python admin/42.py --profile` or POST /admin/profiler/start.
+PROFILER_INTERVAL_MS = float(os.getenv("PROFILER_INTERVAL_MS", "10"))  # 10 ms = 100 samples/s
+PROFILER_MAX_DEPTH   = int(os.getenv("PROFILER_MAX_DEPTH", "128"))     # Deeper stacks are truncated at the root end
+PROFILE_DIR          = LOGS_DIR / "profiles"
+
+# Token required (X-Admin-Token header) by the /admin endpoints. Unset disables them.
+ADMIN_API_TOKEN = os.getenv("ADMIN_API_TOKEN", "")
+
+# ============================================================================
+# 18. SCORING API
+# ============================================================================
+# /api/scores serves precomputed rows from sourcing_scores while they are fresh:
+# computed from the current data version (bumped by seeding) and younger than
+# SCORES_MAX_AGE_S. ETags carry the data version, so polling clients get 304s.
+SCORES_MAX_AGE_S = float(os.getenv("SCORES_MAX_AGE_S", "3600"))
+SCORES_TOP_MAX_K = int(os.getenv("SCORES_TOP_MAX_K", "100"))  # Upper bound for /api/scores/top?k=
+
+# ============================================================================
+# 19. API SERIALIZATION & COMPRESSION
+# ============================================================================
+API_JSON_BACKEND      = os.getenv("API_JSON_BACKEND", "auto").lower()  # auto (orjson if installed) | orjson | json
+COMPRESSION_MIN_BYTES = int(os.getenv("COMPRESSION_MIN_BYTES", "1024"))  # Smaller responses are sent uncompressed
+GZIP_LEVEL            = int(os.getenv("GZIP_LEVEL", "6"))
+BROTLI_QUALITY        = int(os.getenv("BROTLI_QUALITY", "5"))  # 0-11; 4-6 is the usual speed/size balance for dynamic responses
+
+# ============================================================================
+# 20. BRAND ASSET PIPELINE
+# ============================================================================
+# admin/build_brand_assets.py turns the Flask app's brand images into
+# content-hashed, resized and WebP variants plus a manifest; the app serves
+# them from /assets with long-lived immutable caching.
+API_BRAND_DIR        = PRESENTATION_DIR / "api_server" / "brand"  # Source images
+BRAND_BUILD_DIR      = PRESENTATION_DIR / "api_server" / "flask_app" / "static" / "brand"  # Build output (generated)
+BRAND_MANIFEST_PATH  = BRAND_BUILD_DIR / "manifest.json"
+BRAND_ASSET_WIDTHS   = (480, 960, 1920)  # Resized variants narrower than the original are generated
+BRAND_WEBP_QUALITY   = int(os.getenv("BRAND_WEBP_QUALITY", "80"))
+BRAND_JPEG_QUALITY   = int(os.getenv("BRAND_JPEG_QUALITY", "82"))
+ASSET_MAX_AGE_S      = 31536000  # One year: hashed file names never change content
+ASSET_SOURCE_MAX_AGE_S = 300     # Unbuilt originals served while no manifest exists
+
+# ============================================================================
+# 21. TEMPLATES
+# ============================================================================
+TEMPLATE_PRECOMPILE        = os.getenv("TEMPLATE_PRECOMPILE", "True").lower() in ('true', '1', 't')  # Compile all templates in create_app()
+_template_bytecode_dir     = os.getenv("TEMPLATE_BYTECODE_DIR", str(ROOT / ".cache" / "jinja"))
+TEMPLATE_BYTECODE_DIR      = Path(_template_bytecode_dir) if _template_bytecode_dir else None  # Compiled templates reused across restarts; empty disables
+FRAGMENT_CACHE_MAX_ENTRIES = int(os.getenv("FRAGMENT_CACHE_MAX_ENTRIES", "256"))
+FRAGMENT_CACHE_TTL_S       = float(os.getenv("FRAGMENT_CACHE_TTL_S", "300"))  # Backstop; fragments are keyed on the data version
+
+# ============================================================================
+# 22. PRODUCTION SERVER
+# ============================================================================
+# `python main.py serve` runs the API under gunicorn (preloaded app, gthread
+# workers) or, where gunicorn is unavailable (Windows), waitress.
+SERVER_BACKEND            = os.getenv("SERVER_BACKEND", "auto").lower()  # auto | gunicorn | waitress
+SERVER_BIND               = os.getenv("SERVER_BIND", "127.0.0.1:8000")
+SERVER_WORKERS            = int(os.getenv("SERVER_WORKERS", "0"))   # 0: 2 x cores + 1, capped at SERVER_MAX_WORKERS
+SERVER_MAX_WORKERS        = int(os.getenv("SERVER_MAX_WORKERS", "16"))
+SERVER_THREADS            = int(os.getenv("SERVER_THREADS", "4"))   # Per worker: a slow scoring call ties up one thread, not the worker
+SERVER_KEEPALIVE_S        = int(os.getenv("SERVER_KEEPALIVE_S", "5"))  # Raise above the load balancer's idle timeout when not behind nginx
+SERVER_TIMEOUT_S          = int(os.getenv("SERVER_TIMEOUT_S", "60"))   # Silent workers are killed and replaced after this
+SERVER_GRACEFUL_TIMEOUT_S = int(os.getenv("SERVER_GRACEFUL_TIMEOUT_S", "30"))  # In-flight requests get this long on reload/shutdown
+SERVER_MAX_REQUESTS       = int(os.getenv("SERVER_MAX_REQUESTS", "5000"))  # Recycle workers to bound memory growth (0 disables)
+SERVER_MAX_REQUESTS_JITTER = int(os.getenv("SERVER_MAX_REQUESTS_JITTER", "500"))
+SERVER_PID_FILE           = LOGS_DIR / "jennai-server.pid"  # `python main.py reload` sends SIGHUP to this pid
+
+# ============================================================================
+# 23. SCORE CHANGE EVENTS
+# ============================================================================
+# /api/scores/stream pushes sourcing_scores deltas as server-sent events.
+SCORE_EVENTS_QUEUE_SIZE      = int(os.getenv("SCORE_EVENTS_QUEUE_SIZE", "64"))    # Per subscriber; overflow sends a resync instead
+SCORE_EVENTS_HISTORY         = int(os.getenv("SCORE_EVENTS_HISTORY", "256"))      # Events kept for Last-Event-ID replay
+SCORE_EVENTS_POLL_S          = float(os.getenv("SCORE_EVENTS_POLL_S", "1.0"))     # Watcher poll for runs committed by other processes
+SCORE_EVENTS_HEARTBEAT_S     = float(os.getenv("SCORE_EVENTS_HEARTBEAT_S", "15")) # Comment line keeping idle proxies from closing the stream
+SCORE_EVENTS_MAX_STREAM_S    = float(os.getenv("SCORE_EVENTS_MAX_STREAM_S", "300")) # Streams end after this; clients reconnect with Last-Event-ID
+# Per process. Each open stream holds one of the worker's SERVER_THREADS for up to
+# SCORE_EVENTS_MAX_STREAM_S, so at most SERVER_THREADS - 1 are allowed: one thread
+# always stays free for /healthz and the score endpoints.
+SCORE_EVENTS_MAX_SUBSCRIBERS = max(0, min(int(os.getenv("SCORE_EVENTS_MAX_SUBSCRIBERS", str(SERVER_THREADS - 1))),
+                                          SERVER_THREADS - 1))
+
+# ============================================================================
+# 24. BULK EXPORT
+# ============================================================================
+# /api/export/<dataset>.<csv|parquet> and admin/export_data.py
+EXPORT_DIR                    = ROOT / "exports"  # Default output directory of admin/export_data.py
+EXPORT_CHUNK_ROWS             = int(os.getenv("EXPORT_CHUNK_ROWS", "5000"))        # Rows per keyset query (and per streamed CSV block)
+EXPORT_MAX_CHUNK_ROWS         = int(os.getenv("EXPORT_MAX_CHUNK_ROWS", "50000"))   # Upper bound for ?chunk_rows=
+EXPORT_PARQUET_ROW_GROUP_ROWS = int(os.getenv("EXPORT_PARQUET_ROW_GROUP_ROWS", "100000"))  # Rows buffered per Parquet row group
+
+# ============================================================================
+# 25. RESPONSE CACHE
+# ============================================================================
+# Full responses of @cache_response views, keyed on the data version (see flask_app/response_cache.py).
+RESPONSE_CACHE_BACKEND     = os.getenv("RESPONSE_CACHE_BACKEND", "memory").lower()  # memory | disk | off
+RESPONSE_CACHE_MAX_ENTRIES = int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", "2048"))    # Memory backend only
+RESPONSE_CACHE_MAX_BYTES   = int(os.getenv("RESPONSE_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+RESPONSE_CACHE_TTL_S       = float(os.getenv("RESPONSE_CACHE_TTL_S", "3600"))  # Backstop; new data changes the key anyway
+RESPONSE_CACHE_DIR         = ROOT / ".cache" / "responses"  # Disk backend; shared by the workers on one host
+
+# ============================================================================
+# 26. ADMISSION CONTROL
+# ============================================================================
+# Per-process gates for expensive endpoints (see flask_app/admission.py). Requests beyond
+# concurrency wait in a queue of `queue` for up to timeout_s, then get 503 + Retry-After.
+ADMISSION_ENABLED = os.getenv("ADMISSION_ENABLED", "True").lower() in ("true", "1", "yes")
+ADMISSION_LIMITS = {
+    "scores": {"concurrency": int(os.getenv("ADMISSION_SCORES_CONCURRENCY", "4")), "queue": 16, "timeout_s": 5.0},  # On-demand score_regions
+    "ai":     {"concurrency": int(os.getenv("ADMISSION_AI_CONCURRENCY", "4")), "queue": 8, "timeout_s": 10.0},
+    "export": {"concurrency": int(os.getenv("ADMISSION_EXPORT_CONCURRENCY", "2")), "queue": 0, "timeout_s": 0.0},   # Long streams: shed, never queue
+}
+
+# ============================================================================
+# 27. LOAD TESTING
+# ============================================================================
+# Defaults for admin/load_test.py
+LOAD_TEST_DIR          = LOGS_DIR / "loadtests"  # Results JSON, one file per run
+LOAD_TEST_CONCURRENCY  = int(os.getenv("LOAD_TEST_CONCURRENCY", "8"))
+LOAD_TEST_DURATION_S   = float(os.getenv("LOAD_TEST_DURATION_S", "10"))
+LOAD_TEST_WARMUP_S     = float(os.getenv("LOAD_TEST_WARMUP_S", "2"))
+
 # ============================================================================
 # END OF CONFIGURATION
 # ============================================================================
\ No newline at end of file
@@ -1,7 +1,10 @@
+import itertools
 import sys
+import threading
+import time
 from pathlib import Path
 from loguru import logger
-from typing import Optional
+from typing import Dict, Optional
 
 # --- Project Path Configuration ---
 # Ensure the config module can be found by other scripts.
@@ -17,10 +20,71 @@ except ImportError:
 # and allow for easy removal and re-adding of handlers.
 _handler_ids = {
     "file": None,
-    "console": None
+    "console": None,
+    "json": None
 }
 
-def setup_logging(debug_mode: bool = False, log_file_name: Optional[str] = None):
+CONSOLE_FORMAT = "<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>"
+FILE_FORMAT = "{time} | {level} | {name}:{function}:{line} | {message}"
+
+class DebugSampler:
+    """
+    Loguru filter that thins out hot-path DEBUG/TRACE records per logger (module name).
+
+    For each logger it keeps one record in every 1/sample_rate (deterministic
+    counting, not random), then applies a token-bucket rate limit of
+    `rate_limit_per_s` records per second. INFO and above always pass.
+    `overrides` maps module-name prefixes to their own sample rate; the longest
+    matching prefix wins.
+
+    The per-logger state is updated without locking: under contention a few
+    records more or fewer than the target may pass, which is fine for sampling.
+    """
+    def __init__(self, sample_rate: float = 1.0, rate_limit_per_s: float = 0.0,
+                 overrides: Optional[Dict[str, float]] = None, clock=time.monotonic):
+        self.sample_rate = sample_rate
+        self.rate_limit_per_s = rate_limit_per_s
+        self.overrides = dict(overrides or {})
+        self._clock = clock
+        self._counters: Dict[str, "itertools.count"] = {}
+        self._buckets: Dict[str, list] = {} # name -> [tokens, last refill time]
+        self._every: Dict[str, int] = {}    # name -> keep one record in N (0 = drop all)
+        self._lock = threading.Lock()       # Only taken the first time a logger is seen
+
+    def _keep_every(self, name: str) -> int:
+        every = self._every.get(name)
+        if every is None:
+            rate = self.sample_rate
+            matches = [prefix for prefix in self.overrides if name == prefix or name.startswith(prefix + ".")]
+            if matches:
+                rate = self.overrides[max(matches, key=len)]
+            every = 0 if rate <= 0 else max(1, round(1 / min(rate, 1.0)))
+            with self._lock:
+                self._counters.setdefault(name, itertools.count())
+                self._buckets.setdefault(name, [self.rate_limit_per_s, self._clock()])
+                self._every[name] = every
+        return every
+
+    def _take_token(self, name: str) -> bool:
+        bucket = self._buckets[name]
+        now = self._clock()
+        bucket[0] = min(self.rate_limit_per_s, bucket[0] + (now - bucket[1]) * self.rate_limit_per_s)
+        bucket[1] = now
+        if bucket[0] < 1:
+            return False
+        bucket[0] -= 1
+        return True
+
+    def __call__(self, record) -> bool:
+        if record["level"].no >= 20: # INFO and above are never sampled
+            return True
+        name = record["name"] or ""
+        every = self._keep_every(name)
+        if every == 0 or next(self._counters[name]) % every:
+            return False
+        return self.rate_limit_per_s <= 0 or self._take_token(name)
+
+def setup_logging(debug_mode: bool = False, log_file_name: Optional[str] = None, profile: Optional[str] = None):
     """
     Configures Loguru logging for the entire application.
 
@@ -34,9 +98,16 @@ def setup_logging(debug_mode: bool = False, log_file_name: Optional[str] = None)
         log_file_name (Optional[str]): If provided, this filename will be used
                                        for the log file inside the LOGS_DIR.
                                        Defaults to 'jennai.log'.
+        profile (Optional[str]): "development" or "production"; defaults to
+                                 config.LOG_PROFILE. See _setup_production_logging().
     """
+    profile = (profile or config.LOG_PROFILE).lower()
+    if profile not in config.LOG_PROFILES:
+        raise ValueError(f"Unknown logging profile '{profile}'. Allowed: {config.LOG_PROFILES}")
+
     # Stop any existing loggers to ensure a clean setup
     logger.remove()
+    _handler_ids["json"] = None
 
     console_level = "DEBUG" if debug_mode else "INFO"
     if log_file_name:
@@ -44,12 +115,16 @@ def setup_logging(debug_mode: bool = False, log_file_name: Optional[str] = None)
     else:
         log_file_path = config.LOGS_DIR / "jennai.log"
 
+    if profile == "production":
+        _setup_production_logging(console_level, log_file_path)
+        return
+
     # --- Console Logger ---
     # This handler prints messages to your terminal.
     _handler_ids["console"] = logger.add(
         sys.stderr,
         level=console_level,
-        format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>"
+        format=CONSOLE_FORMAT
     )
 
     # --- File Logger (with Rotation and Retention) ---
@@ -57,7 +132,7 @@ def setup_logging(debug_mode: bool = False, log_file_name: Optional[str] = None)
     _handler_ids["file"] = logger.add(
         log_file_path,
         level="DEBUG",  # Always log debug messages to the file
-        format="{time} | {level} | {name}:{function}:{line} | {message}",
+        format=FILE_FORMAT,
         rotation="10 MB",      # Create a new file when the current one reaches 10 MB.
         retention="14 days",   # Keep log files for a maximum of 14 days.
         compression="zip",     # Compress old log files to save space.
@@ -67,11 +142,47 @@ def setup_logging(debug_mode: bool = False, log_file_name: Optional[str] = None)
         catch=True             # Automatically catch uncaught exceptions.
     )
 
+def _setup_production_logging(console_level: str, log_file_path: Path):
+    """
+    Production profile: nothing is written on the request thread.
+
+    Every handler is enqueued, so callers only put the record on a queue and a
+    background worker does the formatting and I/O (no shared stderr lock under
+    load). diagnose is off, because rendering variable values on every logged
+    exception is slow and may leak data. DEBUG/TRACE records are sampled and
+    rate-limited per logger (see DebugSampler). Alongside the text log, a
+    JSON-lines file carries each record with its structured `extra` fields.
+    """
+    def sampler() -> DebugSampler:
+        # One sampler per handler: a shared one would advance its counters once per
+        # handler and each sink would keep a different subset of records.
+        return DebugSampler(
+            sample_rate=config.LOG_DEBUG_SAMPLE_RATE,
+            rate_limit_per_s=config.LOG_DEBUG_RATE_LIMIT_PER_S,
+            overrides=config.LOG_DEBUG_SAMPLE_RATES,
+        )
+    common = dict(backtrace=False, diagnose=False, enqueue=True, catch=True)
+
+    _handler_ids["console"] = logger.add(
+        sys.stderr,
+        level=console_level,
+        format=CONSOLE_FORMAT,
+        colorize=False,
+        filter=sampler(),
+        **common
+    )
+    file_options = dict(level="DEBUG", rotation="10 MB", retention="14 days", compression="zip", **common)
+    _handler_ids["file"] = logger.add(log_file_path, format=FILE_FORMAT, filter=sampler(), **file_options)
+    _handler_ids["json"] = logger.add(config.LOG_JSON_FILE, serialize=True, filter=sampler(), **file_options)
+
 def stop_file_logging():
     """Stops logging to the file, typically before a cleanup operation."""
     if _handler_ids["file"] is not None:
         logger.remove(_handler_ids["file"])
         _handler_ids["file"] = None
+    if _handler_ids["json"] is not None:
+        logger.remove(_handler_ids["json"])
+        _handler_ids["json"] = None
 
 def start_file_logging(debug_mode: bool):
     """Re-initializes all logging handlers."""
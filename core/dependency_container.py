@@ -1,41 +1,381 @@
-# File: core/dependency_container.py (within your existing DependencyContainer class)
+# File: core/dependency_container.py
 
 import inspect
-from typing import Type, TypeVar, Dict, Callable, Any, Union, get_origin, get_args, Optional, List
+import json
+import threading
+import time
+from enum import Enum
+from typing import TypeVar, Dict, Callable, Any, Union, get_origin, get_args, get_type_hints, Optional, List, Tuple
 from loguru import logger
 import os
 
 # --- New/Updated Imports needed for the configuration ---
+# Concrete services are imported inside the factories that build them, so
+# creating a container does not pay for provider modules (and numpy) up front.
+from config import config
 from config.loguru_setup import get_logger
-from src.business.ai.gemini_api import GeminiAPIService
-from src.business.ai.logging_ai_decorator import LoggingAIDecorator
 from src.business.interfaces.IAIService import IAIInterface
 from src.data.interfaces.ICrudRepository import ICrudRepository # Still needed for composition
 
 # Define a TypeVar for the interface type for cleaner type hinting
 I = TypeVar('I')
 
+class Lifetime(Enum):
+    """How long a resolved instance lives."""
+    SINGLETON = "singleton" # One instance per container, built on first resolve
+    TRANSIENT = "transient" # A new instance on every resolve
+    SCOPED = "scoped"       # One instance per DependencyScope (e.g. per HTTP request)
+
+class DependencyResolutionError(Exception):
+    """Raised when a registered dependency cannot be constructed (cycles, scope misuse, unresolvable parameters)."""
+    pass
+
+class _Registration:
+    """
+    A registered interface: how to build it, its lifetime, (for singletons) the
+    cached instance, and resolution statistics for get_resolution_stats()/export_graph().
+    """
+    __slots__ = ("interface", "factory", "lifetime", "fork_safe", "instance", "has_instance", "lock",
+                 "resolve_count", "construct_count", "construct_total_s", "construct_self_s",
+                 "construct_max_s", "dependencies")
+
+    def __init__(self, interface: Any, factory: Optional[Callable[..., Any]], lifetime: Lifetime, fork_safe: bool = True):
+        self.interface = interface
+        self.factory = factory
+        self.lifetime = lifetime
+        self.fork_safe = fork_safe   # False: the instance owns connections/threads and is rebuilt in forked children
+        self.instance = None
+        self.has_instance = False
+        self.lock = threading.Lock()
+        self.resolve_count = 0       # Every resolve(), including cached singleton hits
+        self.construct_count = 0     # Calls to the factory
+        self.construct_total_s = 0.0 # Inclusive construction time (includes dependencies built meanwhile)
+        self.construct_self_s = 0.0  # Exclusive time: inclusive minus nested constructions
+        self.construct_max_s = 0.0
+        self.dependencies: Dict[Any, None] = {} # Interfaces resolved while constructing this one (ordered set)
+
+def _display_name(interface: Any) -> str:
+    """Readable, stable name for an interface key in stats and graphs."""
+    if inspect.isclass(interface):
+        return f"{interface.__module__}.{interface.__qualname__}"
+    return str(interface)
+
+# A resolution plan lists a callable's parameters as (name, dependency interface, has default).
+_Plan = List[Tuple[str, Any, bool]]
+
+def _unwrap_optional(annotation: Any) -> Any:
+    """Optional[X] -> X, so Optional dependencies are auto-wired like required ones."""
+    if get_origin(annotation) is Union:
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        if len(args) == 1:
+            return args[0]
+    return annotation
+
 class DependencyContainer:
+    """
+    Lightweight dependency-injection container.
+
+    Registrations are lazy: nothing is constructed until the first resolve().
+    Singletons are built once under a per-registration lock (thread-safe),
+    transients on every resolve, and scoped services once per DependencyScope.
+
+    Classes and factories are auto-wired: constructor/factory parameters whose
+    type annotation is a registered interface are resolved and injected.
+    The parameter analysis (resolution plan) is computed once per callable and cached.
+    """
+    def __init__(self, configure: bool = True):
+        """
+        Args:
+            configure: If True (default), registers the application's dependencies.
+                       Pass False for an empty container (e.g. in tests).
+        """
+        self._registrations: Dict[Any, _Registration] = {}
+        self._plans: Dict[Any, _Plan] = {}
+        self._resolving = threading.local() # Per-thread resolution stack for cycle detection and stats
+        logger.debug("DEBUG - DependencyContainer initialized.")
+        if configure:
+            self.configure_application_dependencies()
+
+    # ------------------------------------------------------------------
+    # Registration
+    # ------------------------------------------------------------------
+    def register(self, interface, implementation_or_factory=None, lifetime: Lifetime = Lifetime.TRANSIENT,
+                 fork_safe: bool = True):
+        """
+        Registers an implementation for an interface.
+
+        Args:
+            interface: The key clients resolve by (usually an abstract class).
+            implementation_or_factory: A class or a factory callable. Its parameters are
+                auto-wired from their type annotations. Defaults to `interface` itself,
+                for registering concrete classes.
+            lifetime: Lifetime.SINGLETON, Lifetime.TRANSIENT or Lifetime.SCOPED.
+            fork_safe: Whether a singleton built in a parent process may be shared with
+                forked children. Set False for instances holding connections, threads or
+                executors; warm() skips them and after_fork() drops them (see core.bootstrap).
+        """
+        factory = implementation_or_factory if implementation_or_factory is not None else interface
+        if not callable(factory):
+            raise TypeError(f"Registration for {interface} must be a class or a callable factory, got {factory!r}")
+        self._registrations[interface] = _Registration(interface, factory, lifetime, fork_safe)
+
+    def register_singleton(self, interface, implementation_or_factory=None, fork_safe: bool = True):
+        """
+        Registers a lazy singleton for the given interface. Accepts either a class or a
+        factory function/lambda; it is invoked once, on the first resolve().
+        """
+        self.register(interface, implementation_or_factory, Lifetime.SINGLETON, fork_safe)
+
+    def register_transient(self, interface, implementation_or_factory=None):
+        """Registers a service that is constructed anew on every resolve()."""
+        self.register(interface, implementation_or_factory, Lifetime.TRANSIENT)
+
+    def register_scoped(self, interface, implementation_or_factory=None):
+        """Registers a service constructed once per DependencyScope (see create_scope())."""
+        self.register(interface, implementation_or_factory, Lifetime.SCOPED)
+
+    def register_instance(self, interface, instance):
+        """Registers an already-built instance as a singleton."""
+        registration = _Registration(interface, None, Lifetime.SINGLETON)
+        registration.instance = instance
+        registration.has_instance = True
+        self._registrations[interface] = registration
+
+    def is_registered(self, interface) -> bool:
+        return interface in self._registrations
+
+    def registered_interfaces(self) -> List[Any]:
+        """All registered interface keys, in registration order."""
+        return list(self._registrations)
+
+    def reset(self):
+        """
+        Drops all cached singleton instances (except those registered with
+        register_instance); they will be rebuilt on the next resolve().
+        """
+        for registration in self._registrations.values():
+            if registration.factory is not None:
+                with registration.lock:
+                    registration.instance = None
+                    registration.has_instance = False
+
+    # ------------------------------------------------------------------
+    # Pre-warming and fork support
+    # ------------------------------------------------------------------
+    def warm(self) -> List[Any]:
+        """
+        Builds every fork-safe singleton now instead of on first use, so a parent
+        process can pay the construction cost once before forking workers.
+        Returns the interfaces that were warmed.
+        """
+        warmed = []
+        for registration in list(self._registrations.values()):
+            if registration.lifetime is not Lifetime.SINGLETON or not registration.fork_safe:
+                continue
+            self.resolve(registration.interface)
+            warmed.append(registration.interface)
+        return warmed
+
+    def after_fork(self) -> None:
+        """
+        Call in a forked child (core.bootstrap does this via os.register_at_fork).
+
+        Locks are replaced, because one held by another parent thread at fork time
+        would stay locked forever in the child. Fork-unsafe singletons are forgotten
+        without being closed (the parent still owns them) and are rebuilt lazily on
+        the child's first resolve(). Fork-safe instances are kept and shared.
+        """
+        self._resolving = threading.local()
+        for registration in self._registrations.values():
+            registration.lock = threading.Lock()
+            if not registration.fork_safe and registration.factory is not None:
+                registration.instance = None
+                registration.has_instance = False
+
+    # ------------------------------------------------------------------
+    # Resolution
+    # ------------------------------------------------------------------
     def resolve(self, interface):
         """
         Resolves and returns the instance registered for the given interface.
-        Raises KeyError if the interface is not registered.
+        Raises KeyError if the interface is not registered, and
+        DependencyResolutionError if it is scoped (use a DependencyScope) or cannot be built.
         """
-        if interface in self._singletons:
-            return self._singletons[interface]
-        if interface in self._registrations:
-            # If not a singleton, create a new instance from the registration
-            return self._registrations[interface]()
-        raise KeyError(f"No registration found for interface: {interface}")
-    # Your existing __init__, _get_key, register, register_singleton, register_instance, resolve, reset methods go here.
-    # ... (existing methods as provided in your prompt) ...
+        return self._resolve(interface, None)
+
+    def create_scope(self) -> "DependencyScope":
+        """Starts a new scope for Lifetime.SCOPED services (e.g. one per HTTP request)."""
+        return DependencyScope(self)
+
+    def _resolve(self, interface, scope: Optional["DependencyScope"]):
+        registration = self._registrations.get(interface)
+        if registration is None:
+            raise KeyError(f"No registration found for interface: {interface}")
+        registration.resolve_count += 1 # Unlocked: may undercount slightly under heavy concurrency
+
+        stack = getattr(self._resolving, "stack", None)
+        if stack: # Resolved while constructing another service: record the dependency edge
+            stack[-1][0].dependencies[interface] = None
+
+        if registration.lifetime is Lifetime.SINGLETON:
+            if registration.has_instance: # Fast path: no locking once built
+                return registration.instance
+            self._check_not_resolving(registration) # Before locking: the lock is held further up this thread's stack
+            with registration.lock:
+                if not registration.has_instance:
+                    # Singletons never capture scoped services, so build them outside any scope.
+                    registration.instance = self._construct(registration, None)
+                    registration.has_instance = True
+            return registration.instance
+
+        if registration.lifetime is Lifetime.SCOPED:
+            if scope is None:
+                raise DependencyResolutionError(f"{interface} is scoped; resolve it from a DependencyScope (container.create_scope()).")
+            return scope._get_or_create(registration)
+
+        return self._construct(registration, scope)
+
+    def _check_not_resolving(self, registration: _Registration) -> None:
+        """Raises DependencyResolutionError if this thread is already constructing `registration`."""
+        stack = getattr(self._resolving, "stack", None) or []
+        if any(frame[0] is registration for frame in stack):
+            chain = " -> ".join(str(item) for item in [frame[0].interface for frame in stack] + [registration.interface])
+            raise DependencyResolutionError(f"Circular dependency detected: {chain}")
+
+    def _construct(self, registration: _Registration, scope: Optional["DependencyScope"]):
+        # Each stack frame is [registration, time spent constructing nested dependencies].
+        stack = getattr(self._resolving, "stack", None)
+        if stack is None:
+            stack = self._resolving.stack = []
+        self._check_not_resolving(registration)
+        frame = [registration, 0.0]
+        stack.append(frame)
+        started = time.perf_counter()
+        try:
+            kwargs = self._build_arguments(registration.factory, scope)
+            return registration.factory(**kwargs)
+        finally:
+            elapsed = time.perf_counter() - started
+            stack.pop()
+            if stack:
+                stack[-1][1] += elapsed
+            registration.construct_count += 1
+            registration.construct_total_s += elapsed
+            registration.construct_self_s += elapsed - frame[1]
+            if elapsed > registration.construct_max_s:
+                registration.construct_max_s = elapsed
+
+    # ------------------------------------------------------------------
+    # Introspection
+    # ------------------------------------------------------------------
+    def get_resolution_stats(self) -> List[Dict[str, Any]]:
+        """
+        Per-registration statistics, slowest total construction time first.
+
+        Times are in milliseconds. `construct_total_ms` includes dependencies built
+        during construction; `construct_self_ms` excludes them, so the service that
+        is actually slow stands out. `dependencies` lists the interfaces resolved
+        while constructing it (auto-wired parameters and resolve() calls in factories).
+        """
+        stats = []
+        for registration in list(self._registrations.values()):
+            stats.append({
+                "name": _display_name(registration.interface),
+                "lifetime": registration.lifetime.value,
+                "fork_safe": registration.fork_safe,
+                "resolve_count": registration.resolve_count,
+                "construct_count": registration.construct_count,
+                "construct_total_ms": round(registration.construct_total_s * 1000, 3),
+                "construct_self_ms": round(registration.construct_self_s * 1000, 3),
+                "construct_max_ms": round(registration.construct_max_s * 1000, 3),
+                "instantiated": registration.has_instance,
+                "dependencies": [_display_name(dep) for dep in self._dependencies_of(registration)],
+            })
+        return sorted(stats, key=lambda item: item["construct_total_ms"], reverse=True)
+
+    def _dependencies_of(self, registration: _Registration) -> List[Any]:
+        """Observed dependencies plus registered, annotated constructor parameters not yet observed."""
+        dependencies = dict(registration.dependencies)
+        if registration.factory is not None:
+            for _, dependency, _ in self._get_plan(registration.factory):
+                if dependency is not None and dependency in self._registrations:
+                    dependencies.setdefault(dependency, None)
+        return list(dependencies)
+
+    def export_graph(self, format: str = "json") -> str:
+        """
+        Exports the dependency graph with construction cost annotated on each node.
+
+        Args:
+            format: "json" ({"nodes": [...], "edges": [...]}) or "dot" (Graphviz).
+        """
+        stats = self.get_resolution_stats()
+        edges = [(item["name"], dependency) for item in stats for dependency in item["dependencies"]]
+
+        if format == "json":
+            nodes = [{key: value for key, value in item.items() if key != "dependencies"} for item in stats]
+            return json.dumps({"nodes": nodes, "edges": [{"from": a, "to": b} for a, b in edges]}, indent=2)
+        if format == "dot":
+            lines = ["digraph dependencies {", '  rankdir=LR;', '  node [shape=box, fontname="Helvetica"];']
+            for item in stats:
+                label = (f"{item['name']}\n{item['lifetime']}, resolved {item['resolve_count']}x\n"
+                         f"built {item['construct_count']}x, {item['construct_total_ms']:.1f} ms "
+                         f"(self {item['construct_self_ms']:.1f} ms)")
+                # JSON string quoting is valid DOT quoting, and turns the newlines into DOT's \n line breaks.
+                lines.append(f'  {json.dumps(item["name"])} [label={json.dumps(label)}];')
+            for a, b in edges:
+                lines.append(f"  {json.dumps(a)} -> {json.dumps(b)};")
+            lines.append("}")
+            return "\n".join(lines)
+        raise ValueError(f"Unknown graph format '{format}'. Allowed: ('json', 'dot')")
+
+    def _build_arguments(self, factory: Callable[..., Any], scope: Optional["DependencyScope"]) -> Dict[str, Any]:
+        kwargs = {}
+        for name, dependency, has_default in self._get_plan(factory):
+            if dependency is not None and dependency in self._registrations:
+                kwargs[name] = self._resolve(dependency, scope)
+            elif not has_default:
+                raise DependencyResolutionError(
+                    f"Cannot auto-wire parameter '{name}' of {factory}: "
+                    f"{dependency if dependency is not None else 'no type annotation'} is not registered and has no default."
+                )
+        return kwargs
+
+    def _get_plan(self, factory: Callable[..., Any]) -> _Plan:
+        """Returns the cached resolution plan for a class or factory, computing it on first use."""
+        plan = self._plans.get(factory)
+        if plan is None:
+            plan = self._plans[factory] = self._compute_plan(factory)
+        return plan
+
+    @staticmethod
+    def _compute_plan(factory: Callable[..., Any]) -> _Plan:
+        target = factory.__init__ if inspect.isclass(factory) else factory
+        try:
+            signature = inspect.signature(factory)
+        except (TypeError, ValueError): # Builtins without introspectable signatures
+            return []
+        try:
+            hints = get_type_hints(target)
+        except Exception: # Unresolvable forward references: fall back to raw annotations
+            hints = {}
+
+        plan: _Plan = []
+        for name, parameter in signature.parameters.items():
+            if parameter.kind in (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD):
+                continue
+            annotation = hints.get(name, parameter.annotation)
+            dependency = None if annotation is inspect.Parameter.empty else _unwrap_optional(annotation)
+            plan.append((name, dependency, parameter.default is not inspect.Parameter.empty))
+        return plan
 
     # This is the primary method to update for configuring your application's dependencies
     def configure_application_dependencies(self):
         """
         Configures the application's dependencies by registering interfaces
         with their concrete implementations and applying decorators.
-        This method is called once during application startup.
+        This method is called once during application startup. Registrations
+        are lazy, so no service is constructed here.
         """
         logger.info("INFO - Configuring application dependencies...")
 
@@ -71,79 +411,143 @@ class DependencyContainer:
                 return {"id": entity_id, "data": "mock_data"}
 
         # Register ICrudRepository as a singleton, potentially wrapped with logging/validation
-        self.register_singleton(ICrudRepository, MockCrudRepository) # Registering the mock as a singleton
+        self.register_singleton(ICrudRepository, MockCrudRepository) # Registering the mock as a lazy singleton
 
+        # Read-only region/product lookups: immutable, so they are built once in a
+        # pre-warmed parent and shared by forked workers.
+        from src.data.implementations.sqllite.reference_lookups import ReferenceLookups
+        self.register_singleton(ReferenceLookups, ReferenceLookups.from_database)
 
-        # 3. Configure IAIInterface: Apply the Decorator Pattern for logging
-        logger.info("INFO - Registering IAIInterface with logging decorator...")
+        # Precomputed score serving for the /api/scores endpoints. Not fork-safe:
+        # the repository keeps one SQLite connection per thread, and the event
+        # broker a watcher thread.
+        from src.business.ai.pricing_engine.score_events import ScoreEventBroker
+        from src.business.ai.pricing_engine.score_service import ScoreService
+        from src.data.implementations.sqllite.score_repository import ScoreRepository
+        self.register_singleton(ScoreEventBroker, lambda: ScoreEventBroker(ScoreRepository()), fork_safe=False)
+        self.register_singleton(ScoreService, lambda: ScoreService(ScoreRepository(lookups=self.resolve(ReferenceLookups)),
+                                                                   events=self.resolve(ScoreEventBroker)),
+                                fork_safe=False)
 
-        # Instantiate the concrete AI service (e.g., GeminiAPIService)
-        # It may compose ICrudRepository if needed for its internal operations
-        gemini_concrete = GeminiAPIService(
-            api_key=os.getenv("GEMINI_API_KEY"), # Get API key from environment variables
-            data_repository=self.resolve(ICrudRepository) # Injecting the configured ICrudRepository
-        )
 
-        # Wrap the concrete AI service with the logging decorator
-        # Pass the shared logger instance (optionally bind with AI-specific context for logs)
-        gemini_logged_decorated = LoggingAIDecorator(
-            gemini_concrete,
-            shared_app_logger.bind(component="AI_Service_Gemini") # More granular logging context
-        )
-
-        # Register the decorated AI service with the container as the default IAIInterface
-        # Now, any client requesting IAIInterface will get the logging-enabled version
-        self.register_singleton(IAIInterface, lambda: gemini_logged_decorated) # Using lambda for lazy singleton creation of decorated service
+        # 3. Configure IAIInterface: Apply the Decorator Pattern for logging
+        #    The provider (or router) and its decorator are built on first resolve().
+        logger.info(f"INFO - Registering IAIInterface ({config.AI_PROVIDER}) with logging decorator...")
+        #    Not fork-safe: the router owns a hedging thread pool, which does not survive fork().
+        self.register_singleton(IAIInterface, lambda: self.create_ai_service(shared_app_logger), fork_safe=False)
 
         # Example for registering an alternative AI service, if needed (e.g., OpenAI)
         # from src.business.ai.openai_api import OpenAIService # Hypothetical OpenAI implementation
-        # openai_concrete = OpenAIService(
-        #     api_key=os.getenv("OPENAI_API_KEY"),
-        #     data_repository=self.resolve(ICrudRepository)
-        # )
-        # openai_logged_decorated = LoggingAIInterface(
-        #     openai_concrete,
-        #     shared_app_logger.bind(component="AI_Service_OpenAI")
-        # )
-        # self.register("IAIInterface_OpenAI", lambda: openai_logged_decorated) # Register by a unique name if you need to choose at runtime
+        # self.register_singleton("IAIInterface_OpenAI", lambda: LoggingAIDecorator(
+        #     OpenAIService(api_key=os.getenv("OPENAI_API_KEY"), data_repository=self.resolve(ICrudRepository)),
+        #     shared_app_logger.bind(component="AI_Service_OpenAI"),
+        # )) # Register by a unique name if you need to choose at runtime
 
 
         logger.info("INFO - Application dependencies configured.")
 
-    # Your existing __init__, _get_key, register, register_singleton, register_instance, resolve, reset methods go here.
-    # Make sure _configure_application_dependencies() is called from your __init__
-    def __init__(self):
-        self._registrations: Dict[Any, Any] = {}
-        self._singletons: Dict[Any, Any] = {}
-        logger.debug("DEBUG - DependencyContainer initialized.")
-        self.configure_application_dependencies() # Call the new configuration method here
-        
-    def register_instance(self, interface, instance):
-        self._singletons[interface] = instance
-
-    def register_singleton(self, interface, implementation_or_factory):
+    def create_ai_service(self, shared_app_logger) -> IAIInterface:
         """
-        Registers a singleton for the given interface.
-        If a class is provided, it will be instantiated once.
-        If a factory (callable) is provided, it will be called once to create the instance.
+        Builds the application's IAIInterface: the provider selected by
+        config.AI_PROVIDER (a single provider, or a router across several),
+        wrapped with the logging decorator.
         """
-        if callable(implementation_or_factory):
-            # Assume it's a factory function or class
-            instance = implementation_or_factory()
+        from core.logging_decorator import LoggingAIDecorator
+
+        providers = [name.strip() for name in config.AI_PROVIDER.split(",") if name.strip()]
+        if len(providers) > 1:
+            ai_concrete = self.create_ai_router(providers)
+            component_name = "AI_Service_Router"
         else:
-            # Assume it's a class type, instantiate it
-            instance = implementation_or_factory()
-        self._singletons[interface] = instance
+            ai_concrete = self.create_ai_provider(providers[0])
+            component_name = f"AI_Service_{providers[0].capitalize()}"
 
-    def register_singleton(self, interface, implementation_or_factory):
+        # Wrap the concrete AI service with the logging decorator
+        # Pass the shared logger instance (optionally bind with AI-specific context for logs)
+        return LoggingAIDecorator(
+            ai_concrete,
+            shared_app_logger.bind(component=component_name) # More granular logging context
+        )
+
+    def create_ai_provider(self, provider: str) -> IAIInterface:
         """
-        Registers a singleton for the given interface. Accepts either a class (which will be instantiated)
-        or a factory function/lambda (which will be called to produce the singleton instance).
+        Builds the concrete (undecorated) IAIInterface implementation for a provider name.
+        Supported names are listed in config.AI_PROVIDERS.
         """
-        if callable(implementation_or_factory) and not isinstance(implementation_or_factory, type):
-            # It's a factory function or lambda
-            instance = implementation_or_factory()
-        else:
-            # It's a class/type
-            instance = implementation_or_factory()
-        self._singletons[interface] = instance
\ No newline at end of file
+        if provider == "gemini":
+            from src.business.ai.gemini_api import GeminiAPIService
+            return GeminiAPIService(
+                api_key=os.getenv("GEMINI_API_KEY"), # Get API key from environment variables
+                data_repository=self.resolve(ICrudRepository) # Injecting the configured ICrudRepository
+            )
+        if provider == "stub":
+            from src.business.ai.local_stub_api import LocalStubAIService
+            return LocalStubAIService() # Latency, error rate and embedding settings come from config
+        raise ValueError(f"Unknown AI provider '{provider}'. Allowed: {config.AI_PROVIDERS}")
+
+    def create_ai_router(self, providers: List[str]) -> IAIInterface:
+        """
+        Builds a RoutingAIService over the named providers, using the routing
+        policy, hedging and health settings from config.
+        """
+        from src.business.ai.routing_ai_service import AIBackend, BackendHealth, RoutingAIService
+
+        backends = [
+            AIBackend(
+                name=name,
+                service=self.create_ai_provider(name),
+                cost=config.AI_PROVIDER_COSTS.get(name, 1.0),
+                health=BackendHealth(
+                    alpha=config.AI_ROUTING_EWMA_ALPHA,
+                    failure_threshold=config.AI_ROUTING_FAILURE_THRESHOLD,
+                    cooldown_s=config.AI_ROUTING_COOLDOWN_S,
+                ),
+            )
+            for name in providers
+        ]
+        return RoutingAIService(backends, policy=config.AI_ROUTING_POLICY, hedge_after_ms=config.AI_ROUTING_HEDGE_AFTER_MS)
+
+
+class DependencyScope:
+    """
+    A resolution scope: Lifetime.SCOPED services are built once per scope and
+    closed (if they have a close() method) when the scope ends. Singletons and
+    transients resolve exactly as they do on the container.
+
+    Usage:
+        with container.create_scope() as scope:
+            repo = scope.resolve(SomeScopedRepository)
+    """
+    def __init__(self, container: DependencyContainer):
+        self._container = container
+        self._instances: Dict[Any, Any] = {}
+        self._lock = threading.RLock() # Re-entered when a scoped service depends on another scoped service
+
+    def resolve(self, interface):
+        return self._container._resolve(interface, self)
+
+    def _get_or_create(self, registration: _Registration):
+        if registration.interface in self._instances:
+            return self._instances[registration.interface]
+        self._container._check_not_resolving(registration)
+        with self._lock:
+            if registration.interface not in self._instances:
+                self._instances[registration.interface] = self._container._construct(registration, self)
+            return self._instances[registration.interface]
+
+    def close(self):
+        """Closes scoped instances in reverse creation order and forgets them."""
+        instances, self._instances = self._instances, {}
+        for instance in reversed(list(instances.values())):
+            close = getattr(instance, "close", None)
+            if callable(close):
+                try:
+                    close()
+                except Exception as e:
+                    logger.warning(f"WARNING - Error closing scoped instance {instance!r}: {e}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
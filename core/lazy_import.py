@@ -0,0 +1,42 @@
+# File: core/lazy_import.py
+
+"""
+Lazy-import shim for heavy optional modules.
+
+    np = lazy_import("numpy")   # costs nothing here
+    ...
+    np.zeros(3)                 # numpy is actually imported on first attribute access
+
+Use it for modules that only some code paths need (numpy in the stub AI
+provider, pandas in exports, ...), so CLI commands and test subprocesses that
+never touch those paths do not pay their import time at startup.
+"""
+
+import importlib.util
+import sys
+import threading
+from types import ModuleType
+
+_lock = threading.Lock()
+
+
+def lazy_import(name: str) -> ModuleType:
+    """
+    Returns a module object that is loaded on first attribute access.
+    If the module is already imported, the real module is returned.
+    Raises ModuleNotFoundError immediately if the module does not exist,
+    so missing dependencies are still reported at import time.
+    """
+    with _lock:
+        module = sys.modules.get(name)
+        if module is not None:
+            return module
+        spec = importlib.util.find_spec(name)
+        if spec is None or spec.loader is None:
+            raise ModuleNotFoundError(f"No module named '{name}'", name=name)
+        loader = importlib.util.LazyLoader(spec.loader)
+        spec.loader = loader
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        loader.exec_module(module)
+        return module
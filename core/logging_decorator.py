@@ -1,47 +1,157 @@
-from typing import Any, Dict, List, Optional
+import reprlib
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional
 from loguru import logger
 from src.business.interfaces.IAIService import IAIInterface
 
+SUMMARY_CHARS = 75 # Maximum length of input/output summaries in log messages
+
+# reprlib truncates while it walks the object, so summarising a large response
+# never serialises the whole thing just to cut it down to SUMMARY_CHARS.
+_summary_repr = reprlib.Repr()
+_summary_repr.maxstring = SUMMARY_CHARS
+_summary_repr.maxother = SUMMARY_CHARS
+_summary_repr.maxlist = 4
+_summary_repr.maxdict = 4
+_summary_repr.maxlevel = 2
+
+def summarize(value: Any, limit: int = SUMMARY_CHARS) -> str:
+    """Short, bounded-cost description of a payload for log messages."""
+    if isinstance(value, str):
+        return value[:limit]
+    if isinstance(value, (bytes, bytearray)):
+        return f"<{len(value)} bytes>"
+    return _summary_repr.repr(value)[:limit]
+
+def payload_size(value: Any) -> int:
+    """
+    Cheap size measure for structured logs: characters for text, bytes for binary,
+    dimensions for embeddings, and the output length for process_text results.
+    """
+    if isinstance(value, dict):
+        output = value.get("output")
+        return len(output) if isinstance(output, str) else len(value)
+    try:
+        return len(value)
+    except TypeError:
+        return 0
+
 class LoggingAIDecorator(IAIInterface):
     """
     A decorator for IAIInterface that adds logging to all AI operations.
     It ensures consistent logging without modifying the concrete AI service implementations.
+
+    Logging is lazy: messages use loguru's deferred formatting, and summaries and
+    sizes are computed only if a handler accepts the level. Every completion record
+    carries structured fields in `extra` (request_id, operation, duration_ms,
+    input_size, output_size) for JSON sinks and log analysis.
     """
     def __init__(self, wrapped_ai_service: IAIInterface, logger_instance: Optional[Any] = None):
         if not isinstance(wrapped_ai_service, IAIInterface):
             raise TypeError("wrapped_ai_service must be an instance of IAIInterface")
         self._wrapped_ai_service: IAIInterface = wrapped_ai_service
         self._logger = logger_instance if logger_instance is not None else logger.bind(component="AI")
+        self._lazy_logger = self._logger.opt(lazy=True)
 
-    def process_text(self, text: str, **kwargs) -> Dict[str, Any]:
-        request_id = kwargs.get('request_id', 'N/A')
-        self._logger.info(f"[Request ID: {request_id}] AI: Initiating text processing. Input summary: {text[:75]}...")
+    def _log_start(self, operation: str, request_id: Any, payload: Any) -> None:
+        self._lazy_logger.info(
+            "[Request ID: {request_id}] AI: Initiating {operation}. Input summary: {summary}...",
+            request_id=lambda: request_id,
+            operation=lambda: operation,
+            summary=lambda: summarize(payload),
+        )
+
+    def _log_success(self, operation: str, request_id: Any, payload: Any, result: Any, started: float) -> None:
+        duration_ms = (time.perf_counter() - started) * 1000
+        self._lazy_logger.info(
+            "[Request ID: {request_id}] AI: {operation} successful in {duration_ms:.1f} ms. Output summary: {summary}...",
+            request_id=lambda: request_id,
+            operation=lambda: operation,
+            duration_ms=lambda: duration_ms,
+            summary=lambda: summarize(result),
+            input_size=lambda: payload_size(payload),
+            output_size=lambda: payload_size(result),
+        )
+
+    def _log_error(self, operation: str, request_id: Any, payload: Any, error: Exception, started: float) -> None:
+        duration_ms = (time.perf_counter() - started) * 1000
+        self._logger.opt(lazy=True, exception=error).error(
+            "[Request ID: {request_id}] AI: Error during {operation} after {duration_ms:.1f} ms: {error}",
+            request_id=lambda: request_id,
+            operation=lambda: operation,
+            duration_ms=lambda: duration_ms,
+            error=lambda: error,
+            input_size=lambda: payload_size(payload),
+        )
+
+    def _call(self, operation: str, payload: Any, call: Callable[[], Any], request_id: Any) -> Any:
+        self._log_start(operation, request_id, payload)
+        started = time.perf_counter()
         try:
-            result = self._wrapped_ai_service.process_text(text, **kwargs)
-            self._logger.info(f"[Request ID: {request_id}] AI: Text processing successful. Output summary: {str(result)[:75]}...")
-            return result
+            result = call()
         except Exception as e:
-            self._logger.error(f"[Request ID: {request_id}] AI: Error during text processing: {e}", exc_info=True)
+            self._log_error(operation, request_id, payload, e, started)
             raise
+        self._log_success(operation, request_id, payload, result, started)
+        return result
 
-    def generate_image(self, prompt: str, **kwargs) -> bytes:
+    def process_text(self, text: str, **kwargs) -> Dict[str, Any]:
+        return self._call("text processing", text,
+                          lambda: self._wrapped_ai_service.process_text(text, **kwargs),
+                          kwargs.get('request_id', 'N/A'))
+
+    def stream_text(self, text: str, **kwargs) -> Iterator[str]:
+        """
+        Passes the wrapped service's stream through chunk by chunk. Nothing is
+        buffered: each chunk is yielded as soon as the wrapped service produces it,
+        and only counters are kept for the completion log line.
+        """
+        operation = "streaming text processing"
         request_id = kwargs.get('request_id', 'N/A')
-        self._logger.info(f"[Request ID: {request_id}] AI: Initiating image generation for prompt: {prompt[:75]}...")
+        self._log_start(operation, request_id, text)
+        started = time.perf_counter()
+        chunk_count = 0
+        char_count = 0
         try:
-            result = self._wrapped_ai_service.generate_image(prompt, **kwargs)
-            self._logger.info(f"[Request ID: {request_id}] AI: Image generation successful for prompt: {prompt[:75]}")
-            return result
+            for chunk in self._wrapped_ai_service.stream_text(text, **kwargs):
+                if chunk_count == 0:
+                    first_chunk_ms = (time.perf_counter() - started) * 1000
+                    self._lazy_logger.debug(
+                        "[Request ID: {request_id}] AI: First chunk after {first_chunk_ms:.1f} ms",
+                        request_id=lambda: request_id,
+                        first_chunk_ms=lambda: first_chunk_ms,
+                    )
+                chunk_count += 1
+                char_count += len(chunk)
+                yield chunk
+        except GeneratorExit:
+            # The consumer stopped early (e.g. the HTTP client disconnected).
+            self._lazy_logger.warning(
+                "[Request ID: {request_id}] AI: Stream closed by consumer after {chunks} chunks",
+                request_id=lambda: request_id,
+                chunks=lambda: chunk_count,
+            )
+            raise
         except Exception as e:
-            self._logger.error(f"[Request ID: {request_id}] AI: Error during image generation: {e}", exc_info=True)
+            self._log_error(operation, request_id, text, e, started)
             raise
+        duration_ms = (time.perf_counter() - started) * 1000
+        self._lazy_logger.info(
+            "[Request ID: {request_id}] AI: {operation} successful. {chunks} chunks, {output_size} chars in {duration_ms:.1f} ms",
+            request_id=lambda: request_id,
+            operation=lambda: operation,
+            chunks=lambda: chunk_count,
+            duration_ms=lambda: duration_ms,
+            input_size=lambda: len(text),
+            output_size=lambda: char_count,
+        )
+
+    def generate_image(self, prompt: str, **kwargs) -> bytes:
+        return self._call("image generation", prompt,
+                          lambda: self._wrapped_ai_service.generate_image(prompt, **kwargs),
+                          kwargs.get('request_id', 'N/A'))
 
     def embed_text(self, text: str, **kwargs) -> List[float]:
-        request_id = kwargs.get('request_id', 'N/A')
-        self._logger.info(f"[Request ID: {request_id}] AI: Initiating text embedding for input: {text[:75]}...")
-        try:
-            result = self._wrapped_ai_service.embed_text(text, **kwargs)
-            self._logger.info(f"[Request ID: {request_id}] AI: Text embedding successful for input: {text[:75]}")
-            return result
-        except Exception as e:
-            self._logger.error(f"[Request ID: {request_id}] AI: Error during text embedding: {e}", exc_info=True)
-            raise
+        return self._call("text embedding", text,
+                          lambda: self._wrapped_ai_service.embed_text(text, **kwargs),
+                          kwargs.get('request_id', 'N/A'))
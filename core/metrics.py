@@ -0,0 +1,391 @@
+# File: core/metrics.py
+
+"""
+In-process metrics: counters, gauges and fixed-bucket histograms.
+
+    LOADER_SECONDS = histogram("jennai_loader_seconds", "Loader query time.", ["loader"])
+
+    @timed(LOADER_SECONDS.labels(loader="fx"))
+    def load_fx_data(): ...
+
+    SCORED_REGIONS.inc(len(scores))
+
+Counters and histograms accumulate into a per-thread shard, so the hot path is
+a thread-local lookup and a list increment: no lock, no contention. Shards are
+only merged when the registry is scraped (render()), which is what the Flask
+app serves at /metrics in the Prometheus text exposition format.
+
+Metrics are per process. Under a multi-worker server each worker reports its
+own values; Prometheus aggregates them with sum()/histogram_quantile().
+"""
+
+import functools
+import math
+import os
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from config import config
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class _Shards:
+    """
+    A fixed-size vector of floats accumulated per thread and summed when read.
+
+    Each thread writes only to its own list, so updates need no lock. Shards of
+    threads that have exited are folded into `_retired` on the next read, which
+    keeps counters monotonic while short-lived threads come and go.
+    """
+    __slots__ = ("_size", "_local", "_shards", "_retired", "_lock")
+
+    def __init__(self, size: int):
+        self._size = size
+        self._local = threading.local()
+        self._shards: List[Tuple[threading.Thread, List[float]]] = []
+        self._retired = [0.0] * size
+        self._lock = threading.Lock()
+
+    def shard(self) -> List[float]:
+        try:
+            return self._local.values
+        except AttributeError:
+            values = [0.0] * self._size
+            with self._lock: # Once per thread per metric
+                self._shards.append((threading.current_thread(), values))
+            self._local.values = values
+            return values
+
+    def merged(self) -> List[float]:
+        with self._lock:
+            alive = []
+            for thread, values in self._shards:
+                if thread.is_alive():
+                    alive.append((thread, values))
+                else:
+                    self._retired = [a + b for a, b in zip(self._retired, values)]
+            self._shards = alive
+            total = list(self._retired)
+            for _, values in alive:
+                total = [a + b for a, b in zip(total, values)]
+        return total
+
+    def _after_fork(self) -> None:
+        self._lock = threading.Lock() # May have been held by a thread that does not exist in the child
+
+
+class _CounterValue:
+    __slots__ = ("_shards",)
+
+    def __init__(self, _metric):
+        self._shards = _Shards(1)
+
+    def inc(self, amount: float = 1.0) -> None:
+        if amount < 0:
+            raise ValueError("Counters can only increase.")
+        self._shards.shard()[0] += amount
+
+    @property
+    def value(self) -> float:
+        return self._shards.merged()[0]
+
+    def _samples(self, name: str, labels: Dict[str, str]):
+        yield name, labels, self.value
+
+
+class _GaugeValue:
+    """Gauges are set rather than accumulated, so they hold a single value (set() is one atomic store)."""
+    __slots__ = ("_value", "_function", "_lock")
+
+    def __init__(self, _metric):
+        self._value = 0.0
+        self._function: Optional[Callable[[], float]] = None
+        self._lock = threading.Lock()
+
+    def set(self, value: float) -> None:
+        self._value = float(value)
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self._value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        self.inc(-amount)
+
+    def set_function(self, function: Callable[[], float]) -> None:
+        """Reads the gauge from `function` at scrape time (queue depth, cache size, ...)."""
+        self._function = function
+
+    @property
+    def value(self) -> float:
+        return float(self._function()) if self._function is not None else self._value
+
+    def _samples(self, name: str, labels: Dict[str, str]):
+        yield name, labels, self.value
+
+
+class _HistogramValue:
+    """Shard layout: one count per bucket (the last is +Inf), then the running sum."""
+    __slots__ = ("_upper_bounds", "_shards")
+
+    def __init__(self, metric: "Histogram"):
+        self._upper_bounds = metric.buckets
+        self._shards = _Shards(len(metric.buckets) + 2)
+
+    def observe(self, value: float) -> None:
+        values = self._shards.shard()
+        values[bisect_left(self._upper_bounds, value)] += 1
+        values[-1] += value
+
+    @contextmanager
+    def time(self) -> Iterator[None]:
+        """Observes the duration of the enclosed block in seconds (also when it raises)."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started)
+
+    def snapshot(self) -> Dict[str, object]:
+        """Merged state: per-bucket (non-cumulative) counts, total count and sum."""
+        values = self._shards.merged()
+        counts = values[:-1]
+        return {"buckets": list(self._upper_bounds) + [math.inf], "counts": counts,
+                "count": sum(counts), "sum": values[-1]}
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimates the q-quantile (0..1) by linear interpolation inside the bucket
+        that contains it, the same estimate Prometheus' histogram_quantile() makes.
+        Returns NaN when nothing was observed.
+        """
+        snapshot = self.snapshot()
+        total = snapshot["count"]
+        if not total:
+            return math.nan
+        rank = q * total
+        cumulative = 0.0
+        lower = 0.0
+        for upper, count in zip(snapshot["buckets"], snapshot["counts"]):
+            if count and cumulative + count >= rank:
+                if math.isinf(upper): # Above the highest bucket: its bound is the best estimate
+                    return lower
+                return lower + (upper - lower) * (rank - cumulative) / count
+            cumulative += count
+            if not math.isinf(upper):
+                lower = upper
+        return lower
+
+    def _samples(self, name: str, labels: Dict[str, str]):
+        snapshot = self.snapshot()
+        cumulative = 0.0
+        for upper, count in zip(snapshot["buckets"], snapshot["counts"]):
+            cumulative += count
+            yield f"{name}_bucket", dict(labels, le=_format_value(upper)), cumulative
+        yield f"{name}_sum", labels, snapshot["sum"]
+        yield f"{name}_count", labels, snapshot["count"]
+
+
+class _Metric:
+    """
+    A metric family. With label names, call labels(...) to get the child for one
+    label combination (cache the child on hot paths). Without label names the
+    family forwards inc()/set()/observe() to its single unlabelled child.
+    """
+    type_name = ""
+    _value_class: type = None
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[Tuple[str, ...], object] = {}
+        self._lock = threading.Lock()
+        if not self.labelnames:
+            self._default = self.labels()
+
+    def labels(self, *values: str, **labels: str):
+        if labels:
+            if values or set(labels) != set(self.labelnames):
+                raise ValueError(f"Metric '{self.name}' expects labels {self.labelnames}, got {sorted(labels)}.")
+            values = tuple(str(labels[label]) for label in self.labelnames)
+        else:
+            values = tuple(str(v) for v in values)
+            if len(values) != len(self.labelnames):
+                raise ValueError(f"Metric '{self.name}' expects labels {self.labelnames}, got {values}.")
+        child = self._children.get(values)
+        if child is None:
+            with self._lock:
+                child = self._children.setdefault(values, self._value_class(self))
+        return child
+
+    def samples(self) -> Iterator[Tuple[str, Dict[str, str], float]]:
+        for values, child in sorted(self._children.items()):
+            yield from child._samples(self.name, dict(zip(self.labelnames, values)))
+
+    def _after_fork(self) -> None:
+        self._lock = threading.Lock()
+        for child in self._children.values():
+            if isinstance(getattr(child, "_shards", None), _Shards):
+                child._shards._after_fork()
+            elif isinstance(child, _GaugeValue):
+                child._lock = threading.Lock()
+
+
+class Counter(_Metric):
+    type_name = "counter"
+    _value_class = _CounterValue
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._default.inc(amount)
+
+    @property
+    def value(self) -> float:
+        return self._default.value
+
+
+class Gauge(_Metric):
+    type_name = "gauge"
+    _value_class = _GaugeValue
+
+    def set(self, value: float) -> None:
+        self._default.set(value)
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._default.inc(amount)
+
+    def dec(self, amount: float = 1.0) -> None:
+        self._default.dec(amount)
+
+    def set_function(self, function: Callable[[], float]) -> None:
+        self._default.set_function(function)
+
+    @property
+    def value(self) -> float:
+        return self._default.value
+
+
+class Histogram(_Metric):
+    type_name = "histogram"
+    _value_class = _HistogramValue
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = config.METRICS_LATENCY_BUCKETS):
+        bounds = sorted(float(b) for b in buckets if not math.isinf(b))
+        if not bounds:
+            raise ValueError(f"Histogram '{name}' needs at least one finite bucket.")
+        self.buckets = tuple(bounds)
+        super().__init__(name, documentation, labelnames)
+
+    def observe(self, value: float) -> None:
+        self._default.observe(value)
+
+    def time(self):
+        return self._default.time()
+
+    def quantile(self, q: float) -> float:
+        return self._default.quantile(q)
+
+
+class MetricsRegistry:
+    """Holds metric families by name; counter()/gauge()/histogram() return the existing family if registered."""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def _get_or_create(self, cls, name: str, documentation: str, labelnames: Sequence[str], **kwargs) -> _Metric:
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, documentation, labelnames, **kwargs)
+            elif type(metric) is not cls or metric.labelnames != tuple(labelnames):
+                raise ValueError(f"Metric '{name}' is already registered as a {metric.type_name} "
+                                 f"with labels {metric.labelnames}.")
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._get_or_create(Counter, name, documentation, labelnames)
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._get_or_create(Gauge, name, documentation, labelnames)
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = config.METRICS_LATENCY_BUCKETS) -> Histogram:
+        return self._get_or_create(Histogram, name, documentation, labelnames, buckets=buckets)
+
+    def get(self, name: str) -> Optional[_Metric]:
+        return self._metrics.get(name)
+
+    def unregister(self, name: str) -> None:
+        with self._lock:
+            self._metrics.pop(name, None)
+
+    def render(self) -> str:
+        """All metrics in the Prometheus text exposition format (version 0.0.4)."""
+        lines = []
+        for name, metric in sorted(self._metrics.items()):
+            lines.append(f"# HELP {name} {_escape_help(metric.documentation)}")
+            lines.append(f"# TYPE {name} {metric.type_name}")
+            for sample_name, labels, value in metric.samples():
+                label_text = ",".join(f'{k}="{_escape_label(v)}"' for k, v in labels.items())
+                lines.append(f"{sample_name}{{{label_text}}} {_format_value(value)}" if label_text
+                             else f"{sample_name} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+    def _after_fork(self) -> None:
+        self._lock = threading.Lock()
+        for metric in list(self._metrics.values()):
+            metric._after_fork()
+
+
+def _escape_help(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("\n", "\\n")
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if math.isnan(value):
+        return "NaN"
+    if float(value).is_integer() and abs(value) < 1e15:
+        return str(int(value))
+    return repr(float(value))
+
+
+registry = MetricsRegistry()
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=registry._after_fork)
+
+
+def counter(name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+    return registry.counter(name, documentation, labelnames)
+
+
+def gauge(name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+    return registry.gauge(name, documentation, labelnames)
+
+
+def histogram(name: str, documentation: str, labelnames: Sequence[str] = (),
+              buckets: Sequence[float] = config.METRICS_LATENCY_BUCKETS) -> Histogram:
+    return registry.histogram(name, documentation, labelnames, buckets)
+
+
+def timed(metric) -> Callable[[Callable], Callable]:
+    """Decorator that observes the call duration in seconds on a histogram (or one of its labelled children)."""
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with metric.time():
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
@@ -0,0 +1,131 @@
+# File: core/sampling_profiler.py
+
+"""
+Low-overhead sampling profiler that can be switched on in a running process.
+
+    profiler.start()
+    ...                       # reproduce the slowdown
+    path = profiler.stop_and_dump()   # logs/profiles/profile-<timestamp>-<pid>.collapsed
+
+While running, a daemon thread wakes every `interval_s`, reads every other
+thread's stack from sys._current_frames() and counts identical stacks. The
+output is the "collapsed stack" format (`root;caller;callee <count>` per line)
+that flamegraph.pl, speedscope and inferno render as flame graphs.
+
+When stopped there is no thread, no trace or profile hook and nothing on any
+code path, so it is safe to leave available in production.
+
+The profiler samples one process. Under `python main.py serve` every gunicorn
+worker has its own, so status() and the dump file name carry the pid.
+"""
+
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Optional
+
+from loguru import logger
+
+from config import config
+
+
+class SamplingProfiler:
+    def __init__(self, interval_s: float = config.PROFILER_INTERVAL_MS / 1000.0,
+                 max_depth: int = config.PROFILER_MAX_DEPTH):
+        self.interval_s = interval_s # Default; start(interval_s) overrides it for that run only
+        self.run_interval_s = interval_s
+        self.max_depth = max_depth
+        self._stacks: Counter = Counter()
+        self._labels: Dict[object, str] = {} # code object -> frame label, so each sample only does dict lookups
+        self._thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        self._lock = threading.Lock()
+        self.samples = 0
+        self.started_at: Optional[float] = None
+        self.elapsed_s = 0.0
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None
+
+    def start(self, interval_s: Optional[float] = None) -> bool:
+        """Starts sampling with fresh counts. Returns False if it was already running."""
+        with self._lock:
+            if self._thread is not None:
+                return False
+            self.run_interval_s = interval_s or self.interval_s
+            self._stacks = Counter()
+            self.samples = 0
+            self.elapsed_s = 0.0
+            self._stop_event.clear()
+            self.started_at = time.perf_counter()
+            self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+            self._thread.start()
+        logger.info(f"INFO - Sampling profiler started in pid {os.getpid()} ({1 / self.run_interval_s:.0f} Hz).")
+        return True
+
+    def stop(self) -> Counter:
+        """Stops sampling and returns the collapsed stack counts. Safe to call when not running."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+            if thread is None:
+                return self._stacks
+            self._stop_event.set()
+        thread.join()
+        self.elapsed_s = time.perf_counter() - self.started_at
+        logger.info(f"INFO - Sampling profiler stopped: {self.samples} samples over {self.elapsed_s:.1f} s.")
+        return self._stacks
+
+    def _run(self) -> None:
+        own_id = threading.get_ident()
+        wait = self._stop_event.wait
+        interval_s = self.run_interval_s
+        while not wait(interval_s):
+            names = {t.ident: t.name for t in threading.enumerate()}
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id != own_id:
+                    self._stacks[self._collapse(names.get(thread_id, str(thread_id)), frame)] += 1
+            self.samples += 1
+
+    def _collapse(self, thread_name: str, frame) -> str:
+        labels = self._labels
+        stack = []
+        while frame is not None and len(stack) < self.max_depth:
+            code = frame.f_code
+            label = labels.get(code)
+            if label is None:
+                label = labels[code] = (f"{code.co_name} ({Path(code.co_filename).name}:{code.co_firstlineno})"
+                                        .replace(";", ":").replace(" ", "_"))
+            stack.append(label)
+            frame = frame.f_back
+        stack.append(thread_name.replace(";", ":").replace(" ", "_"))
+        return ";".join(reversed(stack))
+
+    def collapsed(self) -> str:
+        """Collapsed stacks, one `frame;frame;frame count` line each, most frequent first."""
+        stacks = self._stacks.copy() # The sampler may still be adding stacks
+        return "".join(f"{stack} {count}\n" for stack, count in stacks.most_common())
+
+    def dump(self, path: Optional[Path] = None) -> Path:
+        """Writes the collapsed stacks; defaults to logs/profiles/profile-<timestamp>-<pid>.collapsed."""
+        path = Path(path or config.PROFILE_DIR / f"profile-{datetime.now():%Y%m%d-%H%M%S}-{os.getpid()}.collapsed")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(self.collapsed(), encoding="utf-8")
+        logger.info(f"INFO - Collapsed stacks written to {path} (render with flamegraph.pl or speedscope).")
+        return path
+
+    def stop_and_dump(self, path: Optional[Path] = None) -> Path:
+        self.stop()
+        return self.dump(path)
+
+    def status(self) -> Dict[str, object]:
+        elapsed = time.perf_counter() - self.started_at if self.running else self.elapsed_s
+        return {"running": self.running, "pid": os.getpid(), "interval_ms": self.run_interval_s * 1000,
+                "samples": self.samples, "elapsed_s": round(elapsed, 3), "distinct_stacks": len(self._stacks)}
+
+
+profiler = SamplingProfiler()
@@ -0,0 +1,218 @@
+# File: core/tracing.py
+
+"""
+Lightweight in-process tracing.
+
+    with trace_span("scorer.normalize", regions=4):
+        ...
+
+    @traced("loader.fx")
+    def load_fx_data(): ...
+
+Spans record monotonic start/end times, nest automatically (the current span
+and trace id live in contextvars, so they follow threads and asyncio tasks),
+and are kept in a bounded ring buffer. export_chrome_trace() writes them in
+the Chrome trace event format, which chrome://tracing and Perfetto open.
+"""
+
+import functools
+import json
+import os
+import threading
+import time
+import uuid
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional
+
+from loguru import logger
+
+from config import config
+
+
+@dataclass
+class Span:
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: Optional[str]
+    start_ns: int
+    end_ns: Optional[int] = None
+    thread_id: int = 0
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    error: Optional[str] = None
+    _token: Any = field(default=None, repr=False, compare=False) # Restores the parent span when this one ends
+
+    @property
+    def duration_ms(self) -> float:
+        end = self.end_ns if self.end_ns is not None else time.perf_counter_ns()
+        return (end - self.start_ns) / 1e6
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+
+_current_span: ContextVar[Optional[Span]] = ContextVar("current_span", default=None)
+_current_trace_id: ContextVar[Optional[str]] = ContextVar("current_trace_id", default=None)
+
+
+def _new_id() -> str:
+    return uuid.uuid4().hex[:16]
+
+
+class Tracer:
+    """Collects finished spans in a ring buffer of the most recent `buffer_size` spans."""
+
+    def __init__(self, buffer_size: int = config.TRACE_BUFFER_SIZE, enabled: bool = config.TRACING_ENABLED):
+        self.enabled = enabled
+        self._spans: Deque[Span] = deque(maxlen=buffer_size) # deque.append is atomic: no lock on the hot path
+        self._epoch_ns = time.perf_counter_ns() # Chrome trace timestamps are relative to this
+
+    def record(self, span: Span) -> None:
+        self._spans.append(span)
+
+    def spans(self, trace_id: Optional[str] = None) -> List[Span]:
+        spans = list(self._spans)
+        return [s for s in spans if s.trace_id == trace_id] if trace_id else spans
+
+    def clear(self) -> None:
+        self._spans.clear()
+
+    def to_chrome_trace(self, trace_id: Optional[str] = None) -> Dict[str, Any]:
+        """Finished spans as Chrome trace "complete" (ph=X) events, timestamps in microseconds."""
+        pid = os.getpid()
+        events = []
+        for span in self.spans(trace_id):
+            args = dict(span.attributes, trace_id=span.trace_id, span_id=span.span_id)
+            if span.parent_id:
+                args["parent_id"] = span.parent_id
+            if span.error:
+                args["error"] = span.error
+            events.append({
+                "name": span.name,
+                "cat": span.name.split(".", 1)[0],
+                "ph": "X",
+                "ts": (span.start_ns - self._epoch_ns) / 1000,
+                "dur": (span.end_ns - span.start_ns) / 1000,
+                "pid": pid,
+                "tid": span.thread_id,
+                "args": args,
+            })
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
+tracer = Tracer()
+
+
+def current_span() -> Optional[Span]:
+    return _current_span.get()
+
+
+def current_trace_id() -> Optional[str]:
+    """The trace id of the current span, or the one set with start_trace()/set_trace_id()."""
+    span = _current_span.get()
+    return span.trace_id if span is not None else _current_trace_id.get()
+
+
+def set_trace_id(trace_id: Optional[str]):
+    """Sets the current trace id; returns a token for reset_trace_id(). See start_trace() for the block form."""
+    return _current_trace_id.set(trace_id)
+
+
+def reset_trace_id(token) -> None:
+    _current_trace_id.reset(token)
+
+
+@contextmanager
+def start_trace(trace_id: Optional[str] = None) -> Iterator[str]:
+    """
+    Sets the trace id for everything traced inside the block, e.g. an incoming
+    X-Request-ID, so spans and log lines for one request share an id.
+    """
+    trace_id = trace_id or uuid.uuid4().hex
+    token = set_trace_id(trace_id)
+    try:
+        yield trace_id
+    finally:
+        reset_trace_id(token)
+
+
+def begin_span(name: str, **attributes: Any) -> Optional[Span]:
+    """
+    Starts a span as a child of the current one and makes it current. Must be
+    paired with end_span(); prefer trace_span() unless begin and end happen in
+    different callbacks (as in Flask's before/after request hooks).
+    Returns None when tracing is disabled.
+    """
+    if not tracer.enabled:
+        return None
+    parent = _current_span.get()
+    trace_id = parent.trace_id if parent else (_current_trace_id.get() or uuid.uuid4().hex)
+    span = Span(name, trace_id, _new_id(), parent.span_id if parent else None,
+                time.perf_counter_ns(), thread_id=threading.get_ident(), attributes=attributes)
+    span._token = _current_span.set(span)
+    return span
+
+
+def end_span(span: Optional[Span], error: Optional[BaseException] = None) -> None:
+    """Finishes a span started with begin_span() and restores its parent as current."""
+    if span is None or span.end_ns is not None:
+        return
+    span.end_ns = time.perf_counter_ns()
+    if error is not None:
+        span.error = f"{type(error).__name__}: {error}"
+    try:
+        _current_span.reset(span._token)
+    except ValueError: # Ended from a different context than it started in
+        _current_span.set(None)
+    tracer.record(span)
+
+
+@contextmanager
+def trace_span(name: str, **attributes: Any) -> Iterator[Optional[Span]]:
+    """Times the enclosed block as a span; exceptions are recorded on the span and re-raised."""
+    span = begin_span(name, **attributes)
+    try:
+        yield span
+    except BaseException as e:
+        end_span(span, e)
+        raise
+    end_span(span)
+
+
+def traced(name: Optional[str] = None) -> Callable[[Callable], Callable]:
+    """Decorator form of trace_span(); the span name defaults to module.function."""
+    def decorator(func: Callable) -> Callable:
+        span_name = name or f"{func.__module__}.{func.__qualname__}"
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not tracer.enabled:
+                return func(*args, **kwargs)
+            with trace_span(span_name) as span:
+                result = func(*args, **kwargs)
+            logger.opt(lazy=True).debug(
+                "[Trace ID: {trace_id}] {name} took {duration_ms:.2f} ms",
+                trace_id=lambda: span.trace_id, name=lambda: span_name, duration_ms=lambda: span.duration_ms,
+            )
+            return result
+        return wrapper
+    return decorator
+
+
+def export_chrome_trace(path: Optional[Path] = None, trace_id: Optional[str] = None) -> Path:
+    """
+    Writes buffered spans (optionally only one trace) as Chrome trace JSON.
+    Defaults to logs/traces/trace-<timestamp>.json.
+    """
+    if path is None:
+        path = config.TRACE_DIR / f"trace-{datetime.now():%Y%m%d-%H%M%S}{'-' + trace_id if trace_id else ''}.json"
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(tracer.to_chrome_trace(trace_id)), encoding="utf-8")
+    logger.info(f"INFO - Trace written to {path}")
+    return path
@@ -19,8 +19,7 @@ load_dotenv(dotenv_path=jennai_root / ".env")
 # --- Centralized Core Imports ---
 # These modules are now directly discoverable from the JennAI root
 from config.loguru_setup import setup_logging
-from config.config import DEBUG_MODE
-from core.bootstrap import get_configured_container # <-- Import the new simplified bootstrap function
+from config.config import DEBUG_MODE, SERVER_BACKEND
 
 # --- Global Setup (Orchestrated by main.py) ---
 setup_logging(debug_mode=DEBUG_MODE) # Initialize Loguru for the entire monorepo
@@ -32,10 +31,46 @@ logger.info(f"INFO - Current working directory: {os.getcwd()}")
 logger.info(f"INFO - JennAI project root added to PATH: {jennai_root}")
 logger.info(f"INFO - Running in DEBUG_MODE: {DEBUG_MODE}")
 
+def parse_args(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="JennAI orchestration entry point.")
+    commands = parser.add_subparsers(dest="command")
+    serve_parser = commands.add_parser("serve", help="Run the API under the production server (gunicorn/waitress).")
+    serve_parser.add_argument("--bind", help="host:port to listen on (default: SERVER_BIND).")
+    serve_parser.add_argument("--workers", type=int, help="Worker processes (default: 2 x cores + 1).")
+    serve_parser.add_argument("--threads", type=int, help="Threads per worker (default: SERVER_THREADS).")
+    serve_parser.add_argument("--backend", choices=("auto", "gunicorn", "waitress"), default=None)
+    commands.add_parser("reload", help="Gracefully replace the workers of a running server (SIGHUP).")
+    return parser.parse_args(argv)
+
 # --- Main Application Execution Block ---
 if __name__ == '__main__':
+    args = parse_args()
     logger.info("INFO - JennAI Starting...")
 
+    if args.command == "reload":
+        from src.presentation.api_server.flask_app.serve import reload_server
+        try:
+            reload_server()
+        except (RuntimeError, OSError) as e:
+            logger.error(f"ERROR - Reload failed: {e}")
+            sys.exit(1)
+        sys.exit(0)
+
+    if args.command == "serve" and not os.getenv("PYTEST_RUNNING_MAIN"):
+        # The server builds (and pre-warms) the container itself before forking workers.
+        from src.presentation.api_server.flask_app.serve import serve
+        try:
+            sys.exit(serve(args.bind, args.workers, args.threads, args.backend or SERVER_BACKEND))
+        except RuntimeError as e:
+            logger.error(f"ERROR - {e}")
+            sys.exit(1)
+
+    # Imported here rather than at module level so that importing main (e.g. from
+    # tooling or tests) does not pull in the container and its service modules.
+    from core.bootstrap import get_configured_container
+
     # Get the fully configured global container from bootstrap
     global_container = get_configured_container()
 
@@ -61,9 +96,5 @@ if __name__ == '__main__':
 
     logger.info("INFO - JennAI STARTUP COMPLETE. All dependencies configured.")
 
-    # You would typically run your Flask app here, e.g.:
-    # if flask_app_instance:
-    #    flask_app_instance.run(debug=DEBUG_MODE)
-    # else:
-    #    logger.warning("WARNING - Flask app instance not available to run.")
+    # The API server is started with `python main.py serve` (see flask_app/serve.py).
     
\ No newline at end of file
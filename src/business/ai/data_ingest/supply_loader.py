@@ -2,9 +2,13 @@
 
 import sqlite3
 from config.config import DB_PATH
-from core.logging_decorator import LoggingAIDecorator
+from core.metrics import histogram, timed
+from core.tracing import traced
 
-@LoggingAIDecorator
+LOADER_SECONDS = histogram("jennai_loader_seconds", "Loader query time, by loader.", ["loader"])
+
+@traced("loader.supply")
+@timed(LOADER_SECONDS.labels(loader="supply"))
 def load_supply_data(product_id=1):
     conn = sqlite3.connect(DB_PATH)
     cursor = conn.cursor()
@@ -1,11 +1,14 @@
 # /src/business/ai/data_ingest/tariff_loader.py
 
 import sqlite3
-from . import ai_logging_decorator
 from config.config import DB_PATH
-from core.logging_decorator import LoggingAIDecorator
+from core.metrics import histogram, timed
+from core.tracing import traced
 
-@LoggingAIDecorator
+LOADER_SECONDS = histogram("jennai_loader_seconds", "Loader query time, by loader.", ["loader"])
+
+@traced("loader.tariff")
+@timed(LOADER_SECONDS.labels(loader="tariff"))
 def load_tariff_data(product_id=1):
     conn = sqlite3.connect(DB_PATH)
     cursor = conn.cursor()
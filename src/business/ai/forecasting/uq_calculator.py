@@ -2,9 +2,11 @@
 
 import sqlite3
 from config.config import DB_PATH
-from core.logging_decorator import LoggingAIDecorator
+from core.metrics import histogram, timed
+from core.tracing import traced
+
+LOADER_SECONDS = histogram("jennai_loader_seconds", "Loader query time, by loader.", ["loader"])
 
-@LoggingAIDecorator
 def calculate_uq_weights():
     return {
         "fx_volatility": 0.3,
@@ -13,7 +15,8 @@ def calculate_uq_weights():
         "news_sentiment": 0.2
     }
 
-@ai_log_call
+@traced("loader.uq")
+@timed(LOADER_SECONDS.labels(loader="uq"))
 def load_uq_data():
     conn = sqlite3.connect(DB_PATH)
     cursor = conn.cursor()
@@ -6,7 +6,7 @@
 
 from src.business.interfaces.IAIService import IAIInterface
 from src.data.interfaces.ICrudRepository import ICrudRepository # Import if needed for composition
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 class GeminiAPIService(IAIInterface): # <-- Inherits directly from IAIInterface
     """
@@ -42,6 +42,18 @@ class GeminiAPIService(IAIInterface): # <-- Inherits directly from IAIInterface
         # return {"output": response.text, "model_info": "Gemini-Pro"}
         return {"output": f"Gemini processed: {text.upper()}", "model_info": "Mock-Gemini"} # Mock response for documentation
 
+    def stream_text(self, text: str, **kwargs) -> Iterator[str]:
+        """
+        Implements streaming text processing using the Gemini API.
+        Yields chunks as the model produces them instead of waiting for the full response.
+        """
+        # Your actual Gemini streaming call goes here
+        # for chunk in self.model.generate_content(text, stream=True, **kwargs):
+        #     yield chunk.text
+        output = self.process_text(text, **kwargs)["output"] # Mock response, chunked word by word
+        for i, word in enumerate(output.split(" ")):
+            yield word if i == 0 else " " + word
+
     def generate_image(self, prompt: str, **kwargs) -> bytes:
         """
         Implements image generation using the Gemini API (if supported and configured).
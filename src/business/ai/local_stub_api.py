@@ -0,0 +1,145 @@
+# File: src/business/ai/local_stub_api.py
+
+import hashlib
+import math
+import random
+import threading
+import time
+from typing import Any, Callable, Dict, Iterator, List
+
+from config import config
+from core.lazy_import import lazy_import
+from src.business.interfaces.IAIService import IAIInterface
+
+np = lazy_import("numpy") # Only embed_text() needs numpy; don't pay its import cost at startup
+
+LATENCY_DISTRIBUTIONS = ("constant", "uniform", "normal", "lognormal", "exponential")
+
+
+class LocalStubAIError(RuntimeError):
+    """Raised by LocalStubAIService to simulate a provider-side failure."""
+    pass
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (~4 characters per token), matching typical LLM tokenizers."""
+    return max(1, len(text) // 4)
+
+
+class LocalStubAIService(IAIInterface):
+    """
+    Offline implementation of IAIInterface for load tests and benchmarks.
+
+    Behaves like a remote provider without touching the network:
+    - Each call sleeps for a base latency drawn from a configurable distribution,
+      plus a delay proportional to the number of input and output tokens.
+    - A configurable fraction of calls raise LocalStubAIError.
+    - Embeddings are deterministic: the same text always yields the same unit vector,
+      derived from a hash of the text.
+
+    Latency and error draws come from a seeded RNG, so a single-threaded run is
+    fully reproducible.
+    """
+    def __init__(self,
+                 latency_distribution: str = config.STUB_AI_LATENCY_DISTRIBUTION,
+                 latency_ms: float = config.STUB_AI_LATENCY_MS,
+                 latency_jitter_ms: float = config.STUB_AI_LATENCY_JITTER_MS,
+                 ms_per_token: float = config.STUB_AI_MS_PER_TOKEN,
+                 error_rate: float = config.STUB_AI_ERROR_RATE,
+                 embedding_dim: int = config.STUB_AI_EMBEDDING_DIM,
+                 seed: int = config.STUB_AI_SEED,
+                 sleep: Callable[[float], None] = time.sleep):
+        """
+        Args:
+            latency_distribution: One of LATENCY_DISTRIBUTIONS.
+            latency_ms: Mean base latency per call.
+            latency_jitter_ms: Spread of the base latency (std dev, or half-width for "uniform").
+            ms_per_token: Extra latency per input and output token.
+            error_rate: Probability in [0, 1] that a call raises LocalStubAIError.
+            embedding_dim: Length of vectors returned by embed_text().
+            seed: Seed for the latency/error RNG.
+            sleep: Sleep function; inject a no-op to run without real delays.
+        """
+        if latency_distribution not in LATENCY_DISTRIBUTIONS:
+            raise ValueError(f"Unknown latency distribution '{latency_distribution}'. Allowed: {LATENCY_DISTRIBUTIONS}")
+        if not 0.0 <= error_rate <= 1.0:
+            raise ValueError(f"error_rate must be between 0 and 1, got {error_rate}")
+        self.latency_distribution = latency_distribution
+        self.latency_ms = latency_ms
+        self.latency_jitter_ms = latency_jitter_ms
+        self.ms_per_token = ms_per_token
+        self.error_rate = error_rate
+        self.embedding_dim = embedding_dim
+        self._sleep = sleep
+        self._rng = random.Random(seed)
+        self._rng_lock = threading.Lock() # random.Random is not safe to share across threads
+        self.call_count = 0
+
+    # ------------------------------------------------------------------
+    # Simulation helpers
+    # ------------------------------------------------------------------
+    def _sample_latency_ms(self) -> float:
+        mean, jitter = self.latency_ms, self.latency_jitter_ms
+        with self._rng_lock:
+            if self.latency_distribution == "constant":
+                value = mean
+            elif self.latency_distribution == "uniform":
+                value = self._rng.uniform(mean - jitter, mean + jitter)
+            elif self.latency_distribution == "normal":
+                value = self._rng.gauss(mean, jitter)
+            elif self.latency_distribution == "lognormal":
+                # Parameterised so the samples have the requested mean and std dev;
+                # gives the long right tail typical of remote APIs.
+                if mean <= 0:
+                    value = 0.0
+                else:
+                    sigma2 = math.log1p((jitter / mean) ** 2)
+                    value = self._rng.lognormvariate(math.log(mean) - sigma2 / 2, math.sqrt(sigma2))
+            else:  # exponential
+                value = self._rng.expovariate(1.0 / mean) if mean > 0 else 0.0
+        return max(0.0, value)
+
+    def _simulate_call(self, operation: str, input_tokens: int, output_tokens: int = 0) -> None:
+        """Sleeps for the simulated latency and raises according to the error rate."""
+        with self._rng_lock:
+            self.call_count += 1
+            fail = self._rng.random() < self.error_rate
+        delay_ms = self._sample_latency_ms() + self.ms_per_token * (input_tokens + output_tokens)
+        self._sleep(delay_ms / 1000.0)
+        if fail:
+            raise LocalStubAIError(f"Simulated {operation} failure after {delay_ms:.1f} ms")
+
+    @staticmethod
+    def _text_seed(text: str) -> int:
+        return int.from_bytes(hashlib.blake2b(text.encode("utf-8"), digest_size=8).digest(), "little")
+
+    # ------------------------------------------------------------------
+    # IAIInterface
+    # ------------------------------------------------------------------
+    def process_text(self, text: str, **kwargs) -> Dict[str, Any]:
+        output = f"Stub processed: {text}"
+        self._simulate_call("process_text", estimate_tokens(text), estimate_tokens(output))
+        return {"output": output, "model_info": "Local-Stub"}
+
+    def stream_text(self, text: str, **kwargs) -> Iterator[str]:
+        """
+        Yields the stub output word by word. The base latency is paid before the
+        first chunk and the per-token delay between chunks, like a real stream.
+        """
+        self._simulate_call("stream_text", estimate_tokens(text))
+        words = f"Stub processed: {text}".split(" ")
+        for i, word in enumerate(words):
+            if i:
+                self._sleep(self.ms_per_token * estimate_tokens(word) / 1000.0)
+            yield word if i == 0 else " " + word
+
+    def generate_image(self, prompt: str, **kwargs) -> bytes:
+        self._simulate_call("generate_image", estimate_tokens(prompt))
+        return hashlib.sha256(prompt.encode("utf-8")).digest()
+
+    def embed_text(self, text: str, **kwargs) -> List[float]:
+        """Returns a deterministic unit vector seeded by a hash of the text."""
+        self._simulate_call("embed_text", estimate_tokens(text))
+        vector = np.random.default_rng(self._text_seed(text)).standard_normal(self.embedding_dim)
+        vector /= np.linalg.norm(vector)
+        return vector.tolist()
@@ -0,0 +1,199 @@
+# /src/business/ai/pricing_engine/score_events.py
+
+"""
+Fan-out of sourcing_scores changes to streaming clients (/api/scores/stream).
+
+Events:
+  scores        {product_id, data_version, changed: {region: scores}, removed: [region]}
+                Only the regions whose scores differ from the last published run.
+  data_version  {data_version}: scoring inputs changed; stored scores are stale.
+  resync        {}: this subscriber fell behind and events were dropped; refetch.
+
+Scoring runs in this process are published as soon as ScoreService stores
+them. Runs committed by other processes (other server workers, admin scripts)
+are picked up by a watcher thread that polls score_runs and data_version
+every SCORE_EVENTS_POLL_S while anyone is subscribed.
+
+Publishing never blocks on a slow client: each subscriber has a bounded queue,
+and one that overflows is cleared and sent a single resync event instead.
+"""
+
+import itertools
+import threading
+import time
+from collections import deque
+from typing import Deque, Dict, Iterable, List, NamedTuple, Optional, Set
+
+from loguru import logger
+
+from config import config
+from core.metrics import counter, gauge
+from src.data.implementations.sqllite.score_repository import ScoreRepository
+
+SCORE_EVENTS = counter("jennai_score_events_total", "Score change events published, by event.", ["event"])
+SCORE_EVENT_OVERFLOWS = counter("jennai_score_event_overflows_total",
+                                "Subscribers that fell behind and were sent a resync instead of their backlog.")
+SCORE_SUBSCRIBERS = gauge("jennai_score_subscribers", "Open score change subscriptions in this process.")
+
+
+class ScoreEvent(NamedTuple):
+    id: int
+    event: str
+    product_id: Optional[int] # None: applies to every product
+    data: dict
+
+
+class Subscription:
+    """One client's view of the event stream: a product filter and a bounded queue."""
+
+    def __init__(self, product_ids: Optional[Iterable[int]], max_queue: int):
+        self.product_ids: Optional[Set[int]] = set(product_ids) if product_ids else None
+        self._queue: Deque[ScoreEvent] = deque()
+        self._max_queue = max_queue
+        self._overflowed = False
+        self._ready = threading.Condition()
+
+    def wants(self, event: ScoreEvent) -> bool:
+        return self.product_ids is None or event.product_id is None or event.product_id in self.product_ids
+
+    def put(self, event: ScoreEvent) -> None:
+        with self._ready:
+            if self._overflowed:
+                return
+            if len(self._queue) >= self._max_queue:
+                self._queue.clear()
+                self._overflowed = True
+                SCORE_EVENT_OVERFLOWS.inc()
+            else:
+                self._queue.append(event)
+            self._ready.notify()
+
+    def request_resync(self) -> None:
+        with self._ready:
+            self._queue.clear()
+            self._overflowed = True
+            self._ready.notify()
+
+    def get(self, timeout: float) -> List[ScoreEvent]:
+        """Every queued event, waiting up to `timeout` seconds for one; [] on timeout."""
+        with self._ready:
+            if not self._queue and not self._overflowed:
+                self._ready.wait(timeout)
+            if self._overflowed:
+                self._overflowed = False
+                return [ScoreEvent(0, "resync", None, {})]
+            events = list(self._queue)
+            self._queue.clear()
+            return events
+
+
+class ScoreEventBroker:
+    """Publishes score deltas to subscriptions, with a short history for reconnecting clients."""
+
+    def __init__(self, repository: Optional[ScoreRepository] = None, max_queue: int = config.SCORE_EVENTS_QUEUE_SIZE,
+                 history: int = config.SCORE_EVENTS_HISTORY, poll_interval_s: float = config.SCORE_EVENTS_POLL_S):
+        self.repository = repository
+        self.max_queue = max_queue
+        self.poll_interval_s = poll_interval_s
+        self._ids = itertools.count(1)
+        self._history: Deque[ScoreEvent] = deque(maxlen=history)
+        self._subscriptions: Set[Subscription] = set()
+        self._last_scores: Dict[int, Dict[str, Dict[str, float]]] = {}
+        self._lock = threading.Lock()
+        self._watcher: Optional[threading.Thread] = None
+
+    def _dispatch(self, event: str, product_id: Optional[int], data: dict) -> ScoreEvent:
+        with self._lock:
+            published = ScoreEvent(next(self._ids), event, product_id, data)
+            self._history.append(published)
+            subscriptions = [s for s in self._subscriptions if s.wants(published)]
+        for subscription in subscriptions:
+            subscription.put(published)
+        SCORE_EVENTS.labels(event).inc()
+        return published
+
+    def publish_scores(self, product_id: int, data_version: int,
+                       scores: Dict[str, Dict[str, float]]) -> Optional[ScoreEvent]:
+        """Publishes the regions that changed since the product's last run; None if nothing did."""
+        with self._lock:
+            previous = self._last_scores.get(product_id, {})
+            self._last_scores[product_id] = scores
+        changed = {region: values for region, values in scores.items() if previous.get(region) != values}
+        removed = sorted(set(previous) - set(scores))
+        if not changed and not removed:
+            return None
+        return self._dispatch("scores", product_id, {"product_id": product_id, "data_version": data_version,
+                                                     "changed": changed, "removed": removed})
+
+    def publish_data_version(self, data_version: int) -> ScoreEvent:
+        return self._dispatch("data_version", None, {"data_version": data_version})
+
+    def subscribe(self, product_ids: Optional[Iterable[int]] = None,
+                  last_event_id: Optional[int] = None) -> Subscription:
+        """
+        A new subscription. With `last_event_id` (a reconnecting client's
+        Last-Event-ID), missed events still in the history are queued first,
+        or a resync if they cannot be replayed from here.
+        """
+        subscription = Subscription(product_ids, self.max_queue)
+        with self._lock:
+            if last_event_id is not None:
+                newest = self._history[-1].id if self._history else 0
+                # Ids are per process: one newer than ours came from another worker or a restart
+                if last_event_id > newest or (self._history and self._history[0].id > last_event_id + 1):
+                    subscription.request_resync()
+                else:
+                    for event in self._history:
+                        if event.id > last_event_id and subscription.wants(event):
+                            subscription.put(event)
+            self._subscriptions.add(subscription)
+            SCORE_SUBSCRIBERS.set(len(self._subscriptions))
+        self._ensure_watcher()
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            self._subscriptions.discard(subscription)
+            SCORE_SUBSCRIBERS.set(len(self._subscriptions))
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscriptions)
+
+    # --- Changes committed by other processes ---
+
+    def _ensure_watcher(self) -> None:
+        if self.repository is None or self.poll_interval_s <= 0:
+            return
+        with self._lock:
+            if self._watcher is not None and self._watcher.is_alive():
+                return
+            try: # Baseline taken now, so runs committed after subscribe() are published
+                baseline = (self.repository.data_version(), self.repository.score_runs())
+            except Exception as e:
+                logger.warning(f"WARNING - Score event watcher could not start: {e}")
+                return
+            self._watcher = threading.Thread(target=self._watch, args=baseline, name="score-event-watcher", daemon=True)
+            self._watcher.start()
+
+    def _watch(self, seen_version: int, seen_runs: dict) -> None:
+        """Polls the bookkeeping tables while there are subscribers; exits when the last one leaves."""
+        while True:
+            time.sleep(self.poll_interval_s)
+            with self._lock:
+                if not self._subscriptions: # Checked under the lock so subscribe() starts a new watcher
+                    self._watcher = None
+                    break
+            try:
+                version = self.repository.data_version()
+                if version != seen_version:
+                    seen_version = version
+                    self.publish_data_version(version)
+                runs = self.repository.score_runs()
+                for product_id, run in runs.items():
+                    if seen_runs.get(product_id) != run:
+                        self.publish_scores(product_id, run.data_version, self.repository.load_scores(product_id))
+                seen_runs = runs
+            except Exception as e: # A locked or briefly missing database should not end the stream
+                logger.warning(f"WARNING - Score event watcher poll failed: {e}")
+        self.repository.close()
@@ -0,0 +1,128 @@
+# /src/business/ai/pricing_engine/score_service.py
+
+import heapq
+import sqlite3
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+from loguru import logger
+
+from config import config
+from core.metrics import counter
+from src.business.ai.pricing_engine.score_events import ScoreEventBroker
+from src.business.ai.pricing_engine.scorer import score_regions
+from src.data.implementations.sqllite.score_repository import ScoreRepository
+
+SCORE_LOOKUPS = counter(
+    "jennai_score_lookups_total", "Score lookups by where they were served from (stored, computed, fallback).",
+    ["source"],
+)
+
+
+class ScoreResult(NamedTuple):
+    product_id: int
+    data_version: int
+    scores: Dict[str, Dict[str, float]] # Region name -> scores, best first
+    source: str # "stored" (sourcing_scores), "computed" (recomputed and stored) or "fallback" (not stored)
+
+
+class ScoreService:
+    """
+    Serves region scores from sourcing_scores while they are fresh: computed from
+    the current data version and younger than `max_age_s`. Stale or missing
+    scores are recomputed with score_regions() and stored; if storing fails
+    (read-only or partially created database) the computed scores are served anyway.
+    Stored runs are published to `events`, if given, for /api/scores/stream.
+    """
+    def __init__(self, repository: ScoreRepository, scorer: Callable[[int], Dict] = score_regions,
+                 max_age_s: float = config.SCORES_MAX_AGE_S, events: Optional[ScoreEventBroker] = None):
+        self.repository = repository
+        self.events = events
+        self.scorer = scorer
+        self.max_age = timedelta(seconds=max_age_s)
+        self._recompute_lock = threading.Lock() # One recompute at a time; concurrent pollers wait and then read it
+
+    def data_version(self) -> int:
+        """Current version of the scoring inputs; 0 if the bookkeeping tables cannot be created."""
+        try:
+            return self.repository.data_version()
+        except sqlite3.Error as e:
+            logger.warning(f"WARNING - Could not read the data version: {e}")
+            return 0
+
+    def cache_version(self) -> Optional[str]:
+        """Key for cached API responses (data version + latest scoring run); None if unreadable."""
+        try:
+            return self.repository.cache_version()
+        except sqlite3.Error as e:
+            logger.warning(f"WARNING - Could not read the cache version: {e}")
+            return None
+
+    def _is_fresh(self, run, data_version: int) -> bool:
+        return (run is not None and run.data_version == data_version
+                and datetime.now(timezone.utc) - run.computed_at <= self.max_age)
+
+    def needs_recompute(self, product_id: Optional[int] = None, data_version: Optional[int] = None) -> bool:
+        """
+        Whether get_scores(product_id) - or top() when product_id is None - would
+        run the scorer, so callers can throttle only the requests that do.
+        """
+        version = self.data_version() if data_version is None else data_version
+        try:
+            if product_id is not None:
+                return not self._is_fresh(self.repository.score_run(product_id), version)
+            runs = self.repository.score_runs()
+            return any(not self._is_fresh(runs.get(pid), version) for pid in self.repository.product_ids())
+        except sqlite3.Error:
+            return True # get_scores()/top() would recompute (or fail) too
+
+    def get_scores(self, product_id: int, data_version: Optional[int] = None) -> ScoreResult:
+        version = self.data_version() if data_version is None else data_version
+        try:
+            if self._is_fresh(self.repository.score_run(product_id), version):
+                SCORE_LOOKUPS.labels("stored").inc()
+                return ScoreResult(product_id, version, self.repository.load_scores(product_id), "stored")
+        except sqlite3.Error as e:
+            logger.warning(f"WARNING - Stored scores unavailable for product {product_id}: {e}")
+        return self._recompute(product_id, version)
+
+    def _recompute(self, product_id: int, version: int) -> ScoreResult:
+        with self._recompute_lock:
+            try: # Another request may have stored them while this one waited for the lock
+                if self._is_fresh(self.repository.score_run(product_id), version):
+                    SCORE_LOOKUPS.labels("stored").inc()
+                    return ScoreResult(product_id, version, self.repository.load_scores(product_id), "stored")
+            except sqlite3.Error:
+                pass
+            scores = self.scorer(product_id)
+            try:
+                self.repository.save_scores(product_id, scores, version)
+            except sqlite3.Error as e:
+                logger.warning(f"WARNING - Could not store scores for product {product_id}: {e}")
+                SCORE_LOOKUPS.labels("fallback").inc()
+                return ScoreResult(product_id, version, scores, "fallback")
+        if self.events is not None:
+            self.events.publish_scores(product_id, version, scores)
+        SCORE_LOOKUPS.labels("computed").inc()
+        return ScoreResult(product_id, version, scores, "computed")
+
+    def top(self, k: int, product_id: Optional[int] = None, data_version: Optional[int] = None) -> List[Dict[str, object]]:
+        """
+        The k best (product, region) scores. Stale products are recomputed first,
+        then the ranking is a single ORDER BY ... LIMIT over sourcing_scores.
+        """
+        version = self.data_version() if data_version is None else data_version
+        product_ids = [product_id] if product_id is not None else self.repository.product_ids()
+        runs = self.repository.score_runs()
+        recomputed = {
+            pid: self._recompute(pid, version) for pid in product_ids if not self._is_fresh(runs.get(pid), version)
+        }
+        if all(result.source != "fallback" for result in recomputed.values()):
+            return self.repository.top_scores(k, product_id)
+
+        rows = []
+        for pid in product_ids:
+            scores = recomputed[pid].scores if pid in recomputed else self.repository.load_scores(pid)
+            rows.extend(dict(product_id=pid, region=region, **values) for region, values in scores.items())
+        return heapq.nlargest(k, rows, key=lambda row: row["final_score"])
@@ -0,0 +1,295 @@
+# File: src/business/ai/routing_ai_service.py
+
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence
+
+from loguru import logger
+
+from core.metrics import histogram
+from src.business.interfaces.IAIService import IAIInterface
+
+ROUTING_POLICIES = ("latency", "cost", "balanced")
+
+
+class AllBackendsFailedError(RuntimeError):
+    """Raised when every candidate backend failed (or was unavailable) for a request."""
+    pass
+
+
+AI_CALL_SECONDS = histogram(
+    "jennai_ai_call_seconds", "AI backend call latency, by backend, operation and outcome.",
+    ["backend", "operation", "outcome"],
+)
+
+
+class BackendHealth:
+    """
+    Live health statistics for one backend, updated after every call.
+
+    Latency and error rate are exponentially weighted moving averages (EWMA), so
+    recent behaviour dominates. After `failure_threshold` consecutive failures the
+    backend's circuit opens for `cooldown_s` seconds. Once the cooldown expires the
+    circuit is half-open: try_acquire() admits a single trial request to probe for
+    recovery, and refuses others until its outcome is recorded (or, if it never is,
+    for another `cooldown_s`). Success closes the circuit; failure reopens it.
+    """
+    def __init__(self, alpha: float = 0.2, failure_threshold: int = 3, cooldown_s: float = 30.0,
+                 clock: Callable[[], float] = time.monotonic):
+        self.alpha = alpha
+        self.failure_threshold = failure_threshold
+        self.cooldown_s = cooldown_s
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.ewma_latency_s: Optional[float] = None  # None until the first call: treated optimistically
+        self.ewma_error_rate = 0.0
+        self.consecutive_failures = 0
+        self.open_until = 0.0
+        self.probe_until = 0.0  # While a half-open trial request is in flight
+        self.calls = 0
+
+    def _update_latency(self, latency_s: float) -> None:
+        if self.ewma_latency_s is None:
+            self.ewma_latency_s = latency_s
+        else:
+            self.ewma_latency_s += self.alpha * (latency_s - self.ewma_latency_s)
+
+    def record_success(self, latency_s: float) -> None:
+        with self._lock:
+            self.calls += 1
+            self._update_latency(latency_s)
+            self.ewma_error_rate += self.alpha * (0.0 - self.ewma_error_rate)
+            self.consecutive_failures = 0
+            self.open_until = 0.0
+            self.probe_until = 0.0
+
+    def record_failure(self, latency_s: float) -> None:
+        with self._lock:
+            self.calls += 1
+            self._update_latency(latency_s)
+            self.ewma_error_rate += self.alpha * (1.0 - self.ewma_error_rate)
+            self.consecutive_failures += 1
+            self.probe_until = 0.0
+            if self.consecutive_failures >= self.failure_threshold:
+                self.open_until = self._clock() + self.cooldown_s
+
+    def try_acquire(self) -> bool:
+        """
+        True if a request may be sent now: always while the circuit is closed, and
+        for exactly one caller (the probe) once an open circuit's cooldown has expired.
+        """
+        with self._lock:
+            if self.consecutive_failures < self.failure_threshold:
+                return True
+            now = self._clock()
+            if now < self.open_until or now < self.probe_until:
+                return False
+            self.probe_until = now + self.cooldown_s
+            return True
+
+    @property
+    def is_available(self) -> bool:
+        """False while the circuit is open, or half-open with its probe request in flight."""
+        now = self._clock()
+        return now >= self.open_until and now >= self.probe_until
+
+    def expected_latency_s(self) -> float:
+        """EWMA latency inflated by the error rate (expected cost of retries)."""
+        latency = self.ewma_latency_s or 0.0
+        return latency / max(1.0 - self.ewma_error_rate, 0.05)
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "ewma_latency_ms": round(self.ewma_latency_s * 1000, 3) if self.ewma_latency_s is not None else None,
+            "ewma_error_rate": round(self.ewma_error_rate, 4),
+            "consecutive_failures": self.consecutive_failures,
+            "available": self.is_available,
+            "calls": self.calls,
+        }
+
+
+@dataclass
+class AIBackend:
+    """A named IAIInterface implementation registered with the router."""
+    name: str
+    service: IAIInterface
+    cost: float = 1.0  # Relative cost per call, used by the "cost" and "balanced" policies
+    health: BackendHealth = field(default_factory=BackendHealth)
+
+
+class RoutingAIService(IAIInterface):
+    """
+    IAIInterface that routes each request to one of several backends.
+
+    - Routing: backends are ranked per request by policy:
+        "latency"  - lowest expected latency (EWMA latency inflated by error rate)
+        "cost"     - lowest cost, ties broken by expected latency
+        "balanced" - lowest expected latency x cost
+      Backends whose circuit does not admit the request (open, or half-open with
+      its probe in flight) are tried only after every admitting backend failed.
+    - Failover: if a backend raises, the request moves to the next backend in rank order.
+    - Hedging: if `hedge_after_ms` is set and the first backend has not answered by then,
+      the same request is sent to the next backend and the first successful answer wins.
+      This caps tail latency when one provider has a bad p99.
+    """
+    def __init__(self, backends: Sequence[AIBackend], policy: str = "latency",
+                 hedge_after_ms: Optional[float] = None, max_workers: int = 16):
+        if not backends:
+            raise ValueError("RoutingAIService requires at least one backend.")
+        if policy not in ROUTING_POLICIES:
+            raise ValueError(f"Unknown routing policy '{policy}'. Allowed: {ROUTING_POLICIES}")
+        self.backends: List[AIBackend] = list(backends)
+        self.policy = policy
+        self.hedge_after_ms = hedge_after_ms if hedge_after_ms and hedge_after_ms > 0 else None
+        self._max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Routing
+    # ------------------------------------------------------------------
+    def _sort_key(self, backend: AIBackend):
+        expected = backend.health.expected_latency_s()
+        if self.policy == "cost":
+            return (backend.cost, expected)
+        if self.policy == "balanced":
+            return (expected * max(backend.cost, 1e-9), backend.cost)
+        return (expected, backend.cost)
+
+    def ranked_backends(self) -> List[AIBackend]:
+        """Backends in the order they will be tried; open-circuit backends go last."""
+        ranked = sorted(self.backends, key=self._sort_key)
+        available = [b for b in ranked if b.health.is_available]
+        unavailable = [b for b in ranked if not b.health.is_available]
+        return available + unavailable
+
+    @staticmethod
+    def _take_next(remaining: List[AIBackend]) -> AIBackend:
+        """
+        Removes and returns the backend to try next: the best-ranked one whose circuit
+        admits the request or, when none does, the best-ranked one as a last resort.
+        """
+        for index, backend in enumerate(remaining):
+            if backend.health.try_acquire():
+                return remaining.pop(index)
+        return remaining.pop(0)
+
+    def health_snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Current health statistics for every backend, keyed by name."""
+        return {b.name: dict(b.health.snapshot(), cost=b.cost) for b in self.backends}
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            with self._executor_lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="ai-hedge")
+        return self._executor
+
+    def _invoke(self, backend: AIBackend, operation: str, args: tuple, kwargs: dict) -> Any:
+        """Calls one backend and records the outcome in its health statistics."""
+        started = time.perf_counter()
+        try:
+            result = getattr(backend.service, operation)(*args, **kwargs)
+        except Exception:
+            elapsed = time.perf_counter() - started
+            backend.health.record_failure(elapsed)
+            AI_CALL_SECONDS.labels(backend.name, operation, "error").observe(elapsed)
+            raise
+        elapsed = time.perf_counter() - started
+        backend.health.record_success(elapsed)
+        AI_CALL_SECONDS.labels(backend.name, operation, "ok").observe(elapsed)
+        return result
+
+    def _route(self, operation: str, *args, **kwargs) -> Any:
+        remaining = sorted(self.backends, key=self._sort_key)
+        if self.hedge_after_ms is not None and len(remaining) > 1:
+            return self._route_hedged(remaining, operation, args, kwargs)
+
+        errors = []
+        while remaining:
+            backend = self._take_next(remaining)
+            try:
+                return self._invoke(backend, operation, args, kwargs)
+            except Exception as e:
+                errors.append(f"{backend.name}: {e}")
+                logger.warning(f"AI router: {operation} failed on '{backend.name}', failing over. Error: {e}")
+        raise AllBackendsFailedError(f"All AI backends failed for {operation}: {'; '.join(errors)}")
+
+    def _route_hedged(self, remaining: List[AIBackend], operation: str, args: tuple, kwargs: dict) -> Any:
+        """
+        Starts the best backend, then launches the next one whenever the hedge delay
+        passes without an answer or the in-flight request fails. Returns the first
+        successful result; late results from losing requests are discarded.
+        """
+        executor = self._get_executor()
+        hedge_after_s = self.hedge_after_ms / 1000.0
+        pending: Dict[Future, AIBackend] = {}
+        errors = []
+
+        def launch_next() -> AIBackend:
+            backend = self._take_next(remaining)
+            pending[executor.submit(self._invoke, backend, operation, args, kwargs)] = backend
+            return backend
+
+        launch_next()
+        while pending:
+            timeout = hedge_after_s if remaining else None
+            done, _ = wait(list(pending), timeout=timeout, return_when=FIRST_COMPLETED)
+            if not done:
+                hedge = launch_next()
+                logger.debug(f"AI router: {operation} exceeded {self.hedge_after_ms} ms, hedging to '{hedge.name}'")
+                continue
+            for future in done:
+                backend = pending.pop(future)
+                try:
+                    return future.result()
+                except Exception as e:
+                    errors.append(f"{backend.name}: {e}")
+                    logger.warning(f"AI router: {operation} failed on '{backend.name}'. Error: {e}")
+            if not pending and remaining:
+                launch_next()
+        raise AllBackendsFailedError(f"All AI backends failed for {operation}: {'; '.join(errors)}")
+
+    # ------------------------------------------------------------------
+    # IAIInterface
+    # ------------------------------------------------------------------
+    def process_text(self, text: str, **kwargs) -> Dict[str, Any]:
+        return self._route("process_text", text, **kwargs)
+
+    def generate_image(self, prompt: str, **kwargs) -> bytes:
+        return self._route("generate_image", prompt, **kwargs)
+
+    def embed_text(self, text: str, **kwargs) -> List[float]:
+        return self._route("embed_text", text, **kwargs)
+
+    def stream_text(self, text: str, **kwargs) -> Iterator[str]:
+        """
+        Streams from the best available backend. Failover only happens before the
+        first chunk is yielded; once output has reached the consumer, switching
+        providers would produce a mixed response, so errors are re-raised.
+        Streams are not hedged.
+        """
+        errors = []
+        remaining = sorted(self.backends, key=self._sort_key)
+        while remaining:
+            backend = self._take_next(remaining)
+            started = time.perf_counter()
+            yielded = False
+            try:
+                for chunk in backend.service.stream_text(text, **kwargs):
+                    yielded = True
+                    yield chunk
+            except GeneratorExit:
+                raise
+            except Exception as e:
+                backend.health.record_failure(time.perf_counter() - started)
+                if yielded:
+                    raise
+                errors.append(f"{backend.name}: {e}")
+                logger.warning(f"AI router: stream_text failed on '{backend.name}' before first chunk, failing over. Error: {e}")
+                continue
+            backend.health.record_success(time.perf_counter() - started)
+            return
+        raise AllBackendsFailedError(f"All AI backends failed for stream_text: {'; '.join(errors)}")
@@ -0,0 +1 @@
+# Initializes the src.business.ai.vector_search package.
@@ -0,0 +1,528 @@
+# /src/business/ai/vector_search/ann_index.py
+
+"""
+Approximate nearest-neighbour (ANN) search over embedding vectors.
+
+Two indexes share the same search API:
+
+- ExactIndex: brute-force search. Used as the ground truth for benchmarks and
+  as the fallback for small collections.
+- IVFIndex:   inverted-file index. A k-means coarse quantizer partitions the
+  vectors into `n_lists` cells; a query only scans the `n_probe` closest cells.
+  `n_probe` is the recall/latency knob and can be changed per query.
+
+Everything runs on NumPy and the CPU; no external vector database is needed.
+"""
+
+import json
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional, Sequence, Tuple, Union
+
+import numpy as np
+from loguru import logger
+
+from config.config import ANN_N_LISTS, ANN_N_PROBE, ANN_TRAIN_SAMPLE
+
+METRICS = ("cosine", "ip", "l2")
+FORMAT_VERSION = 1
+
+# Number of rows scored per matrix multiplication when scanning large arrays.
+# Bounds the size of the temporary score matrix independently of dataset size.
+_CHUNK_ROWS = 65536
+
+ArrayLike = Union[np.ndarray, Sequence[Sequence[float]]]
+
+
+def _as_matrix(vectors: ArrayLike) -> np.ndarray:
+    """Converts input vectors to a contiguous 2-D float32 matrix."""
+    matrix = np.ascontiguousarray(vectors, dtype=np.float32)
+    if matrix.ndim == 1:
+        matrix = matrix.reshape(1, -1)
+    if matrix.ndim != 2:
+        raise ValueError(f"Expected a 2-D array of vectors, got shape {matrix.shape}")
+    return matrix
+
+
+def _as_ids(ids: Optional[Sequence[int]], count: int, start: int = 0) -> np.ndarray:
+    """Converts ids to an int64 array, defaulting to positional ids."""
+    if ids is None:
+        return np.arange(start, start + count, dtype=np.int64)
+    id_array = np.asarray(ids, dtype=np.int64).reshape(-1)
+    if id_array.shape[0] != count:
+        raise ValueError(f"Got {id_array.shape[0]} ids for {count} vectors")
+    return id_array
+
+
+def _normalize(matrix: np.ndarray) -> np.ndarray:
+    """L2-normalizes rows in place; zero vectors are left untouched."""
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    matrix /= norms
+    return matrix
+
+
+def _prepare(vectors: ArrayLike, metric: str) -> np.ndarray:
+    """Returns a private float32 copy of the vectors, normalized for cosine."""
+    matrix = np.array(_as_matrix(vectors), dtype=np.float32, copy=True)
+    if metric == "cosine":
+        _normalize(matrix)
+    return matrix
+
+
+def _similarity(queries: np.ndarray, base: np.ndarray, metric: str,
+                base_sq_norms: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Scores every query against every base vector. Higher is always better, so
+    for L2 the negated squared distance (without the constant query norm) is used.
+    """
+    scores = queries @ base.T
+    if metric == "l2":
+        if base_sq_norms is None:
+            base_sq_norms = np.einsum("ij,ij->i", base, base)
+        scores *= 2.0
+        scores -= base_sq_norms
+    return scores
+
+
+def _top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """Indices of the k highest scores of a 1-D array, best first."""
+    if k >= scores.shape[0]:
+        return np.argsort(-scores, kind="stable")
+    candidates = np.argpartition(-scores, k - 1)[:k]
+    return candidates[np.argsort(-scores[candidates], kind="stable")]
+
+
+def _merge_top_k(ids_a: np.ndarray, scores_a: np.ndarray,
+                 ids_b: np.ndarray, scores_b: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Merges two ranked result lists into one top-k list."""
+    ids = np.concatenate([ids_a, ids_b])
+    scores = np.concatenate([scores_a, scores_b])
+    order = _top_k(scores, k)
+    return ids[order], scores[order]
+
+
+def _check_metric(metric: str) -> str:
+    if metric not in METRICS:
+        raise ValueError(f"Unsupported metric '{metric}'. Allowed: {METRICS}")
+    return metric
+
+
+class ExactIndex:
+    """
+    Brute-force nearest-neighbour search. Exact, O(N) per query.
+    """
+    def __init__(self, metric: str = "cosine"):
+        self.metric = _check_metric(metric)
+        self._vectors = np.empty((0, 0), dtype=np.float32)
+        self._ids = np.empty(0, dtype=np.int64)
+        self._sq_norms: Optional[np.ndarray] = None
+
+    def __len__(self) -> int:
+        return int(self._ids.shape[0])
+
+    def build(self, vectors: ArrayLike, ids: Optional[Sequence[int]] = None) -> "ExactIndex":
+        """Replaces the indexed vectors."""
+        self._vectors = _prepare(vectors, self.metric)
+        self._ids = _as_ids(ids, self._vectors.shape[0])
+        self._sq_norms = np.einsum("ij,ij->i", self._vectors, self._vectors) if self.metric == "l2" else None
+        return self
+
+    def search(self, query: ArrayLike, k: int = 10) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns (ids, scores) of the k nearest vectors, best first.
+        """
+        ids, scores = self.search_batch(query, k)
+        return ids[0], scores[0]
+
+    def search_batch(self, queries: ArrayLike, k: int = 10) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Searches several queries at once.
+        Returns (ids, scores) arrays of shape (n_queries, k'), where k' = min(k, len(index)).
+        """
+        query_matrix = _prepare(queries, self.metric)
+        k = min(k, len(self))
+        result_ids = np.empty((query_matrix.shape[0], k), dtype=np.int64)
+        result_scores = np.empty((query_matrix.shape[0], k), dtype=np.float32)
+        if k == 0:
+            return result_ids, result_scores
+
+        for row, query in enumerate(query_matrix):
+            best_ids = np.empty(0, dtype=np.int64)
+            best_scores = np.empty(0, dtype=np.float32)
+            for start in range(0, len(self), _CHUNK_ROWS):
+                stop = start + _CHUNK_ROWS
+                norms = self._sq_norms[start:stop] if self._sq_norms is not None else None
+                scores = _similarity(query[None, :], self._vectors[start:stop], self.metric, norms)[0]
+                order = _top_k(scores, k)
+                best_ids, best_scores = _merge_top_k(best_ids, best_scores, self._ids[start:stop][order], scores[order], k)
+            result_ids[row] = best_ids
+            result_scores[row] = best_scores
+        return result_ids, result_scores
+
+
+@dataclass(frozen=True)
+class _IVFState:
+    """
+    Immutable snapshot of an IVF index. Searches read one snapshot, so a
+    background rebuild can swap in a new one without locking readers.
+
+    Vectors are stored grouped by inverted list: the rows of list `i` are
+    vectors[offsets[i]:offsets[i + 1]].
+    Vectors added since the last build live in the `pending_*` arrays and are
+    scanned exhaustively until the next rebuild folds them in.
+    """
+    centroids: np.ndarray
+    vectors: np.ndarray
+    ids: np.ndarray
+    offsets: np.ndarray
+    sq_norms: Optional[np.ndarray]
+    pending_vectors: np.ndarray
+    pending_ids: np.ndarray
+
+    @property
+    def size(self) -> int:
+        return int(self.ids.shape[0] + self.pending_ids.shape[0])
+
+
+class IVFIndex:
+    """
+    Inverted-file approximate nearest-neighbour index.
+
+    Args:
+        n_lists: Number of coarse cells. 0 derives it from the dataset size at build time.
+            Capped at the number of training vectors (each cell needs a centroid to start from).
+        n_probe: Default number of cells scanned per query (recall/latency trade-off).
+        metric: "cosine", "ip" (inner product) or "l2".
+        train_sample: Maximum number of vectors used to train the k-means quantizer.
+        n_iter: Number of k-means (Lloyd) iterations.
+        seed: Seed for sampling and centroid initialisation, making builds reproducible.
+    """
+    def __init__(self, n_lists: int = ANN_N_LISTS, n_probe: int = ANN_N_PROBE, metric: str = "cosine",
+                 train_sample: int = ANN_TRAIN_SAMPLE, n_iter: int = 20, seed: int = 0):
+        self.metric = _check_metric(metric)
+        self.n_lists = n_lists
+        self.n_probe = n_probe
+        self.train_sample = train_sample
+        self.n_iter = n_iter
+        self.seed = seed
+        self._state: Optional[_IVFState] = None
+        self._lock = threading.Lock()  # Serializes writers (add / swap); readers never take it.
+        self._rebuild_thread: Optional[threading.Thread] = None
+
+    def __len__(self) -> int:
+        state = self._state
+        return state.size if state is not None else 0
+
+    @property
+    def is_built(self) -> bool:
+        return self._state is not None and self._state.centroids.shape[0] > 0
+
+    @property
+    def is_rebuilding(self) -> bool:
+        return self._rebuild_thread is not None and self._rebuild_thread.is_alive()
+
+    @property
+    def pending_count(self) -> int:
+        """Number of vectors added since the last build (scanned exhaustively)."""
+        state = self._state
+        return int(state.pending_ids.shape[0]) if state is not None else 0
+
+    # ------------------------------------------------------------------
+    # Building
+    # ------------------------------------------------------------------
+    def build(self, vectors: ArrayLike, ids: Optional[Sequence[int]] = None) -> "IVFIndex":
+        """
+        Trains the quantizer and builds the index synchronously, replacing any
+        previous contents.
+        """
+        matrix = _prepare(vectors, self.metric)
+        id_array = _as_ids(ids, matrix.shape[0])
+        new_state = self._build_state(matrix, id_array)
+        with self._lock:
+            self._state = new_state
+        return self
+
+    def add(self, vectors: ArrayLike, ids: Optional[Sequence[int]] = None) -> None:
+        """
+        Adds vectors without retraining. They are searchable immediately through
+        an exhaustive scan of the pending buffer; call rebuild_async() to fold
+        them into the inverted lists once the buffer grows.
+        """
+        matrix = _prepare(vectors, self.metric)
+        with self._lock:
+            state = self._state or self._empty_state(matrix.shape[1])
+            id_array = _as_ids(ids, matrix.shape[0], start=state.size)
+            if state.vectors.shape[1] and matrix.shape[1] != state.vectors.shape[1]:
+                raise ValueError(f"Vector dimension {matrix.shape[1]} does not match index dimension {state.vectors.shape[1]}")
+            self._state = _IVFState(
+                centroids=state.centroids,
+                vectors=state.vectors,
+                ids=state.ids,
+                offsets=state.offsets,
+                sq_norms=state.sq_norms,
+                pending_vectors=np.concatenate([state.pending_vectors, matrix]) if state.pending_ids.size else matrix,
+                pending_ids=np.concatenate([state.pending_ids, id_array]),
+            )
+
+    def rebuild_async(self) -> threading.Thread:
+        """
+        Retrains and rebuilds the index from all current vectors on a background
+        thread. Searches keep using the old snapshot until the new one is swapped
+        in; vectors added during the rebuild are carried over as pending.
+        Returns the worker thread (already started).
+        """
+        with self._lock:
+            if self.is_rebuilding:
+                return self._rebuild_thread
+            snapshot = self._state
+            if snapshot is None:
+                raise RuntimeError("Cannot rebuild an empty index. Call build() or add() first.")
+            thread = threading.Thread(target=self._rebuild_from, args=(snapshot,), name="ivf-rebuild", daemon=True)
+            self._rebuild_thread = thread
+        thread.start()
+        return thread
+
+    def wait_for_rebuild(self, timeout: Optional[float] = None) -> bool:
+        """Blocks until a running background rebuild finishes. Returns False on timeout."""
+        thread = self._rebuild_thread
+        if thread is None:
+            return True
+        thread.join(timeout)
+        return not thread.is_alive()
+
+    def _rebuild_from(self, snapshot: _IVFState) -> None:
+        try:
+            matrix = np.concatenate([snapshot.vectors, snapshot.pending_vectors]) if snapshot.pending_ids.size else snapshot.vectors
+            id_array = np.concatenate([snapshot.ids, snapshot.pending_ids])
+            new_state = self._build_state(matrix, id_array)
+            with self._lock:
+                # Keep anything added after the snapshot was taken.
+                current = self._state
+                carried = snapshot.pending_ids.shape[0]
+                self._state = _IVFState(
+                    centroids=new_state.centroids,
+                    vectors=new_state.vectors,
+                    ids=new_state.ids,
+                    offsets=new_state.offsets,
+                    sq_norms=new_state.sq_norms,
+                    pending_vectors=current.pending_vectors[carried:],
+                    pending_ids=current.pending_ids[carried:],
+                )
+        except Exception as e:
+            logger.error(f"IVF background rebuild failed: {e}")
+
+    def _empty_state(self, dim: int) -> _IVFState:
+        return _IVFState(
+            centroids=np.empty((0, dim), dtype=np.float32),
+            vectors=np.empty((0, dim), dtype=np.float32),
+            ids=np.empty(0, dtype=np.int64),
+            offsets=np.zeros(1, dtype=np.int64),
+            sq_norms=None,
+            pending_vectors=np.empty((0, dim), dtype=np.float32),
+            pending_ids=np.empty(0, dtype=np.int64),
+        )
+
+    def _resolve_n_lists(self, count: int) -> int:
+        n_lists = self.n_lists if self.n_lists > 0 else int(4 * np.sqrt(count))
+        trained_on = min(count, self.train_sample) if self.train_sample > 0 else count
+        return int(max(1, min(n_lists, trained_on)))
+
+    def _build_state(self, matrix: np.ndarray, id_array: np.ndarray) -> _IVFState:
+        started = time.perf_counter()
+        if matrix.shape[0] == 0:
+            return self._empty_state(matrix.shape[1])
+
+        n_lists = self._resolve_n_lists(matrix.shape[0])
+        centroids = self._train(matrix, n_lists)
+        assignments = self._assign(matrix, centroids)
+
+        order = np.argsort(assignments, kind="stable")
+        counts = np.bincount(assignments, minlength=n_lists)
+        offsets = np.zeros(n_lists + 1, dtype=np.int64)
+        np.cumsum(counts, out=offsets[1:])
+
+        vectors = np.ascontiguousarray(matrix[order])
+        sq_norms = np.einsum("ij,ij->i", vectors, vectors) if self.metric == "l2" else None
+        logger.debug(f"IVF index built: {matrix.shape[0]} vectors, {n_lists} lists, "
+                     f"{time.perf_counter() - started:.3f}s")
+        return _IVFState(
+            centroids=centroids,
+            vectors=vectors,
+            ids=id_array[order],
+            offsets=offsets,
+            sq_norms=sq_norms,
+            pending_vectors=np.empty((0, matrix.shape[1]), dtype=np.float32),
+            pending_ids=np.empty(0, dtype=np.int64),
+        )
+
+    def _assign(self, matrix: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+        """Nearest centroid for every row, computed in bounded-memory chunks."""
+        quantizer_metric = "l2" if self.metric == "l2" else "ip"
+        centroid_norms = np.einsum("ij,ij->i", centroids, centroids) if quantizer_metric == "l2" else None
+        assignments = np.empty(matrix.shape[0], dtype=np.int64)
+        for start in range(0, matrix.shape[0], _CHUNK_ROWS):
+            chunk = matrix[start:start + _CHUNK_ROWS]
+            assignments[start:start + chunk.shape[0]] = np.argmax(
+                _similarity(chunk, centroids, quantizer_metric, centroid_norms), axis=1
+            )
+        return assignments
+
+    def _train(self, matrix: np.ndarray, n_lists: int) -> np.ndarray:
+        """Lloyd's k-means on a sample (spherical k-means for cosine/ip)."""
+        rng = np.random.default_rng(self.seed)
+        sample = matrix
+        if matrix.shape[0] > self.train_sample > 0:
+            sample = matrix[rng.choice(matrix.shape[0], self.train_sample, replace=False)]
+
+        centroids = sample[rng.choice(sample.shape[0], n_lists, replace=False)].copy()
+        for _ in range(self.n_iter):
+            assignments = self._assign(sample, centroids)
+            counts = np.bincount(assignments, minlength=n_lists)
+            # Sort once and sum contiguous runs; much faster than np.add.at for large samples.
+            order = np.argsort(assignments, kind="stable")
+            starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+            occupied = counts > 0
+            sums = np.zeros_like(centroids)
+            sums[occupied] = np.add.reduceat(sample[order], starts[occupied], axis=0)
+
+            empty = counts == 0
+            if empty.any():
+                # Re-seed empty cells with random sample points.
+                sums[empty] = sample[rng.choice(sample.shape[0], int(empty.sum()), replace=False)]
+                counts[empty] = 1
+            centroids = (sums / counts[:, None]).astype(np.float32)
+            if self.metric != "l2":
+                _normalize(centroids)
+        return centroids
+
+    # ------------------------------------------------------------------
+    # Searching
+    # ------------------------------------------------------------------
+    def search(self, query: ArrayLike, k: int = 10, n_probe: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns (ids, scores) of the approximate k nearest vectors, best first.
+
+        Args:
+            query: A single vector.
+            k: Number of neighbours to return.
+            n_probe: Cells to scan for this query; defaults to the index's n_probe.
+        """
+        ids, scores = self.search_batch(query, k, n_probe)
+        return ids[0], scores[0]
+
+    def search_batch(self, queries: ArrayLike, k: int = 10,
+                     n_probe: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Searches several queries against one consistent snapshot of the index.
+        Returns (ids, scores) arrays of shape (n_queries, k'), where k' = min(k, len(index)).
+        """
+        state = self._state
+        query_matrix = _prepare(queries, self.metric)
+        k = min(k, state.size if state is not None else 0)
+        result_ids = np.empty((query_matrix.shape[0], k), dtype=np.int64)
+        result_scores = np.empty((query_matrix.shape[0], k), dtype=np.float32)
+        if k == 0:
+            return result_ids, result_scores
+
+        n_lists = state.centroids.shape[0]
+        probe = min(n_probe or self.n_probe, n_lists)
+        quantizer_metric = "l2" if self.metric == "l2" else "ip"
+        centroid_scores = _similarity(query_matrix, state.centroids, quantizer_metric) if n_lists else None
+
+        for row, query in enumerate(query_matrix):
+            best_ids = np.empty(0, dtype=np.int64)
+            best_scores = np.empty(0, dtype=np.float32)
+
+            if n_lists:
+                cells = _top_k(centroid_scores[row], probe)
+                rows = np.concatenate([np.arange(state.offsets[c], state.offsets[c + 1]) for c in cells])
+                if rows.size:
+                    norms = state.sq_norms[rows] if state.sq_norms is not None else None
+                    scores = _similarity(query[None, :], state.vectors[rows], self.metric, norms)[0]
+                    order = _top_k(scores, k)
+                    best_ids, best_scores = state.ids[rows][order], scores[order]
+
+            if state.pending_ids.size:
+                scores = _similarity(query[None, :], state.pending_vectors, self.metric)[0]
+                order = _top_k(scores, k)
+                best_ids, best_scores = _merge_top_k(best_ids, best_scores, state.pending_ids[order], scores[order], k)
+
+            found = best_ids.shape[0]
+            result_ids[row, :found] = best_ids
+            result_scores[row, :found] = best_scores
+            if found < k:
+                # Fewer candidates than k in the probed cells: pad with sentinels.
+                result_ids[row, found:] = -1
+                result_scores[row, found:] = -np.inf
+        return result_ids, result_scores
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+    def save(self, path: Union[str, Path]) -> Path:
+        """
+        Saves the index (including pending vectors) to a single .npz file.
+        Returns the path written.
+        """
+        state = self._state
+        if state is None:
+            raise RuntimeError("Cannot save an empty index.")
+        path = Path(path)
+        if path.suffix != ".npz":
+            path = path.with_suffix(".npz")
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        meta = {
+            "format_version": FORMAT_VERSION,
+            "metric": self.metric,
+            "n_lists": self.n_lists,
+            "n_probe": self.n_probe,
+            "train_sample": self.train_sample,
+            "n_iter": self.n_iter,
+            "seed": self.seed,
+        }
+        tmp_path = path.with_suffix(".tmp.npz")
+        np.savez(
+            tmp_path,
+            meta=np.array(json.dumps(meta)),
+            centroids=state.centroids,
+            vectors=state.vectors,
+            ids=state.ids,
+            offsets=state.offsets,
+            pending_vectors=state.pending_vectors,
+            pending_ids=state.pending_ids,
+        )
+        tmp_path.replace(path)  # Atomic on the same filesystem; readers never see a partial file.
+        logger.info(f"IVF index saved to {path} ({state.size} vectors)")
+        return path
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "IVFIndex":
+        """Loads an index previously written by save()."""
+        with np.load(Path(path), allow_pickle=False) as data:
+            meta = json.loads(str(data["meta"]))
+            if meta.get("format_version") != FORMAT_VERSION:
+                raise ValueError(f"Unsupported index format version: {meta.get('format_version')}")
+            index = cls(
+                n_lists=meta["n_lists"],
+                n_probe=meta["n_probe"],
+                metric=meta["metric"],
+                train_sample=meta["train_sample"],
+                n_iter=meta["n_iter"],
+                seed=meta["seed"],
+            )
+            vectors = data["vectors"]
+            index._state = _IVFState(
+                centroids=data["centroids"],
+                vectors=vectors,
+                ids=data["ids"],
+                offsets=data["offsets"],
+                sq_norms=np.einsum("ij,ij->i", vectors, vectors) if index.metric == "l2" else None,
+                pending_vectors=data["pending_vectors"],
+                pending_ids=data["pending_ids"],
+            )
+        logger.info(f"IVF index loaded from {path} ({len(index)} vectors)")
+        return index
@@ -1,7 +1,7 @@
 # File: src/business/interfaces/IAIInterface.py
 
 import abc
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 class IAIInterface(abc.ABC):
     """
@@ -34,4 +34,12 @@ class IAIInterface(abc.ABC):
         """
         pass
 
+    def stream_text(self, text: str, **kwargs) -> Iterator[str]:
+        """
+        Processes text and yields the output in chunks as they become available.
+        Providers with native streaming should override this. The default falls back
+        to process_text() and yields its whole output as a single chunk.
+        """
+        yield str(self.process_text(text, **kwargs).get("output", ""))
+
     # Add other common AI operations as abstract methods here
\ No newline at end of file
@@ -0,0 +1,62 @@
+import numpy as np
+import pytest
+
+from src.business.ai.vector_search.ann_index import ExactIndex, IVFIndex
+from src.business.ai.vector_search.benchmark import make_clustered_dataset, recall_at_k
+
+
+@pytest.fixture(scope="module")
+def dataset():
+    return make_clustered_dataset(5000, 32, n_clusters=50, seed=7)
+
+
+@pytest.fixture(scope="module")
+def queries():
+    return make_clustered_dataset(50, 32, n_clusters=50, seed=8)
+
+
+@pytest.mark.parametrize("metric", ["cosine", "ip", "l2"])
+def test_full_probe_matches_exact_search(dataset, queries, metric):
+    """Probing every cell must reproduce exact search results."""
+    exact_ids, _ = ExactIndex(metric=metric).build(dataset).search_batch(queries, 10)
+    ivf = IVFIndex(n_lists=16, metric=metric).build(dataset)
+    ivf_ids, _ = ivf.search_batch(queries, 10, n_probe=16)
+    assert recall_at_k(ivf_ids, exact_ids) == pytest.approx(1.0)
+
+
+def test_recall_increases_with_n_probe(dataset, queries):
+    exact_ids, _ = ExactIndex().build(dataset).search_batch(queries, 10)
+    ivf = IVFIndex(n_lists=64).build(dataset)
+    low = recall_at_k(ivf.search_batch(queries, 10, n_probe=1)[0], exact_ids)
+    high = recall_at_k(ivf.search_batch(queries, 10, n_probe=16)[0], exact_ids)
+    assert high >= low
+    assert high > 0.9
+
+
+def test_added_vectors_are_searchable_before_and_after_rebuild(dataset):
+    ivf = IVFIndex(n_lists=16).build(dataset)
+    extra = np.full((1, dataset.shape[1]), 5.0, dtype=np.float32)
+    ivf.add(extra, ids=[99999])
+    assert ivf.pending_count == 1
+    assert ivf.search(extra[0], k=1)[0][0] == 99999
+
+    ivf.rebuild_async()
+    assert ivf.wait_for_rebuild(timeout=30)
+    assert ivf.pending_count == 0
+    assert len(ivf) == dataset.shape[0] + 1
+    assert ivf.search(extra[0], k=1, n_probe=16)[0][0] == 99999
+
+
+def test_n_lists_is_capped_at_the_training_sample(dataset, queries):
+    ivf = IVFIndex(n_lists=300, train_sample=200).build(dataset)
+    assert ivf._state.centroids.shape[0] == 200
+    ids, _ = ivf.search(queries[0], k=5, n_probe=200)
+    assert len(ids) == 5
+
+
+def test_save_and_load_round_trip(tmp_path, dataset, queries):
+    ivf = IVFIndex(n_lists=16, n_probe=4).build(dataset, ids=np.arange(dataset.shape[0]) + 1000)
+    path = ivf.save(tmp_path / "index")
+    loaded = IVFIndex.load(path)
+    assert loaded.n_probe == 4
+    np.testing.assert_array_equal(ivf.search_batch(queries, 5)[0], loaded.search_batch(queries, 5)[0])
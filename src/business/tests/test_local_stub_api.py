@@ -0,0 +1,35 @@
+import pytest
+
+from src.business.ai.local_stub_api import LocalStubAIError, LocalStubAIService
+
+
+def _no_sleep(seconds):
+    pass
+
+
+def test_embeddings_are_deterministic_unit_vectors():
+    service = LocalStubAIService(embedding_dim=16, sleep=_no_sleep)
+    first = service.embed_text("cotton t-shirt, Vietnam")
+    assert first == LocalStubAIService(embedding_dim=16, seed=1, sleep=_no_sleep).embed_text("cotton t-shirt, Vietnam")
+    assert first != service.embed_text("cotton t-shirt, Mexico")
+    assert sum(v * v for v in first) == pytest.approx(1.0)
+
+
+def test_latency_is_base_plus_token_proportional_delay():
+    delays = []
+    service = LocalStubAIService(latency_distribution="constant", latency_ms=100, ms_per_token=2, sleep=delays.append)
+    service.embed_text("x" * 40)  # 10 tokens
+    assert delays == [pytest.approx(0.12)]
+
+
+def test_error_rate_is_applied():
+    always = LocalStubAIService(error_rate=1.0, sleep=_no_sleep)
+    with pytest.raises(LocalStubAIError):
+        always.process_text("hello")
+    never = LocalStubAIService(error_rate=0.0, sleep=_no_sleep)
+    assert never.process_text("hello")["model_info"] == "Local-Stub"
+
+
+def test_stream_text_yields_chunks_matching_process_text():
+    service = LocalStubAIService(sleep=_no_sleep)
+    assert "".join(service.stream_text("a b c")) == service.process_text("a b c")["output"]
@@ -0,0 +1,96 @@
+import threading
+import time
+
+import pytest
+
+from src.business.ai.local_stub_api import LocalStubAIService
+from src.business.ai.routing_ai_service import AIBackend, AllBackendsFailedError, BackendHealth, RoutingAIService
+
+
+def _stub(latency_ms=0.0, error_rate=0.0):
+    return LocalStubAIService(latency_distribution="constant", latency_ms=latency_ms, ms_per_token=0, error_rate=error_rate)
+
+
+def test_fails_over_to_next_backend():
+    broken = AIBackend("broken", _stub(error_rate=1.0), cost=0.0)
+    healthy = AIBackend("healthy", _stub(), cost=1.0)
+    router = RoutingAIService([broken, healthy], policy="cost")
+    assert router.process_text("hi")["model_info"] == "Local-Stub"
+    assert router.health_snapshot()["broken"]["consecutive_failures"] == 1
+
+
+def test_open_circuit_backend_is_tried_last():
+    broken = AIBackend("broken", _stub(error_rate=1.0), cost=0.0, health=BackendHealth(failure_threshold=1, cooldown_s=60))
+    healthy = AIBackend("healthy", _stub(), cost=1.0)
+    router = RoutingAIService([broken, healthy], policy="cost")
+    router.embed_text("hi")
+    assert [b.name for b in router.ranked_backends()] == ["healthy", "broken"]
+
+
+def test_latency_policy_prefers_faster_backend():
+    slow = AIBackend("slow", _stub(latency_ms=20))
+    fast = AIBackend("fast", _stub(latency_ms=1))
+    router = RoutingAIService([slow, fast], policy="latency")
+    for _ in range(3):
+        router.embed_text("hi")
+    assert router.ranked_backends()[0].name == "fast"
+
+
+def test_hedged_request_caps_tail_latency():
+    slow = AIBackend("slow", _stub(latency_ms=1000), cost=0.0)
+    fast = AIBackend("fast", _stub(latency_ms=1), cost=1.0)
+    router = RoutingAIService([slow, fast], policy="cost", hedge_after_ms=20)
+    started = time.perf_counter()
+    router.process_text("hi")
+    assert time.perf_counter() - started < 0.5
+
+
+def test_raises_when_all_backends_fail():
+    router = RoutingAIService([AIBackend("a", _stub(error_rate=1.0)), AIBackend("b", _stub(error_rate=1.0))])
+    with pytest.raises(AllBackendsFailedError):
+        router.process_text("hi")
+    with pytest.raises(AllBackendsFailedError):
+        "".join(router.stream_text("hi"))
+
+
+def test_half_open_circuit_admits_a_single_probe():
+    now = [0.0]
+    health = BackendHealth(failure_threshold=1, cooldown_s=10, clock=lambda: now[0])
+    health.record_failure(0.01)
+    assert not health.try_acquire() and not health.is_available  # Open
+    now[0] = 10.0
+    assert health.try_acquire()  # Half-open: the probe
+    assert not health.try_acquire() and not health.is_available  # Concurrent requests are refused
+    health.record_failure(0.01)
+    now[0] = 20.0
+    assert health.try_acquire() and not health.try_acquire()  # Reopened, then one new probe
+    health.record_success(0.01)
+    assert health.try_acquire() and health.try_acquire()  # Closed
+
+
+def test_concurrent_requests_send_one_probe_to_a_half_open_backend():
+    calls, release = [], threading.Event()
+
+    class Recovering(LocalStubAIService):
+        def embed_text(self, text, **kwargs):
+            calls.append(text)
+            release.wait(5)
+            return [1.0]
+
+    now = [0.0]
+    health = BackendHealth(failure_threshold=1, cooldown_s=10, clock=lambda: now[0])
+    health.record_failure(0.01)
+    now[0] = 10.0  # Cooldown expired: half-open
+    recovering = AIBackend("recovering", Recovering(latency_distribution="constant", latency_ms=0, ms_per_token=0),
+                           cost=0.0, health=health)
+    router = RoutingAIService([recovering, AIBackend("healthy", _stub(), cost=1.0)], policy="cost")
+
+    probe = threading.Thread(target=router.embed_text, args=("probe",))
+    probe.start()
+    while not calls:
+        time.sleep(0.001)
+    for i in range(3):  # While the probe is in flight
+        assert router.embed_text(f"r{i}") == router.backends[1].service.embed_text(f"r{i}")
+    release.set()
+    probe.join(5)
+    assert calls == ["probe"] and health.is_available  # The probe succeeded and closed the circuit
@@ -0,0 +1,197 @@
+# /src/data/implementations/sqllite/export.py
+
+"""
+Bounded-memory bulk export of the scoring tables to CSV or Parquet.
+
+Rows are read in keyset-paginated chunks (WHERE id > ? ORDER BY id LIMIT n),
+so memory is one chunk whatever the table size, no read transaction is held
+open between chunks, and an interrupted export resumes from the last id it
+delivered. The upper id bound is fixed when an export starts (until_id) and is
+passed back on resume, so rows inserted after the first attempt are left out.
+
+That only makes a resumed export match the first attempt for tables whose rows
+keep their ids. `scores` is not resume-stable: save_scores replaces a product's
+sourcing_scores rows with newly numbered ones, so a product rescored between
+attempts is missing from the resumed part (its old ids are gone and its new ids
+lie above until_id). Restart score exports rather than resuming them.
+
+Parquet requires pyarrow; rows are buffered up to one row group
+(EXPORT_PARQUET_ROW_GROUP_ROWS) at a time.
+"""
+
+import csv
+import io
+import sqlite3
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple
+
+from config.config import DB_PATH, EXPORT_CHUNK_ROWS, EXPORT_PARQUET_ROW_GROUP_ROWS
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError: # Optional: CSV exports work without it
+    pa = pq = None
+
+EXPORT_FORMATS = ("csv", "parquet")
+
+
+@dataclass(frozen=True)
+class ExportDataset:
+    table: str
+    columns: Tuple[str, ...]
+    time_column: Optional[str] = None # Filtered by since/until; None for reference tables
+
+
+DATASETS = {
+    # Not resume-stable: rescoring a product deletes its rows and inserts new ids (see module docstring)
+    "scores": ExportDataset("sourcing_scores", ("id", "product_id", "region_id", "policy_score", "currency_score",
+                                                "supply_score", "uq", "final_score", "timestamp"), "timestamp"),
+    "fx": ExportDataset("currency_data", ("id", "region_id", "currency_code", "rate_to_usd", "volatility",
+                                          "timestamp", "source_id"), "timestamp"),
+    "supply": ExportDataset("supply_data", ("id", "product_id", "region_id", "availability_score",
+                                            "avg_shipping_time_days", "delay_index", "timestamp", "source_id"),
+                            "timestamp"),
+    "tariffs": ExportDataset("tariff_data", ("id", "product_id", "region_id", "tariff_percent", "effective_date",
+                                             "source_id"), "effective_date"),
+    "risk": ExportDataset("risk_signals", ("id", "region_id", "fx_volatility", "political_instability",
+                                           "supply_disruption", "news_sentiment", "calculated_uq", "timestamp"),
+                          "timestamp"),
+    "regions": ExportDataset("regions", ("id", "name", "iso_code", "group_name")),
+    "products": ExportDataset("products", ("id", "name", "hs_code", "description")),
+}
+
+
+@dataclass(frozen=True)
+class ExportRange:
+    """Rows with after_id < id <= until_id, optionally within [since, until) on the dataset's time column."""
+    after_id: int = 0
+    until_id: Optional[int] = None
+    since: Optional[str] = None
+    until: Optional[str] = None
+
+
+def connect_read_only(db_path: Path = DB_PATH) -> sqlite3.Connection:
+    """A connection of its own per export: read-only, usable from the thread that streams the response."""
+    return sqlite3.connect(f"{Path(db_path).resolve().as_uri()}?mode=ro", uri=True, check_same_thread=False)
+
+
+def max_id(conn: sqlite3.Connection, dataset: ExportDataset) -> int:
+    return conn.execute(f"SELECT COALESCE(MAX(id), 0) FROM {dataset.table}").fetchone()[0]
+
+
+def pin_range(conn: sqlite3.Connection, dataset: ExportDataset, export_range: ExportRange) -> ExportRange:
+    """Fixes until_id to the current maximum if unset, so rows added mid-export are left out consistently."""
+    if export_range.until_id is not None:
+        return export_range
+    return ExportRange(export_range.after_id, max_id(conn, dataset), export_range.since, export_range.until)
+
+
+def iter_chunks(conn: sqlite3.Connection, dataset: ExportDataset, export_range: ExportRange,
+                chunk_rows: int = EXPORT_CHUNK_ROWS) -> Iterator[List[tuple]]:
+    """Lists of at most `chunk_rows` rows in id order; the first column is always id."""
+    where, params = ["id > ?"], []
+    if export_range.until_id is not None:
+        where.append("id <= ?")
+        params.append(export_range.until_id)
+    if dataset.time_column and export_range.since:
+        where.append(f"{dataset.time_column} >= ?")
+        params.append(export_range.since)
+    if dataset.time_column and export_range.until:
+        where.append(f"{dataset.time_column} < ?")
+        params.append(export_range.until)
+    sql = (f"SELECT {', '.join(dataset.columns)} FROM {dataset.table} "
+           f"WHERE {' AND '.join(where)} ORDER BY id LIMIT ?")
+
+    last_id = export_range.after_id
+    while True:
+        rows = conn.execute(sql, (last_id, *params, chunk_rows)).fetchall()
+        if not rows:
+            return
+        yield rows
+        last_id = rows[-1][0]
+        if len(rows) < chunk_rows:
+            return
+
+
+def iter_csv(conn: sqlite3.Connection, dataset: ExportDataset, export_range: ExportRange,
+             chunk_rows: int = EXPORT_CHUNK_ROWS, header: bool = True) -> Iterator[bytes]:
+    """UTF-8 CSV, one bytes block per chunk (the header, if any, is the first block)."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    if header:
+        writer.writerow(dataset.columns)
+    for rows in iter_chunks(conn, dataset, export_range, chunk_rows):
+        writer.writerows(rows)
+        yield buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell(): # Header of an empty export
+        yield buffer.getvalue().encode("utf-8")
+
+
+class _DrainableSink(io.RawIOBase):
+    """A write-only file for ParquetWriter whose contents are handed out (and freed) after each row group."""
+
+    def __init__(self):
+        super().__init__()
+        self._chunks: List[bytes] = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        data, self._chunks = b"".join(self._chunks), []
+        return data
+
+
+def _arrow_schema(conn: sqlite3.Connection, dataset: ExportDataset):
+    """Arrow types from the declared SQLite column types."""
+    declared = {row[1]: (row[2] or "").upper() for row in conn.execute(f"PRAGMA table_info({dataset.table})")}
+
+    def arrow_type(column: str):
+        if column == "id" or "INT" in declared.get(column, ""):
+            return pa.int64()
+        if any(t in declared.get(column, "") for t in ("REAL", "FLOA", "DOUB")):
+            return pa.float64()
+        return pa.string()
+
+    return pa.schema([(column, arrow_type(column)) for column in dataset.columns])
+
+
+def iter_parquet(conn: sqlite3.Connection, dataset: ExportDataset, export_range: ExportRange,
+                 chunk_rows: int = EXPORT_CHUNK_ROWS,
+                 row_group_rows: int = EXPORT_PARQUET_ROW_GROUP_ROWS) -> Iterator[bytes]:
+    """A Parquet file, emitted one row group at a time (the footer comes last)."""
+    if pq is None:
+        raise RuntimeError("Parquet export requires pyarrow (`pip install pyarrow`).")
+    schema = _arrow_schema(conn, dataset)
+    sink = _DrainableSink()
+    writer = pq.ParquetWriter(sink, schema, compression="zstd")
+    pending: List[tuple] = []
+
+    def flush():
+        columns = list(zip(*pending))
+        writer.write_table(pa.Table.from_arrays(
+            [pa.array(column, type=field.type) for column, field in zip(columns, schema)], schema=schema))
+        pending.clear()
+
+    for rows in iter_chunks(conn, dataset, export_range, chunk_rows):
+        pending.extend(rows)
+        if len(pending) >= row_group_rows:
+            flush()
+            yield sink.drain()
+    if pending:
+        flush()
+    writer.close()
+    yield sink.drain()
@@ -0,0 +1,77 @@
+# /src/data/implementations/sqllite/reference_lookups.py
+
+import sqlite3
+from dataclasses import dataclass
+from pathlib import Path
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional
+
+from loguru import logger
+
+from config.config import DB_PATH
+
+
+@dataclass(frozen=True)
+class Region:
+    id: int
+    name: str
+    iso_code: Optional[str]
+    group_name: Optional[str]
+
+
+@dataclass(frozen=True)
+class Product:
+    id: int
+    name: str
+    hs_code: Optional[str]
+    description: Optional[str]
+
+
+class ReferenceLookups:
+    """
+    Read-only region and product reference data, loaded once.
+
+    The data is immutable and holds no open connection, so it is safe to build
+    in a parent process before forking workers: children share the pages
+    copy-on-write instead of each querying the database at startup.
+    """
+    def __init__(self, regions: Mapping[int, Region], products: Mapping[int, Product]):
+        self.regions: Mapping[int, Region] = MappingProxyType(dict(regions))
+        self.products: Mapping[int, Product] = MappingProxyType(dict(products))
+        self._regions_by_iso: Mapping[str, Region] = MappingProxyType(
+            {region.iso_code.upper(): region for region in self.regions.values() if region.iso_code}
+        )
+        self._regions_by_name: Mapping[str, Region] = MappingProxyType(
+            {region.name: region for region in self.regions.values()}
+        )
+
+    @classmethod
+    def from_database(cls, db_path: Path = DB_PATH) -> "ReferenceLookups":
+        """Loads regions and products; returns empty lookups if the database has not been created yet."""
+        if not Path(db_path).exists():
+            logger.warning(f"WARNING - Database not found at {db_path}; reference lookups are empty.")
+            return cls({}, {})
+        conn = sqlite3.connect(db_path)
+        try:
+            regions: Dict[int, Region] = {
+                row[0]: Region(*row) for row in conn.execute("SELECT id, name, iso_code, group_name FROM regions")
+            }
+            products: Dict[int, Product] = {
+                row[0]: Product(*row) for row in conn.execute("SELECT id, name, hs_code, description FROM products")
+            }
+        finally:
+            conn.close()
+        logger.debug(f"DEBUG - Loaded {len(regions)} regions and {len(products)} products from {db_path}")
+        return cls(regions, products)
+
+    def region(self, region_id: int) -> Optional[Region]:
+        return self.regions.get(region_id)
+
+    def region_by_iso(self, iso_code: str) -> Optional[Region]:
+        return self._regions_by_iso.get(iso_code.upper())
+
+    def region_by_name(self, name: str) -> Optional[Region]:
+        return self._regions_by_name.get(name)
+
+    def product(self, product_id: int) -> Optional[Product]:
+        return self.products.get(product_id)
@@ -0,0 +1,172 @@
+# /src/data/implementations/sqllite/score_repository.py
+
+import sqlite3
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from loguru import logger
+
+from config.config import DB_PATH
+from src.data.implementations.sqllite.reference_lookups import ReferenceLookups
+
+# Bookkeeping tables, created on first use so existing databases need no migration.
+#   data_version - a single counter, bumped whenever scoring inputs change (seeding, imports)
+#   score_runs   - which data version each product's rows in sourcing_scores were computed from
+_DATA_VERSION_SQL = (
+    """CREATE TABLE IF NOT EXISTS data_version (
+        id INTEGER PRIMARY KEY CHECK (id = 1),
+        version INTEGER NOT NULL,
+        updated_at TIMESTAMP
+    )""",
+    "INSERT OR IGNORE INTO data_version (id, version, updated_at) VALUES (1, 0, NULL)",
+)
+_BOOKKEEPING_SQL = _DATA_VERSION_SQL + (
+    """CREATE TABLE IF NOT EXISTS score_runs (
+        product_id INTEGER PRIMARY KEY,
+        data_version INTEGER NOT NULL,
+        computed_at TIMESTAMP NOT NULL
+    )""",
+    "CREATE INDEX IF NOT EXISTS idx_sourcing_scores_product ON sourcing_scores (product_id, final_score)",
+)
+
+SCORE_FIELDS = ("policy_score", "currency_score", "supply_score", "uq", "final_score")
+
+
+def _utc_now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def bump_data_version(conn: sqlite3.Connection) -> int:
+    """
+    Marks the scoring inputs as changed. Call inside the transaction that wrote
+    them; stored scores and HTTP ETags from older versions become stale.
+    """
+    for statement in _DATA_VERSION_SQL:
+        conn.execute(statement)
+    conn.execute("UPDATE data_version SET version = version + 1, updated_at = ? WHERE id = 1", (_utc_now(),))
+    return conn.execute("SELECT version FROM data_version WHERE id = 1").fetchone()[0]
+
+
+@dataclass(frozen=True)
+class ScoreRun:
+    product_id: int
+    data_version: int
+    computed_at: datetime
+
+
+class ScoreRepository:
+    """
+    Reads and writes precomputed rows in sourcing_scores.
+
+    Connections are kept per thread, so the per-request cost of a freshness check
+    is one indexed query. Not fork-safe: workers open their own connections.
+    Region ids for save_scores() come from `lookups` when given (the pre-warmed
+    ReferenceLookups); regions missing from them are looked up in the database.
+    """
+    def __init__(self, db_path: Path = DB_PATH, lookups: Optional[ReferenceLookups] = None):
+        self.db_path = Path(db_path)
+        self.lookups = lookups
+        self._local = threading.local()
+        self._schema_ready = False
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            # mode=rw: a missing database raises instead of being created as an empty stub
+            conn = self._local.conn = sqlite3.connect(f"{self.db_path.resolve().as_uri()}?mode=rw", uri=True)
+        if not self._schema_ready:
+            with conn:
+                for statement in _BOOKKEEPING_SQL:
+                    conn.execute(statement)
+            self._schema_ready = True
+        return conn
+
+    def close(self) -> None:
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    def data_version(self) -> int:
+        return self._connection().execute("SELECT version FROM data_version WHERE id = 1").fetchone()[0]
+
+    def cache_version(self) -> str:
+        """
+        Changes whenever anything the score endpoints return may have changed: a
+        data_version bump (ingest, seeding) or a new scoring run.
+        """
+        version, latest_run = self._connection().execute(
+            "SELECT (SELECT version FROM data_version WHERE id = 1), (SELECT MAX(computed_at) FROM score_runs)"
+        ).fetchone()
+        return f"{version}/{latest_run or '-'}"
+
+    def bump_data_version(self) -> int:
+        conn = self._connection()
+        with conn:
+            return bump_data_version(conn)
+
+    def product_ids(self) -> List[int]:
+        return [row[0] for row in self._connection().execute("SELECT id FROM products ORDER BY id")]
+
+    def score_runs(self) -> Dict[int, ScoreRun]:
+        return {
+            row[0]: ScoreRun(row[0], row[1], datetime.fromisoformat(row[2]))
+            for row in self._connection().execute("SELECT product_id, data_version, computed_at FROM score_runs")
+        }
+
+    def score_run(self, product_id: int) -> Optional[ScoreRun]:
+        row = self._connection().execute(
+            "SELECT product_id, data_version, computed_at FROM score_runs WHERE product_id = ?", (product_id,)
+        ).fetchone()
+        return ScoreRun(row[0], row[1], datetime.fromisoformat(row[2])) if row else None
+
+    def load_scores(self, product_id: int) -> Dict[str, Dict[str, float]]:
+        """Stored scores for one product, best region first, in score_regions()'s shape."""
+        rows = self._connection().execute(f"""
+            SELECT r.name, {", ".join("s." + f for f in SCORE_FIELDS)}
+            FROM sourcing_scores s JOIN regions r ON s.region_id = r.id
+            WHERE s.product_id = ?
+            ORDER BY s.final_score DESC
+        """, (product_id,))
+        return {row[0]: dict(zip(SCORE_FIELDS, row[1:])) for row in rows}
+
+    def save_scores(self, product_id: int, scores: Dict[str, Dict[str, float]], data_version: int) -> None:
+        """Replaces the product's rows in sourcing_scores and records the data version they came from."""
+        conn = self._connection()
+        now = _utc_now()
+        with conn:
+            region_ids = self._region_ids(conn, scores)
+            conn.execute("DELETE FROM sourcing_scores WHERE product_id = ?", (product_id,))
+            conn.executemany(f"""
+                INSERT INTO sourcing_scores (product_id, region_id, {", ".join(SCORE_FIELDS)}, timestamp)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """, [
+                (product_id, region_ids[region], *(values[f] for f in SCORE_FIELDS), now)
+                for region, values in scores.items() if region in region_ids
+            ])
+            conn.execute("INSERT OR REPLACE INTO score_runs (product_id, data_version, computed_at) VALUES (?, ?, ?)",
+                         (product_id, data_version, now))
+        logger.debug(f"DEBUG - Stored {len(scores)} scores for product {product_id} (data version {data_version})")
+
+    def _region_ids(self, conn: sqlite3.Connection, names: Iterable[str]) -> Dict[str, int]:
+        """Region name -> id, without a query when the lookups know every region."""
+        if self.lookups is not None:
+            regions = {name: self.lookups.region_by_name(name) for name in names}
+            if all(regions.values()):
+                return {name: region.id for name, region in regions.items()}
+        return dict(conn.execute("SELECT name, id FROM regions")) # Regions added since the lookups were loaded
+
+    def top_scores(self, k: int, product_id: Optional[int] = None) -> List[Dict[str, object]]:
+        """The k best (product, region) scores across all products, or within one."""
+        where = "WHERE s.product_id = ?" if product_id is not None else ""
+        rows = self._connection().execute(f"""
+            SELECT s.product_id, r.name, {", ".join("s." + f for f in SCORE_FIELDS)}
+            FROM sourcing_scores s JOIN regions r ON s.region_id = r.id
+            {where}
+            ORDER BY s.final_score DESC, s.product_id, r.name
+            LIMIT ?
+        """, ((product_id, k) if product_id is not None else (k,)))
+        return [dict(product_id=row[0], region=row[1], **dict(zip(SCORE_FIELDS, row[2:]))) for row in rows]
@@ -2,6 +2,7 @@
 
 import sqlite3
 from config.config import DB_PATH
+from src.data.implementations.sqllite.score_repository import bump_data_version
 
 def seed_data():
     conn = sqlite3.connect(DB_PATH)
@@ -59,5 +60,6 @@ def seed_data():
         (4, 0.2, 0.25, 0.3, 0.2, 0.237)
     ])
 
+    bump_data_version(conn) # Stored scores and cached API responses are now stale
     conn.commit()
     conn.close()
@@ -0,0 +1,183 @@
+# /src/presentation/api_server/flask_app/admission.py
+
+"""
+Admission control for expensive endpoints.
+
+    @export_bp.route("/<dataset>.<fmt>")
+    @admission_limited("export")
+    def export_dataset(dataset, fmt): ...
+
+or, when only part of a view is expensive, around that part:
+
+    with admitted("scores", service.needs_recompute(product_id, version)):
+        result = service.get_scores(product_id, version)
+
+(a blueprint using admitted() registers shed_response for AdmissionRejected).
+
+Each named gate (ADMISSION_LIMITS) admits `concurrency` requests at a time
+and lets up to `queue` more wait, each for at most `timeout_s`. A request that
+finds the queue full, or times out in it, is shed with 503 and Retry-After
+instead of piling up on the scorer. Ungated endpoints (health checks, cached
+responses, metrics) never wait behind gated ones.
+
+Limits are per process: with N server workers a gate admits N x concurrency.
+For streamed responses (exports, AI streams) the slot is held until the
+stream is closed, not just until the view returns.
+"""
+
+import functools
+import math
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator
+
+from flask import Response, current_app, jsonify
+from loguru import logger
+
+from config import config
+from core.metrics import counter, gauge, histogram
+
+ADMISSION_IN_FLIGHT = gauge("jennai_admission_in_flight", "Requests admitted and running, by gate.", ["gate"])
+ADMISSION_QUEUE_DEPTH = gauge("jennai_admission_queue_depth", "Requests waiting for admission, by gate.", ["gate"])
+ADMISSION_REJECTIONS = counter("jennai_admission_rejections_total", "Requests shed with 503, by gate and reason.",
+                               ["gate", "reason"])
+ADMISSION_WAIT_SECONDS = histogram("jennai_admission_wait_seconds", "Time spent queued before admission, by gate.",
+                                   ["gate"])
+
+
+class AdmissionRejected(Exception):
+    def __init__(self, gate: str, reason: str):
+        super().__init__(f"{gate}: {reason}")
+        self.gate = gate
+        self.reason = reason # "queue_full" or "timeout"
+
+
+class AdmissionGate:
+    """A counting semaphore with a bounded wait queue and a wait timeout. Newcomers do not overtake waiters."""
+
+    def __init__(self, name: str, concurrency: int, queue: int, timeout_s: float):
+        self.name = name
+        self.concurrency = concurrency
+        self.queue = queue
+        self.timeout_s = timeout_s
+        self.in_flight = 0
+        self.waiting = 0
+        self._changed = threading.Condition()
+        self._in_flight_gauge = ADMISSION_IN_FLIGHT.labels(name)
+        self._queue_gauge = ADMISSION_QUEUE_DEPTH.labels(name)
+        self._wait_seconds = ADMISSION_WAIT_SECONDS.labels(name)
+
+    def acquire(self) -> None:
+        """Returns once admitted; raises AdmissionRejected when the queue is full or the wait times out."""
+        with self._changed:
+            if self.in_flight < self.concurrency and not self.waiting:
+                self._admit()
+                return
+            if self.waiting >= self.queue:
+                self._reject("queue_full")
+            started = time.perf_counter()
+            self.waiting += 1
+            self._queue_gauge.set(self.waiting)
+            try:
+                admitted = self._changed.wait_for(lambda: self.in_flight < self.concurrency, self.timeout_s)
+            finally:
+                self.waiting -= 1
+                self._queue_gauge.set(self.waiting)
+            self._wait_seconds.observe(time.perf_counter() - started)
+            if not admitted:
+                self._reject("timeout")
+            self._admit()
+
+    def _admit(self) -> None:
+        self.in_flight += 1
+        self._in_flight_gauge.set(self.in_flight)
+
+    def _reject(self, reason: str) -> None:
+        ADMISSION_REJECTIONS.labels(self.name, reason).inc()
+        raise AdmissionRejected(self.name, reason)
+
+    def release(self) -> None:
+        with self._changed:
+            self.in_flight -= 1
+            self._in_flight_gauge.set(self.in_flight)
+            self._changed.notify_all() # Waiters that already timed out must not swallow the wakeup
+
+    def __enter__(self) -> "AdmissionGate":
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.release()
+
+    @property
+    def retry_after_s(self) -> int:
+        """The queue timeout, rounded up: by then everything queued ahead of a retry has been admitted or shed."""
+        return max(1, math.ceil(self.timeout_s))
+
+
+_gates: Dict[str, AdmissionGate] = {}
+_gates_lock = threading.Lock()
+
+
+def get_gate(name: str) -> AdmissionGate:
+    """The process-wide gate for `name`, created from ADMISSION_LIMITS on first use."""
+    gate = _gates.get(name)
+    if gate is None:
+        with _gates_lock:
+            gate = _gates.get(name)
+            if gate is None:
+                limits = config.ADMISSION_LIMITS[name]
+                gate = _gates[name] = AdmissionGate(name, limits["concurrency"], limits["queue"], limits["timeout_s"])
+    return gate
+
+
+def _shed(gate: AdmissionGate, reason: str) -> Response:
+    logger.warning(f"WARNING - Shedding request at gate {gate.name!r} ({reason}): "
+                   f"{gate.in_flight} running, {gate.waiting} queued.")
+    response = jsonify({"error": "Server busy, retry shortly.", "gate": gate.name, "reason": reason})
+    response.status_code = 503
+    response.headers["Retry-After"] = str(gate.retry_after_s)
+    response.headers["Cache-Control"] = "no-store"
+    return response
+
+
+def shed_response(e: AdmissionRejected) -> Response:
+    """Error handler turning an AdmissionRejected raised inside admitted() into 503 + Retry-After."""
+    return _shed(get_gate(e.gate), e.reason)
+
+
+@contextmanager
+def admitted(name: str, needed: bool = True) -> Iterator[None]:
+    """Holds a slot of gate `name` for the block (when `needed`); raises AdmissionRejected when shed."""
+    if not needed or not config.ADMISSION_ENABLED:
+        yield
+        return
+    with get_gate(name):
+        yield
+
+
+def admission_limited(name: str) -> Callable[[Callable], Callable]:
+    """Runs the view only once admitted by gate `name`; sheds it with 503 + Retry-After otherwise."""
+    def decorator(view: Callable) -> Callable:
+        @functools.wraps(view) # Keeps markers such as cache_response
+        def wrapper(*args, **kwargs):
+            if not config.ADMISSION_ENABLED:
+                return view(*args, **kwargs)
+            gate = get_gate(name)
+            try:
+                gate.acquire()
+            except AdmissionRejected as e:
+                return _shed(gate, e.reason)
+            try:
+                response = current_app.make_response(view(*args, **kwargs))
+            except BaseException:
+                gate.release()
+                raise
+            if response.is_streamed:
+                response.call_on_close(gate.release) # Held while the stream is generated
+            else:
+                gate.release()
+            return response
+        return wrapper
+    return decorator
@@ -12,22 +12,57 @@ if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
 from flask import Flask
-from config.config import DEBUG_MODE
+from config.config import DEBUG_MODE, METRICS_ENABLED
 
 # Import the blueprints for the routes
 from src.presentation.api_server.flask_app.routes.main_routes import main_bp
 from src.presentation.api_server.flask_app.routes.brand_routes import brand_bp
+from src.presentation.api_server.flask_app.routes.ai_routes import ai_bp
+from src.presentation.api_server.flask_app.routes.score_routes import scores_bp
+from src.presentation.api_server.flask_app.routes.metrics_routes import metrics_bp
+from src.presentation.api_server.flask_app.routes.admin_routes import admin_bp
+from src.presentation.api_server.flask_app.routes.health_routes import health_bp
+from src.presentation.api_server.flask_app.routes.export_routes import export_bp
+from src.presentation.api_server.flask_app.dependencies import close_request_scope
+from src.presentation.api_server.flask_app.request_tracing import init_request_tracing
+from src.presentation.api_server.flask_app.serialization import FastJSONProvider, init_compression
+from src.presentation.api_server.flask_app.assets import init_assets
+from src.presentation.api_server.flask_app.templating import init_templating
+from src.presentation.api_server.flask_app.response_cache import init_response_cache
 
-def create_app():
-    """Create and configure an instance of the Flask application."""
+def create_app(container=None):
+    """
+    Create and configure an instance of the Flask application.
+
+    Args:
+        container: Optional DependencyContainer used to resolve services. If omitted,
+                   the default container is built on the first request that needs it.
+    """
     app = Flask(__name__, instance_relative_config=True)
+    if container is not None:
+        app.extensions["container"] = container
+    app.teardown_appcontext(close_request_scope) # Close request-scoped services
+    app.json = FastJSONProvider(app) # orjson when installed
+    init_compression(app) # Registered first so it runs after every other after_request hook
+    init_request_tracing(app) # Root span per request; loader/scorer spans nest under it
 
     # Register blueprints
     app.register_blueprint(main_bp)
     app.register_blueprint(brand_bp)
+    app.register_blueprint(ai_bp)
+    app.register_blueprint(scores_bp)
+    app.register_blueprint(health_bp) # /healthz (liveness) and /readyz (database reachable)
+    app.register_blueprint(export_bp) # Streaming CSV/Parquet exports under /api/export
+    init_assets(app) # Hashed brand assets under /assets, asset_url() in templates
+    app.register_blueprint(admin_bp) # Profiler control; disabled unless ADMIN_API_TOKEN is set
+    if METRICS_ENABLED:
+        app.register_blueprint(metrics_bp) # /metrics, plus per-route request latency histograms
+    init_response_cache(app) # After the other hooks: hits are still traced and timed, compressed bodies are stored
+    init_templating(app) # Last: precompiles the templates of every registered blueprint
 
     return app
 
 if __name__ == '__main__':
+    # Development server only; `python main.py serve` runs the multi-worker production server.
     app = create_app()
     app.run(debug=DEBUG_MODE, port=5000)
\ No newline at end of file
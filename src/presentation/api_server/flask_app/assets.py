@@ -0,0 +1,136 @@
+# /src/presentation/api_server/flask_app/assets.py
+
+"""
+Serves the brand assets built by admin/build_brand_assets.py.
+
+    <img src="{{ asset_url('logo.png', width=480) }}"
+         srcset="{{ asset_srcset('logo.png', format='webp') }}">
+
+asset_url() resolves a source name through manifest.json to a content-hashed
+file under /assets/, served with `Cache-Control: immutable` and a one-year
+max-age (a changed image gets a new name), and from a precompressed .br/.gz
+sibling when the client accepts it. Until the build has run, names resolve to
+the unprocessed originals with a short max-age.
+"""
+
+import json
+import mimetypes
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from flask import Blueprint, Flask, abort, current_app, request, send_from_directory, url_for
+from loguru import logger
+
+from config import config
+
+assets_bp = Blueprint("assets", __name__, url_prefix="/assets")
+
+_PRECOMPRESSED = (("br", ".br"), ("gzip", ".gz"))
+
+
+class AssetManifest:
+    """Source name -> built files, as written by admin/build_brand_assets.py."""
+
+    def __init__(self, assets: Dict[str, dict]):
+        self.assets = assets
+        self.files = {entry["file"] for entry in assets.values()}
+        self.files.update(variant["file"] for entry in assets.values() for variant in entry.get("variants", []))
+
+    @classmethod
+    def load(cls, path: Path = config.BRAND_MANIFEST_PATH) -> "AssetManifest":
+        try:
+            manifest = json.loads(Path(path).read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            logger.warning(f"WARNING - No brand asset manifest at {path}; serving unbuilt originals. "
+                           f"Run admin/build_brand_assets.py.")
+            return cls({})
+        return cls(manifest.get("assets", {}))
+
+    def _candidates(self, name: str, fmt: Optional[str]) -> List[dict]:
+        """The original and its variants of one format, narrowest first."""
+        entry = self.assets[name]
+        original_format = Path(name).suffix.lower().lstrip(".")
+        candidates = [v for v in entry.get("variants", []) if fmt is None or v["format"] == fmt]
+        if fmt in (None, original_format):
+            candidates = [v for v in candidates if v["format"] == original_format]
+            candidates.append({"file": entry["file"], "width": entry.get("width"), "format": original_format})
+        return sorted(candidates, key=lambda v: v["width"] or 0)
+
+    def resolve(self, name: str, width: Optional[int] = None, fmt: Optional[str] = None) -> Optional[str]:
+        """
+        The built file for `name`: the narrowest variant at least `width` wide
+        (the widest if none is), in format `fmt` if that variant was built.
+        """
+        if name not in self.assets:
+            return None
+        candidates = self._candidates(name, fmt) or self._candidates(name, None)
+        if width is not None:
+            wide_enough = [c for c in candidates if (c["width"] or 0) >= width]
+            return (wide_enough or candidates)[0 if wide_enough else -1]["file"]
+        return candidates[-1]["file"]
+
+    def srcset(self, name: str, fmt: Optional[str] = None) -> List[tuple]:
+        if name not in self.assets:
+            return []
+        return [(c["file"], c["width"]) for c in self._candidates(name, fmt) if c["width"]]
+
+
+def _manifest() -> AssetManifest:
+    return current_app.extensions["asset_manifest"]
+
+
+def asset_url(name: str, width: Optional[int] = None, format: Optional[str] = None) -> str:
+    built = _manifest().resolve(name, width, format)
+    if built is None:
+        return url_for("assets.serve_source", filename=name)
+    return url_for("assets.serve_asset", filename=built)
+
+
+def asset_type(name: str, width: Optional[int] = None, format: Optional[str] = None) -> str:
+    """The MIME type of the file asset_url() resolves to (an unbuilt original keeps its own format)."""
+    built = _manifest().resolve(name, width, format)
+    return mimetypes.guess_type(built or name)[0] or "application/octet-stream"
+
+
+def asset_srcset(name: str, format: Optional[str] = None) -> str:
+    """A srcset attribute value ("url 480w, url 960w, ...") for the built widths of `name`."""
+    return ", ".join(f"{url_for('assets.serve_asset', filename=file)} {width}w"
+                     for file, width in _manifest().srcset(name, format))
+
+
+@assets_bp.route("/<path:filename>")
+def serve_asset(filename: str):
+    """A hashed build output; immutable, from a precompressed sibling when accepted."""
+    if filename not in _manifest().files:
+        abort(404)
+    build_dir = Path(current_app.extensions["asset_build_dir"])
+    mimetype = mimetypes.guess_type(filename)[0] or "application/octet-stream"
+    for encoding, suffix in _PRECOMPRESSED:
+        if request.accept_encodings[encoding] and (build_dir / (filename + suffix)).is_file():
+            response = send_from_directory(build_dir, filename + suffix, mimetype=mimetype,
+                                           max_age=config.ASSET_MAX_AGE_S)
+            response.headers["Content-Encoding"] = encoding
+            break
+    else:
+        response = send_from_directory(build_dir, filename, max_age=config.ASSET_MAX_AGE_S)
+    response.headers["Cache-Control"] = f"public, max-age={config.ASSET_MAX_AGE_S}, immutable"
+    response.vary.add("Accept-Encoding")
+    return response
+
+
+@assets_bp.route("/src/<path:filename>")
+def serve_source(filename: str):
+    """An unbuilt original (no manifest entry yet); revalidated after a few minutes."""
+    response = send_from_directory(current_app.extensions["asset_source_dir"], filename,
+                                   max_age=config.ASSET_SOURCE_MAX_AGE_S)
+    response.headers["Cache-Control"] = f"public, max-age={config.ASSET_SOURCE_MAX_AGE_S}"
+    return response
+
+
+def init_assets(app: Flask, build_dir: Path = config.BRAND_BUILD_DIR, source_dir: Path = config.API_BRAND_DIR) -> None:
+    """Loads the manifest once per process and exposes asset_url()/asset_type()/asset_srcset() to templates."""
+    app.extensions["asset_manifest"] = AssetManifest.load(Path(build_dir) / config.BRAND_MANIFEST_PATH.name)
+    app.extensions["asset_build_dir"] = str(build_dir)
+    app.extensions["asset_source_dir"] = str(source_dir)
+    app.register_blueprint(assets_bp)
+    app.context_processor(lambda: {"asset_url": asset_url, "asset_type": asset_type, "asset_srcset": asset_srcset})
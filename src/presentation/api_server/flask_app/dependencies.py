@@ -0,0 +1,35 @@
+# /src/presentation/api_server/flask_app/dependencies.py
+
+from flask import current_app, g
+
+
+def get_container():
+    """
+    Returns the DependencyContainer attached to the app by create_app(),
+    building the default one on first use if none was provided.
+    """
+    container = current_app.extensions.get("container")
+    if container is None:
+        from core.bootstrap import get_configured_container
+        container = get_configured_container()
+        current_app.extensions["container"] = container
+    return container
+
+
+def get_request_scope():
+    """Returns the DependencyScope for the current request, creating it on first use."""
+    if "di_scope" not in g:
+        g.di_scope = get_container().create_scope()
+    return g.di_scope
+
+
+def resolve(interface):
+    """Resolves a service for the current request (scoped services are per request)."""
+    return get_request_scope().resolve(interface)
+
+
+def close_request_scope(exception=None):
+    """Teardown hook: closes scoped services created during the request."""
+    scope = g.pop("di_scope", None)
+    if scope is not None:
+        scope.close()
@@ -0,0 +1,44 @@
+# /src/presentation/api_server/flask_app/request_tracing.py
+
+from flask import Flask, g, request
+
+from core.tracing import begin_span, end_span, reset_trace_id, set_trace_id
+
+TRACE_HEADER = "X-Request-ID"
+
+
+def _start_request_span():
+    """Opens the root span of the request; the trace id is the incoming X-Request-ID, if any."""
+    g._trace_token = set_trace_id(request.headers.get(TRACE_HEADER) or None)
+    g._trace_span = begin_span(
+        f"http.{request.method} {request.url_rule.rule if request.url_rule else request.path}",
+        method=request.method, path=request.path,
+    )
+
+
+def _finish_request_span(response):
+    span = getattr(g, "_trace_span", None)
+    if span is not None:
+        span.set_attribute("status", response.status_code)
+        response.headers.setdefault(TRACE_HEADER, span.trace_id)
+    return response
+
+
+def _close_request_span(exception=None):
+    """Runs even when the handler raised; ends the span and restores the previous trace id."""
+    end_span(getattr(g, "_trace_span", None), exception)
+    token = getattr(g, "_trace_token", None)
+    if token is not None:
+        reset_trace_id(token)
+        g._trace_token = None
+
+
+def init_request_tracing(app: Flask) -> None:
+    """
+    Traces every request: a root span per request (loader and scorer spans nest
+    under it) whose trace id is returned in the X-Request-ID response header.
+    For streamed responses the span covers the handler, not the body transfer.
+    """
+    app.before_request(_start_request_span)
+    app.after_request(_finish_request_span)
+    app.teardown_request(_close_request_span)
@@ -0,0 +1,253 @@
+# /src/presentation/api_server/flask_app/response_cache.py
+
+"""
+Full-response caching for read endpoints, keyed on the data they serve.
+
+    @scores_bp.route("/<int:product_id>")
+    @cache_response
+    def product_scores(product_id): ...
+
+A response is cached under (cache version, path, sorted query args,
+negotiated encoding). The cache version (ScoreService.cache_version()) changes
+when ingest bumps data_version or a scoring run is stored, so entries are
+never invalidated explicitly: a write makes every older key unreachable, and
+the LRU (memory) or size budget (disk) ages them out.
+
+Bodies are stored after compression, so a hit costs neither the view nor
+gzip/brotli. Hits honour If-None-Match (304). Responses carry X-Cache:
+HIT, MISS or BYPASS (not cacheable, or version unavailable).
+
+Backends (RESPONSE_CACHE_BACKEND):
+  memory  per-process LRU bounded by entries and bytes
+  disk    files under RESPONSE_CACHE_DIR, shared by every worker on the host
+  off     decorator is a no-op
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, List, NamedTuple, Optional, Tuple
+
+from flask import Flask, Response, current_app, g, request
+from loguru import logger
+
+from config import config
+from core.metrics import counter, gauge
+from src.presentation.api_server.flask_app.serialization import _negotiate_encoding
+
+RESPONSE_CACHE_LOOKUPS = counter("jennai_response_cache_total", "Response cache lookups, by endpoint and result.",
+                                 ["endpoint", "result"])
+RESPONSE_CACHE_BYTES = gauge("jennai_response_cache_bytes", "Bytes held by the response cache.")
+
+# Stored with the body; everything else (Set-Cookie, Date, tracing ids) is per response
+_STORED_HEADERS = {"content-type", "content-encoding", "etag", "cache-control", "vary", "last-modified",
+                   "x-score-source"}
+
+
+class CachedResponse(NamedTuple):
+    status: int
+    headers: List[Tuple[str, str]]
+    body: bytes
+    stored_at: float
+
+
+class MemoryResponseCache:
+    """LRU bounded by entry count and total body bytes."""
+
+    def __init__(self, max_entries: int = config.RESPONSE_CACHE_MAX_ENTRIES,
+                 max_bytes: int = config.RESPONSE_CACHE_MAX_BYTES, ttl_s: float = config.RESPONSE_CACHE_TTL_S):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_s = ttl_s
+        self._entries: "OrderedDict[str, CachedResponse]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if time.time() - entry.stored_at > self.ttl_s:
+                self._bytes -= len(self._entries.pop(key).body)
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: CachedResponse) -> None:
+        if len(entry.body) > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= len(previous.body)
+            self._entries[key] = entry
+            self._bytes += len(entry.body)
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                self._bytes -= len(self._entries.popitem(last=False)[1].body)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def size_bytes(self) -> int:
+        return self._bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class DiskResponseCache:
+    """
+    One file per entry (a JSON header line, then the body), written atomically.
+    When the directory grows past max_bytes the least recently written files
+    are removed down to 90% of the budget.
+    """
+
+    def __init__(self, directory: Path = config.RESPONSE_CACHE_DIR, max_bytes: int = config.RESPONSE_CACHE_MAX_BYTES,
+                 ttl_s: float = config.RESPONSE_CACHE_TTL_S):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.ttl_s = ttl_s
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._bytes = sum(p.stat().st_size for p in self.directory.glob("*/*") if p.is_file())
+        self._lock = threading.Lock()
+
+    def _path(self, key: str) -> Path:
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return self.directory / digest[:2] / digest
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                meta = json.loads(f.readline())
+                body = f.read()
+        except (FileNotFoundError, ValueError):
+            return None
+        if meta.get("key") != key or time.time() - meta["stored_at"] > self.ttl_s:
+            return None
+        return CachedResponse(meta["status"], [tuple(h) for h in meta["headers"]], body, meta["stored_at"])
+
+    def set(self, key: str, entry: CachedResponse) -> None:
+        path = self._path(key)
+        meta = json.dumps({"key": key, "status": entry.status, "headers": entry.headers,
+                           "stored_at": entry.stored_at}).encode("utf-8")
+        path.parent.mkdir(exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp, "wb") as f:
+            f.write(meta + b"\n")
+            f.write(entry.body)
+        os.replace(tmp, path) # Readers in other workers see the old file or the new one, never half of one
+        with self._lock:
+            self._bytes += len(meta) + 1 + len(entry.body)
+            if self._bytes > self.max_bytes:
+                self._evict()
+
+    def _evict(self) -> None:
+        files = sorted((p.stat().st_mtime, p.stat().st_size, p) for p in self.directory.glob("*/*") if p.is_file())
+        self._bytes = sum(size for _, size, _ in files)
+        for _, size, path in files:
+            if self._bytes <= self.max_bytes * 0.9:
+                break
+            path.unlink(missing_ok=True)
+            self._bytes -= size
+
+    def clear(self) -> None:
+        with self._lock:
+            for path in self.directory.glob("*/*"):
+                path.unlink(missing_ok=True)
+            self._bytes = 0
+
+    def size_bytes(self) -> int:
+        return self._bytes
+
+
+def cache_response(view: Callable) -> Callable:
+    """Marks a GET view as cacheable by the response cache."""
+    view.cache_response = True
+    return view
+
+
+def _score_cache_version() -> Optional[str]:
+    from src.business.ai.pricing_engine.score_service import ScoreService
+    from src.presentation.api_server.flask_app.dependencies import resolve
+
+    return resolve(ScoreService).cache_version()
+
+
+def _cache_key() -> Optional[str]:
+    """None when the data version cannot be read: nothing is served from or stored in the cache then."""
+    version = current_app.extensions["response_cache_version"]()
+    if version is None:
+        return None
+    args = "&".join(f"{k}={v}" for k, v in sorted(request.args.items(multi=True)))
+    return f"{version}|{request.path}?{args}|{_negotiate_encoding() or 'identity'}"
+
+
+def _serve_from_cache():
+    if request.method not in ("GET", "HEAD"):
+        return None
+    if not getattr(current_app.view_functions.get(request.endpoint), "cache_response", False):
+        return None
+    key = _cache_key()
+    if key is None:
+        g._response_cache = ("BYPASS", None)
+        RESPONSE_CACHE_LOOKUPS.labels(request.endpoint, "bypass").inc()
+        return None
+    entry = current_app.extensions["response_cache"].get(key)
+    if entry is None:
+        g._response_cache = ("MISS", key)
+        RESPONSE_CACHE_LOOKUPS.labels(request.endpoint, "miss").inc()
+        return None
+    RESPONSE_CACHE_LOOKUPS.labels(request.endpoint, "hit").inc()
+    g._response_cache = ("HIT", None)
+    response = Response(entry.body, status=entry.status, headers=entry.headers)
+    response.headers["Age"] = str(int(max(0, time.time() - entry.stored_at)))
+    return response.make_conditional(request)
+
+
+def _store_in_cache(response: Response) -> Response:
+    status, key = g.pop("_response_cache", (None, None))
+    if status is None:
+        return response
+    response.headers["X-Cache"] = status
+    if (key is not None and response.status_code == 200 and not response.is_streamed
+            and not response.direct_passthrough and "Set-Cookie" not in response.headers
+            and "no-store" not in response.headers.get("Cache-Control", "")):
+        headers = [(k, v) for k, v in response.headers.items() if k.lower() in _STORED_HEADERS]
+        current_app.extensions["response_cache"].set(key, CachedResponse(200, headers, response.get_data(), time.time()))
+    return response
+
+
+def create_backend(name: str = config.RESPONSE_CACHE_BACKEND):
+    if name == "memory":
+        return MemoryResponseCache()
+    if name == "disk":
+        return DiskResponseCache()
+    if name != "off":
+        logger.warning(f"WARNING - Unknown RESPONSE_CACHE_BACKEND {name!r}; response caching is off.")
+    return None
+
+
+def init_response_cache(app: Flask, backend=None,
+                        version: Callable[[], Optional[str]] = _score_cache_version) -> None:
+    """
+    Enables caching for views marked with @cache_response. Call after the other
+    request hooks are registered: lookups then run last among before_request
+    hooks (a hit still gets tracing and metrics), and stores run after
+    compression, so the compressed body is what is cached.
+    """
+    backend = backend if backend is not None else create_backend()
+    if backend is None:
+        return
+    app.extensions["response_cache"] = backend
+    app.extensions["response_cache_version"] = version
+    RESPONSE_CACHE_BYTES.set_function(backend.size_bytes)
+    app.before_request(_serve_from_cache)
+    app.after_request_funcs.setdefault(None, []).insert(0, _store_in_cache) # after_request runs in reverse: this runs last
@@ -0,0 +1,52 @@
+# /src/presentation/api_server/flask_app/routes/admin_routes.py
+
+import hmac
+
+from flask import Blueprint, Response, abort, jsonify, request
+
+from config import config
+from core.sampling_profiler import profiler
+
+admin_bp = Blueprint("admin", __name__, url_prefix="/admin")
+
+
+@admin_bp.before_request
+def _require_admin_token():
+    """The admin endpoints 404 unless ADMIN_API_TOKEN is set, and then need it in X-Admin-Token."""
+    if not config.ADMIN_API_TOKEN:
+        abort(404)
+    if not hmac.compare_digest(request.headers.get("X-Admin-Token", ""), config.ADMIN_API_TOKEN):
+        abort(403)
+
+
+# The profiler is per process. Behind gunicorn each request may reach a different
+# worker, so start, status and stop can land on different ones: compare the "pid"
+# in the responses, or profile with one worker (`python main.py serve --workers 1`).
+@admin_bp.route("/profiler", methods=["GET"])
+def profiler_status():
+    return jsonify(profiler.status())
+
+
+@admin_bp.route("/profiler/start", methods=["POST"])
+def start_profiler():
+    """Starts the sampling profiler. Optional ?interval_ms= overrides PROFILER_INTERVAL_MS."""
+    interval_ms = request.args.get("interval_ms", type=float)
+    if interval_ms is not None and not 1 <= interval_ms <= 1000:
+        abort(400, description="interval_ms must be between 1 and 1000.")
+    started = profiler.start(interval_ms / 1000.0 if interval_ms else None)
+    return jsonify(dict(profiler.status(), started=started)), 202 if started else 409
+
+
+@admin_bp.route("/profiler/stop", methods=["POST"])
+def stop_profiler():
+    """
+    Stops the profiler, writes the collapsed stacks under logs/profiles and returns
+    them. 409 if it is not running in this worker (never started, or started in another).
+    """
+    if not profiler.running:
+        return jsonify(dict(profiler.status(), stopped=False)), 409
+    profiler.stop()
+    path = profiler.dump()
+    response = Response(profiler.collapsed(), mimetype="text/plain")
+    response.headers["X-Profile-Path"] = str(path)
+    return response
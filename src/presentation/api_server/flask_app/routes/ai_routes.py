@@ -0,0 +1,41 @@
+# /src/presentation/api_server/flask_app/routes/ai_routes.py
+
+import uuid
+
+from flask import Blueprint, Response, abort, request, stream_with_context
+from loguru import logger
+
+from core.tracing import current_trace_id
+from src.business.interfaces.IAIService import IAIInterface
+from src.presentation.api_server.flask_app.admission import admission_limited
+from src.presentation.api_server.flask_app.dependencies import resolve
+
+ai_bp = Blueprint("ai", __name__, url_prefix="/api/ai")
+
+
+@ai_bp.route("/stream", methods=["POST"])
+@admission_limited("ai")
+def stream_text():
+    """
+    Streams IAIInterface.stream_text() output to the client as plain text.
+    The first bytes go out as soon as the provider yields its first chunk.
+    Expects JSON {"text": "..."} or a form field named "text".
+    """
+    payload = request.get_json(silent=True) or request.form
+    if not isinstance(payload, dict): # e.g. a JSON list or string
+        abort(400, description="Request body must be a JSON object or form data.")
+    text = payload.get("text")
+    if not text:
+        abort(400, description="Missing 'text' in request body.")
+
+    # The request tracing hooks adopt an incoming X-Request-ID as the trace id (or generate one).
+    request_id = current_trace_id() or request.headers.get("X-Request-ID") or uuid.uuid4().hex
+    ai_service: IAIInterface = resolve(IAIInterface)
+    logger.debug(f"[Request ID: {request_id}] Streaming AI response to client.")
+
+    chunks = ai_service.stream_text(text, request_id=request_id)
+    response = Response(stream_with_context(chunks), mimetype="text/plain")
+    response.headers["X-Request-ID"] = request_id
+    response.headers["Cache-Control"] = "no-cache"
+    response.headers["X-Accel-Buffering"] = "no"  # Stop reverse proxies (nginx) from buffering the stream
+    return response
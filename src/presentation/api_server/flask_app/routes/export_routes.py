@@ -0,0 +1,78 @@
+# /src/presentation/api_server/flask_app/routes/export_routes.py
+
+import sqlite3
+
+from flask import Blueprint, Response, abort, request
+
+from config import config
+from core.metrics import counter
+from src.data.implementations.sqllite.export import (
+    DATASETS, EXPORT_FORMATS, ExportRange, connect_read_only, iter_csv, iter_parquet, pin_range, pq,
+)
+from src.presentation.api_server.flask_app.admission import admission_limited
+
+export_bp = Blueprint("export", __name__, url_prefix="/api/export")
+
+EXPORTED_BYTES = counter("jennai_export_bytes_total", "Bytes streamed by bulk exports, by dataset and format.",
+                         ["dataset", "format"])
+
+_MIMETYPES = {"csv": "text/csv", "parquet": "application/vnd.apache.parquet"}
+
+
+@export_bp.route("/", methods=["GET"])
+def list_datasets():
+    return {"datasets": {name: list(dataset.columns) for name, dataset in DATASETS.items()},
+            "formats": [fmt for fmt in EXPORT_FORMATS if fmt != "parquet" or pq is not None]}
+
+
+@export_bp.route("/<dataset>.<fmt>", methods=["GET"])
+@admission_limited("export")
+def export_dataset(dataset: str, fmt: str):
+    """
+    Streams a table in id order. Query parameters:
+      after_id / until_id  resume range; until_id defaults to the current maximum
+                           and is returned in X-Export-Until-Id, so an interrupted
+                           download resumes with ?after_id=<last id>&until_id=<that>
+                           (scores excepted: rescored products get new ids)
+      since / until        [since, until) on the dataset's timestamp column
+      chunk_rows           rows per database read (default EXPORT_CHUNK_ROWS)
+      header               CSV header row, 1 or 0; defaults to 0 when resuming
+                           (after_id > 0), so resumed parts can be appended
+    """
+    if dataset not in DATASETS:
+        abort(404, description=f"Unknown dataset {dataset!r}; one of {', '.join(DATASETS)}.")
+    if fmt not in EXPORT_FORMATS:
+        abort(404, description=f"Unknown format {fmt!r}; csv or parquet.")
+    if fmt == "parquet" and pq is None:
+        abort(501, description="Parquet export requires pyarrow on the server.")
+    chunk_rows = request.args.get("chunk_rows", config.EXPORT_CHUNK_ROWS, type=int)
+    if not 1 <= chunk_rows <= config.EXPORT_MAX_CHUNK_ROWS:
+        abort(400, description=f"chunk_rows must be between 1 and {config.EXPORT_MAX_CHUNK_ROWS}.")
+    requested = ExportRange(request.args.get("after_id", 0, type=int), request.args.get("until_id", type=int),
+                            request.args.get("since"), request.args.get("until"))
+
+    header = request.args.get("header", "0" if requested.after_id else "1") not in ("0", "false", "no")
+
+    conn = None
+    try:
+        conn = connect_read_only(config.DB_PATH)
+        export_range = pin_range(conn, DATASETS[dataset], requested)
+    except sqlite3.Error as e:
+        if conn is not None:
+            conn.close()
+        abort(503, description=f"Export database unavailable: {e}")
+    writer, kwargs = (iter_csv, {"header": header}) if fmt == "csv" else (iter_parquet, {})
+    bytes_counter = EXPORTED_BYTES.labels(dataset, fmt)
+
+    def generate():
+        for block in writer(conn, DATASETS[dataset], export_range, chunk_rows, **kwargs):
+            bytes_counter.inc(len(block))
+            yield block
+
+    response = Response(generate(), mimetype=_MIMETYPES[fmt])
+    response.call_on_close(conn.close)
+    response.headers["Content-Disposition"] = (
+        f'attachment; filename="{dataset}-{export_range.after_id + 1}-{export_range.until_id}.{fmt}"')
+    response.headers["X-Export-Until-Id"] = str(export_range.until_id)
+    response.headers["Cache-Control"] = "no-store"
+    return response
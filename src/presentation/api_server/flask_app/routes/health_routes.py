@@ -0,0 +1,45 @@
+# /src/presentation/api_server/flask_app/routes/health_routes.py
+
+import sqlite3
+import time
+from pathlib import Path
+
+from flask import Blueprint, jsonify
+
+from config import config
+
+health_bp = Blueprint("health", __name__)
+
+
+def check_database(db_path: Path = None, timeout_s: float = 1.0) -> dict:
+    """Opens the scoring database read-only and runs a trivial query. Never raises."""
+    db_path = Path(db_path or config.DB_PATH)
+    started = time.perf_counter()
+    if not db_path.is_file():
+        return {"ok": False, "error": f"{db_path.name} not found"}
+    try:
+        conn = sqlite3.connect(f"{db_path.as_uri()}?mode=ro", uri=True, timeout=timeout_s)
+        try:
+            conn.execute("SELECT 1 FROM sqlite_master LIMIT 1").fetchall()
+        finally:
+            conn.close()
+    except sqlite3.Error as e:
+        return {"ok": False, "error": str(e)}
+    return {"ok": True, "latency_ms": round((time.perf_counter() - started) * 1000, 2)}
+
+
+@health_bp.route("/healthz", methods=["GET"])
+def liveness():
+    """Liveness: the worker is up and answering. Checks nothing else, so it is never slow."""
+    return jsonify({"status": "ok"})
+
+
+@health_bp.route("/readyz", methods=["GET"])
+def readiness():
+    """Readiness: 503 until the database is reachable, so load balancers route around this worker."""
+    checks = {"database": check_database()}
+    ready = all(check["ok"] for check in checks.values())
+    response = jsonify({"status": "ready" if ready else "unavailable", "checks": checks})
+    response.status_code = 200 if ready else 503
+    response.headers["Cache-Control"] = "no-store"
+    return response
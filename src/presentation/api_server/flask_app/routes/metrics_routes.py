@@ -0,0 +1,34 @@
+# /src/presentation/api_server/flask_app/routes/metrics_routes.py
+
+import time
+
+from flask import Blueprint, Response, g, request
+
+from core.metrics import PROMETHEUS_CONTENT_TYPE, histogram, registry
+
+metrics_bp = Blueprint("metrics", __name__)
+
+HTTP_REQUEST_SECONDS = histogram(
+    "jennai_http_request_seconds", "Time spent handling HTTP requests, by route.",
+    ["method", "route", "status"],
+)
+
+
+@metrics_bp.before_app_request
+def _start_request_timer():
+    g._metrics_started = time.perf_counter()
+
+
+@metrics_bp.after_app_request
+def _observe_request(response):
+    started = g.pop("_metrics_started", None)
+    if started is not None:
+        route = request.url_rule.rule if request.url_rule else "<unmatched>" # The rule, not the path: bounded label values
+        HTTP_REQUEST_SECONDS.labels(request.method, route, response.status_code).observe(time.perf_counter() - started)
+    return response
+
+
+@metrics_bp.route("/metrics")
+def metrics():
+    """Every registered metric in the Prometheus text exposition format."""
+    return Response(registry.render(), mimetype=None, content_type=PROMETHEUS_CONTENT_TYPE)
@@ -0,0 +1,133 @@
+# /src/presentation/api_server/flask_app/routes/score_routes.py
+
+import time
+
+from flask import Blueprint, Response, abort, current_app, jsonify, request
+
+from config import config
+from core.metrics import counter
+from src.business.ai.pricing_engine.score_events import ScoreEventBroker
+from src.business.ai.pricing_engine.score_service import ScoreService
+from src.presentation.api_server.flask_app.admission import AdmissionRejected, admitted, shed_response
+from src.presentation.api_server.flask_app.dependencies import resolve
+from src.presentation.api_server.flask_app.response_cache import cache_response
+from src.presentation.api_server.flask_app.serialization import rows_payload, wants_columnar
+
+scores_bp = Blueprint("scores", __name__, url_prefix="/api/scores")
+
+scores_bp.register_error_handler(AdmissionRejected, shed_response)
+
+NOT_MODIFIED = counter("jennai_score_not_modified_total", "Score requests answered 304 from the ETag alone.")
+
+
+def _not_modified(etag: str):
+    """
+    A 304 response if the client already holds `etag`, else None. Checked before
+    any score is loaded, so a polling dashboard costs one data-version query.
+    """
+    if request.if_none_match.contains_weak(etag): # Weak: compressed responses carry W/ ETags
+        NOT_MODIFIED.inc()
+        response = Response(status=304)
+        response.set_etag(etag)
+        response.headers["Cache-Control"] = "no-cache"
+        return response
+    return None
+
+
+def _etag(base: str) -> str:
+    return f"{base}-columnar" if wants_columnar() else base
+
+
+def _with_etag(payload, etag: str, source: str = None):
+    response = jsonify(payload)
+    response.set_etag(etag)
+    response.headers["Cache-Control"] = "no-cache" # Clients may cache but must revalidate: the next poll is a 304
+    if source:
+        response.headers["X-Score-Source"] = source
+    return response
+
+
+@scores_bp.route("/<int:product_id>", methods=["GET"])
+@cache_response
+def product_scores(product_id: int):
+    """
+    Region scores for one product, best first. ?format=columnar returns columns + row arrays.
+    Only requests that recompute stale scores go through the "scores" admission gate;
+    304s and fresh stored scores are answered without waiting for a slot.
+    """
+    service: ScoreService = resolve(ScoreService)
+    version = service.data_version()
+    etag = _etag(f"scores-{product_id}-v{version}")
+    return _not_modified(etag) or _product_scores_response(service, product_id, version, etag)
+
+
+def _product_scores_response(service: ScoreService, product_id: int, version: int, etag: str):
+    with admitted("scores", service.needs_recompute(product_id, version)):
+        result = service.get_scores(product_id, version)
+    if not result.scores:
+        abort(404, description=f"No scores for product {product_id}.")
+    payload = {
+        "product_id": product_id,
+        "data_version": version,
+        "scores": rows_payload([dict(region=region, **values) for region, values in result.scores.items()]),
+    }
+    return _with_etag(payload, etag, result.source)
+
+
+@scores_bp.route("/top", methods=["GET"])
+@cache_response
+def top_scores():
+    """The k best (product, region) pairs; ?product_id= limits the ranking to one product. Gated like product_scores."""
+    k = request.args.get("k", 10, type=int)
+    if not 1 <= k <= config.SCORES_TOP_MAX_K:
+        abort(400, description=f"k must be between 1 and {config.SCORES_TOP_MAX_K}.")
+    product_id = request.args.get("product_id", type=int)
+
+    service: ScoreService = resolve(ScoreService)
+    version = service.data_version()
+    etag = _etag(f"top-{k}-{product_id if product_id is not None else 'all'}-v{version}")
+    not_modified = _not_modified(etag)
+    if not_modified:
+        return not_modified
+    with admitted("scores", service.needs_recompute(product_id, version)):
+        rows = service.top(k, product_id, version)
+    payload = {"k": k, "product_id": product_id, "data_version": version, "scores": rows_payload(rows)}
+    return _with_etag(payload, etag)
+
+
+@scores_bp.route("/stream", methods=["GET"])
+def score_stream():
+    """
+    Server-sent events of score changes (see score_events.py for the payloads).
+    ?product_id= (repeatable) limits the stream to those products. Streams end
+    after SCORE_EVENTS_MAX_STREAM_S; EventSource reconnects with Last-Event-ID
+    and receives what it missed.
+    """
+    broker: ScoreEventBroker = resolve(ScoreEventBroker)
+    if broker.subscriber_count >= config.SCORE_EVENTS_MAX_SUBSCRIBERS:
+        response = jsonify({"error": "Too many open score streams; poll /api/scores instead."})
+        response.status_code = 503
+        response.headers["Retry-After"] = "30"
+        return response
+    last_event_id = request.headers.get("Last-Event-ID", type=int)
+    version = resolve(ScoreService).data_version()
+    subscription = broker.subscribe(request.args.getlist("product_id", type=int) or None, last_event_id)
+    dumps = current_app.json.dumps
+
+    def events():
+        deadline = time.monotonic() + config.SCORE_EVENTS_MAX_STREAM_S
+        # The current version first, so a client can tell whether its copy is already stale
+        yield f"retry: 2000\nevent: data_version\ndata: {dumps({'data_version': version})}\n\n"
+        while time.monotonic() < deadline:
+            batch = subscription.get(timeout=min(config.SCORE_EVENTS_HEARTBEAT_S, deadline - time.monotonic()))
+            if not batch:
+                yield ": keep-alive\n\n" # Also how a disconnected client is noticed
+            for event in batch:
+                event_id = f"id: {event.id}\n" if event.id else ""
+                yield f"{event_id}event: {event.event}\ndata: {dumps(event.data)}\n\n"
+
+    response = Response(events(), mimetype="text/event-stream")
+    response.call_on_close(lambda: broker.unsubscribe(subscription)) # Runs on disconnect too, even before the first event
+    response.headers["Cache-Control"] = "no-cache"
+    response.headers["X-Accel-Buffering"] = "no" # nginx: flush each event instead of buffering the stream
+    return response
@@ -0,0 +1,135 @@
+# /src/presentation/api_server/flask_app/serialization.py
+
+"""
+Response serialization for the API server.
+
+- FastJSONProvider: Flask JSON provider that encodes with orjson when it is
+  installed (several times faster than the stdlib json module on large score
+  matrices) and with the stdlib otherwise. Selected by API_JSON_BACKEND.
+- Columnar format: ?format=columnar turns a list of row objects into
+  {"columns": [...], "rows": [[...], ...]}, so keys are not repeated per row.
+- Compression: responses of at least COMPRESSION_MIN_BYTES are compressed with
+  br (when the brotli package is installed) or gzip, as the client accepts.
+"""
+
+import gzip
+from typing import Any, Dict, List, Optional, Sequence
+
+from flask import Flask, request
+from flask.json.provider import DefaultJSONProvider
+from loguru import logger
+
+from config import config
+from core.metrics import counter
+
+try:
+    import orjson
+except ImportError: # Optional: the stdlib json module is used instead
+    orjson = None
+
+try:
+    import brotli
+except ImportError: # Optional: only gzip is offered
+    brotli = None
+
+COLUMNAR_FORMAT = "columnar"
+COMPRESSIBLE_MIMETYPES = ("application/json", "text/plain", "text/csv", "text/html", "text/css",
+                          "application/javascript", "image/svg+xml")
+
+RESPONSE_BYTES = counter(
+    "jennai_response_bytes_total", "Bytes sent for compressible responses, by content encoding.", ["encoding"],
+)
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """
+    DefaultJSONProvider with an orjson fast path. Types orjson does not handle
+    natively go through DefaultJSONProvider.default (dates, decimals, UUIDs,
+    dataclasses); calls with stdlib-only options such as indent= fall back to json.
+    """
+    def __init__(self, app: Flask, backend: str = config.API_JSON_BACKEND):
+        super().__init__(app)
+        if backend not in ("auto", "orjson", "json"):
+            raise ValueError(f"Unknown API_JSON_BACKEND '{backend}'. Allowed: auto, orjson, json")
+        if backend == "orjson" and orjson is None:
+            logger.warning("WARNING - API_JSON_BACKEND is 'orjson' but orjson is not installed; using json.")
+        self.use_orjson = orjson is not None and backend != "json"
+
+    def _orjson_options(self) -> int:
+        # Dates go through default() so both backends emit Flask's HTTP-date format
+        options = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_PASSTHROUGH_DATETIME
+        return options | orjson.OPT_SORT_KEYS if self.sort_keys else options
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        if self.use_orjson and not kwargs:
+            return orjson.dumps(obj, default=self.default, option=self._orjson_options()).decode("utf-8")
+        return super().dumps(obj, **kwargs)
+
+    def loads(self, s, **kwargs: Any) -> Any:
+        if self.use_orjson and not kwargs:
+            return orjson.loads(s)
+        return super().loads(s, **kwargs)
+
+    def response(self, *args: Any, **kwargs: Any):
+        """Like jsonify(), but hands orjson's bytes straight to the response (no decode/encode round trip)."""
+        pretty = self.compact is False or (self.compact is None and self._app.debug)
+        if not self.use_orjson or pretty:
+            return super().response(*args, **kwargs)
+        obj = self._prepare_response_obj(args, kwargs)
+        body = orjson.dumps(obj, default=self.default, option=self._orjson_options()) + b"\n"
+        return self._app.response_class(body, mimetype=self.mimetype)
+
+
+def wants_columnar() -> bool:
+    return request.args.get("format") == COLUMNAR_FORMAT
+
+
+def to_columnar(rows: Sequence[Dict[str, Any]], columns: Optional[List[str]] = None) -> Dict[str, Any]:
+    """
+    [{"region": "Mexico", "final_score": 0.7}, ...] ->
+    {"columns": ["region", "final_score"], "rows": [["Mexico", 0.7], ...]}
+    Columns default to the keys of the first row; missing values become null.
+    """
+    if columns is None:
+        columns = list(rows[0]) if rows else []
+    return {"columns": columns, "rows": [[row.get(column) for column in columns] for row in rows]}
+
+
+def rows_payload(rows: Sequence[Dict[str, Any]]):
+    """Rows as a list of objects, or columnar when the request asked for ?format=columnar."""
+    return to_columnar(rows) if wants_columnar() else list(rows)
+
+
+def _negotiate_encoding() -> Optional[str]:
+    offered = ["br", "gzip"] if brotli is not None else ["gzip"]
+    return request.accept_encodings.best_match(offered)
+
+
+def _compress_response(response):
+    if (response.direct_passthrough or response.is_streamed or not 200 <= response.status_code < 300
+            or response.status_code == 204 or "Content-Encoding" in response.headers
+            or response.mimetype not in COMPRESSIBLE_MIMETYPES):
+        return response
+    response.vary.add("Accept-Encoding") # Caches must not serve a compressed body to a client that cannot read it
+    body = response.get_data()
+    encoding = _negotiate_encoding() if len(body) >= config.COMPRESSION_MIN_BYTES else None
+    if encoding is None:
+        RESPONSE_BYTES.labels("identity").inc(len(body))
+        return response
+
+    if encoding == "br":
+        body = brotli.compress(body, quality=config.BROTLI_QUALITY)
+    else:
+        body = gzip.compress(body, compresslevel=config.GZIP_LEVEL, mtime=0) # mtime=0: identical input, identical bytes
+    response.set_data(body)
+    response.headers["Content-Encoding"] = encoding
+    etag, weak = response.get_etag()
+    if etag and not weak: # The encoded bytes differ from the identity representation
+        response.set_etag(etag, weak=True)
+    RESPONSE_BYTES.labels(encoding).inc(len(body))
+    return response
+
+
+def init_compression(app: Flask) -> None:
+    """Compresses buffered responses; streamed responses (SSE, exports) are left to the proxy."""
+    app.after_request(_compress_response)
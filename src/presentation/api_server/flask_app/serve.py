@@ -0,0 +1,132 @@
+# /src/presentation/api_server/flask_app/serve.py
+
+"""
+Production serving for the Flask API (`python main.py serve`).
+
+gunicorn (Linux/macOS):
+  - preload_app: the master builds the app and pre-warms the container once
+    (core.bootstrap.prewarm_container); workers are forked from it and share
+    those pages copy-on-write.
+  - gthread workers with SERVER_THREADS threads each, so a slow scoring call
+    holds one thread rather than every request queued behind it.
+  - Workers default to 2 x cores + 1, capped at SERVER_MAX_WORKERS, and are
+    recycled after SERVER_MAX_REQUESTS (+ jitter) requests.
+  - Graceful reload: `python main.py reload` sends SIGHUP to the master (pid in
+    SERVER_PID_FILE), which starts new workers and lets the old ones finish
+    in-flight requests for up to SERVER_GRACEFUL_TIMEOUT_S. As the app is
+    preloaded, picking up new code needs a USR2 (new master) instead.
+
+waitress (Windows, or SERVER_BACKEND=waitress): one process with
+workers x threads threads.
+"""
+
+import importlib.util
+import os
+import signal
+from pathlib import Path
+from typing import Dict, Optional
+
+from loguru import logger
+
+from config import config
+
+
+def default_workers(cpu_count: Optional[int] = None) -> int:
+    """2 x cores + 1, the usual gunicorn starting point, capped at SERVER_MAX_WORKERS."""
+    cores = cpu_count or os.cpu_count() or 1
+    return max(1, min(2 * cores + 1, config.SERVER_MAX_WORKERS))
+
+
+def build_app(freeze_gc: bool = False):
+    """
+    The WSGI app with a pre-warmed container. Called once in the gunicorn master,
+    which also freezes the GC (freeze_gc) as workers are forked right after.
+    """
+    from core.bootstrap import prewarm_container
+    from src.presentation.api_server.flask_app.app import create_app
+
+    return create_app(prewarm_container(freeze_gc=freeze_gc))
+
+
+def gunicorn_options(bind: Optional[str] = None, workers: Optional[int] = None,
+                     threads: Optional[int] = None) -> Dict[str, object]:
+    return {
+        "bind": bind or config.SERVER_BIND,
+        "workers": workers or config.SERVER_WORKERS or default_workers(),
+        "worker_class": "gthread",
+        "threads": threads or config.SERVER_THREADS,
+        "preload_app": True,
+        "keepalive": config.SERVER_KEEPALIVE_S,
+        "timeout": config.SERVER_TIMEOUT_S,
+        "graceful_timeout": config.SERVER_GRACEFUL_TIMEOUT_S,
+        "max_requests": config.SERVER_MAX_REQUESTS,
+        "max_requests_jitter": config.SERVER_MAX_REQUESTS_JITTER,
+        "pidfile": str(config.SERVER_PID_FILE),
+        "worker_tmp_dir": "/dev/shm" if os.path.isdir("/dev/shm") else None, # Heartbeat files off slow disks
+        "accesslog": None, # Request logging is done by the app's tracing middleware
+    }
+
+
+def _run_gunicorn(options: Dict[str, object]) -> int:
+    from gunicorn.app.base import BaseApplication
+
+    class JennAIApplication(BaseApplication):
+        def __init__(self, options: Dict[str, object]):
+            self.options = options
+            super().__init__()
+
+        def load_config(self):
+            for key, value in self.options.items():
+                if key in self.cfg.settings and value is not None:
+                    self.cfg.set(key, value)
+
+        def load(self):
+            return build_app(freeze_gc=True) # preload_app: runs in the master, before the workers are forked
+
+    config.SERVER_PID_FILE.parent.mkdir(parents=True, exist_ok=True)
+    logger.info(f"INFO - Serving with gunicorn on {options['bind']}: {options['workers']} workers x "
+                f"{options['threads']} threads, keep-alive {options['keepalive']}s.")
+    JennAIApplication(options).run()
+    return 0
+
+
+def _run_waitress(options: Dict[str, object]) -> int:
+    from waitress import serve as waitress_serve
+
+    threads = int(options["workers"]) * int(options["threads"])
+    logger.info(f"INFO - Serving with waitress on {options['bind']}: {threads} threads.")
+    waitress_serve(build_app(), listen=options["bind"], threads=threads,
+                   channel_timeout=options["timeout"], connection_limit=max(100, threads * 25))
+    return 0
+
+
+def _installed(module: str) -> bool:
+    return importlib.util.find_spec(module) is not None
+
+
+def serve(bind: Optional[str] = None, workers: Optional[int] = None, threads: Optional[int] = None,
+          backend: str = config.SERVER_BACKEND) -> int:
+    """Runs the API under gunicorn or waitress until the server is shut down."""
+    options = gunicorn_options(bind, workers, threads)
+    # Each score stream holds a thread: keep one free per worker when --threads overrides SERVER_THREADS
+    config.SCORE_EVENTS_MAX_SUBSCRIBERS = max(0, min(config.SCORE_EVENTS_MAX_SUBSCRIBERS, int(options["threads"]) - 1))
+    if backend == "auto":
+        backend = "waitress" if os.name == "nt" or not _installed("gunicorn") and _installed("waitress") else "gunicorn"
+    if not _installed(backend):
+        raise RuntimeError(f"{backend} is not installed; `pip install gunicorn` (or `waitress` on Windows) "
+                           f"to serve in production, or run app.py for the development server.")
+    return _run_gunicorn(options) if backend == "gunicorn" else _run_waitress(options)
+
+
+def reload_server(pid_file=None) -> int:
+    """Sends SIGHUP to the running gunicorn master: workers are replaced without dropping requests."""
+    pid_file = Path(pid_file or config.SERVER_PID_FILE)
+    if not hasattr(signal, "SIGHUP"):
+        raise RuntimeError("Graceful reload needs gunicorn (not available on Windows); restart waitress instead.")
+    try:
+        pid = int(pid_file.read_text().strip())
+    except (FileNotFoundError, ValueError):
+        raise RuntimeError(f"No running server: {pid_file} is missing or empty.")
+    os.kill(pid, signal.SIGHUP)
+    logger.info(f"INFO - Sent SIGHUP to server master {pid}; workers will be replaced gracefully.")
+    return pid
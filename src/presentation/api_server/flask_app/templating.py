@@ -0,0 +1,150 @@
+# /src/presentation/api_server/flask_app/templating.py
+
+"""
+Template compilation, fragment caching and render timing for the Flask UI.
+
+- precompile_templates(): compiles every template at startup (before workers
+  fork, when the container is pre-warmed), so the first requests do not pay
+  for parsing. With TEMPLATE_BYTECODE_DIR set, compiled bytecode is also kept
+  on disk and reused by new processes after a deploy.
+- cached_fragment: caches the output of an expensive block, keyed on a name
+  and a version (usually the scoring data version):
+
+      {% call cached_fragment("top-regions", score_data_version()) %}
+          {% for row in top_regions(5) %} ... {% endfor %}
+      {% endcall %}
+
+  The body, including the data loading inside it, only runs on a miss.
+- jennai_template_render_seconds: render time per template.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Callable, Hashable, List, Optional, Tuple
+
+from flask import Flask, before_render_template, template_rendered
+from jinja2 import FileSystemBytecodeCache
+from loguru import logger
+from markupsafe import Markup
+
+from config import config
+from core.metrics import counter, histogram
+
+TEMPLATE_RENDER_SECONDS = histogram("jennai_template_render_seconds", "Template render time, by template.", ["template"])
+FRAGMENT_CACHE_LOOKUPS = counter("jennai_fragment_cache_total", "Fragment cache lookups, by fragment and result.",
+                                 ["fragment", "result"])
+
+_render_started: ContextVar[Tuple[float, ...]] = ContextVar("template_render_started", default=())
+
+
+class FragmentCache:
+    """LRU of rendered fragments keyed on (name, version, *vary), with a TTL as a backstop."""
+
+    def __init__(self, max_entries: int = config.FRAGMENT_CACHE_MAX_ENTRIES, ttl_s: float = config.FRAGMENT_CACHE_TTL_S,
+                 clock: Callable[[], float] = time.monotonic):
+        self.max_entries = max_entries
+        self.ttl_s = ttl_s
+        self._clock = clock
+        self._entries: "OrderedDict[tuple, Tuple[float, Markup]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple) -> Optional[Markup]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if self._clock() - entry[0] > self.ttl_s:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key: tuple, html: Markup) -> None:
+        with self._lock:
+            self._entries[key] = (self._clock(), html)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def cached_fragment(self, name: str, version: Hashable = None, *vary: Hashable, caller=None) -> Markup:
+        """Template global for {% call cached_fragment(name, version, ...) %}; renders the body on a miss."""
+        key = (name, version) + vary
+        html = self.get(key)
+        if html is not None:
+            FRAGMENT_CACHE_LOOKUPS.labels(name, "hit").inc()
+            return html
+        FRAGMENT_CACHE_LOOKUPS.labels(name, "miss").inc()
+        html = Markup(caller())
+        self.set(key, html)
+        return html
+
+
+def precompile_templates(app: Flask) -> List[str]:
+    """Compiles every .html template into the environment's cache; syntax errors are logged, not raised."""
+    started = time.perf_counter()
+    env = app.jinja_env
+    compiled = []
+    for name in env.list_templates(filter_func=lambda n: n.endswith(".html")):
+        try:
+            env.get_template(name)
+            compiled.append(name)
+        except Exception as e:
+            logger.error(f"ERROR - Template {name} failed to compile: {e}")
+    logger.info(f"INFO - Precompiled {len(compiled)} templates in {(time.perf_counter() - started) * 1000:.1f} ms.")
+    return compiled
+
+
+def _start_render_timer(sender, template, context, **extra):
+    _render_started.set(_render_started.get() + (time.perf_counter(),))
+
+
+def _observe_render(sender, template, context, **extra):
+    stack = _render_started.get()
+    if stack:
+        _render_started.set(stack[:-1])
+        TEMPLATE_RENDER_SECONDS.labels(template.name or "<string>").observe(time.perf_counter() - stack[-1])
+
+
+def _score_globals(app: Flask) -> None:
+    """score_data_version() and top_regions(k) for fragments that show scores."""
+    from src.business.ai.pricing_engine.score_service import ScoreService
+    from src.presentation.api_server.flask_app.dependencies import resolve
+
+    def score_data_version() -> int:
+        return resolve(ScoreService).data_version()
+
+    def top_regions(k: int = 5) -> list:
+        try:
+            return resolve(ScoreService).top(k)
+        except Exception as e: # A broken scoring database should not take the page down
+            logger.warning(f"WARNING - Top regions unavailable: {e}")
+            return []
+
+    app.jinja_env.globals.update(score_data_version=score_data_version, top_regions=top_regions)
+
+
+def init_templating(app: Flask, precompile: bool = config.TEMPLATE_PRECOMPILE,
+                    bytecode_dir: Optional[Path] = config.TEMPLATE_BYTECODE_DIR) -> FragmentCache:
+    """Sets up the fragment cache, template globals and render timing; optionally precompiles every template."""
+    if bytecode_dir:
+        Path(bytecode_dir).mkdir(parents=True, exist_ok=True)
+        app.jinja_env.bytecode_cache = FileSystemBytecodeCache(str(bytecode_dir))
+    fragments = FragmentCache()
+    app.extensions["fragment_cache"] = fragments
+    app.jinja_env.globals["cached_fragment"] = fragments.cached_fragment
+    _score_globals(app)
+    before_render_template.connect(_start_render_timer, app)
+    template_rendered.connect(_observe_render, app)
+    if precompile:
+        precompile_templates(app)
+    return fragments
@@ -1,4 +1,25 @@
+import sqlite3
+
 import pytest
 from pathlib import Path
 
-from config import config
\ No newline at end of file
+from config import config
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    """A scratch database with the products, regions and sourcing_scores tables of the real schema."""
+    path = tmp_path / "textile.db"
+    conn = sqlite3.connect(path)
+    conn.executescript("""
+        CREATE TABLE products (id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT NOT NULL, hs_code TEXT, description TEXT);
+        CREATE TABLE regions (id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT NOT NULL, iso_code TEXT, group_name TEXT);
+        CREATE TABLE sourcing_scores (
+            id INTEGER PRIMARY KEY AUTOINCREMENT, product_id INTEGER, region_id INTEGER, policy_score REAL,
+            currency_score REAL, supply_score REAL, uq REAL, final_score REAL, timestamp TIMESTAMP,
+            FOREIGN KEY (product_id) REFERENCES products(id), FOREIGN KEY (region_id) REFERENCES regions(id));
+        INSERT INTO products (id, name) VALUES (1, 'Cotton T-Shirt'), (2, 'Denim Jacket');
+        INSERT INTO regions (id, name) VALUES (1, 'Vietnam'), (2, 'Mexico');
+    """)
+    conn.close()
+    return path
@@ -0,0 +1,107 @@
+import threading
+import time
+
+import pytest
+from flask import Flask, Response
+
+from config import config
+from core.dependency_container import DependencyContainer
+from src.business.ai.pricing_engine.score_service import ScoreService
+from src.data.implementations.sqllite.score_repository import ScoreRepository
+from src.presentation.api_server.flask_app import admission
+from src.presentation.api_server.flask_app.admission import AdmissionGate, AdmissionRejected, admission_limited
+from src.presentation.api_server.flask_app.routes.score_routes import scores_bp
+
+
+def test_gate_queues_then_sheds():
+    gate = AdmissionGate("unit", concurrency=1, queue=1, timeout_s=0.05)
+    gate.acquire()
+    with pytest.raises(AdmissionRejected) as timed_out:
+        gate.acquire()  # Queued, never admitted
+    assert timed_out.value.reason == "timeout"
+
+    admitted = threading.Event()
+    waiter = threading.Thread(target=lambda: (gate.acquire(), admitted.set()))
+    waiter.start()
+    while not gate.waiting:
+        time.sleep(0.001)
+    with pytest.raises(AdmissionRejected) as full:
+        gate.acquire()
+    assert full.value.reason == "queue_full"
+    gate.release()
+    waiter.join(1)
+    assert admitted.is_set() and gate.in_flight == 1
+
+
+@pytest.fixture
+def app(monkeypatch):
+    monkeypatch.setitem(config.ADMISSION_LIMITS, "test", {"concurrency": 1, "queue": 0, "timeout_s": 2.0})
+    monkeypatch.setattr(admission, "_gates", {})
+    app = Flask(__name__)
+    app.release = threading.Event()
+    app.entered = threading.Event()
+
+    @app.route("/slow")
+    @admission_limited("test")
+    def slow():
+        app.entered.set()
+        app.release.wait(5)
+        return "done"
+
+    @app.route("/stream")
+    @admission_limited("test")
+    def stream():
+        return Response(iter(["a", "b"]))
+
+    @app.route("/cheap")
+    def cheap():
+        return "ok"
+
+    return app
+
+
+def test_busy_gate_sheds_with_retry_after_while_cheap_endpoints_answer(app):
+    results = {}
+    worker = threading.Thread(target=lambda: results.update(slow=app.test_client().get("/slow").status_code))
+    worker.start()
+    app.entered.wait(5)
+
+    client = app.test_client()
+    shed = client.get("/slow")
+    assert shed.status_code == 503 and shed.headers["Retry-After"] == "2" and shed.json["reason"] == "queue_full"
+    assert client.get("/cheap").status_code == 200
+    app.release.set()
+    worker.join(5)
+    assert results == {"slow": 200} and admission.get_gate("test").in_flight == 0
+
+
+def test_streamed_responses_hold_the_slot_until_closed(app):
+    client = app.test_client()
+    response = client.get("/stream")
+    assert admission.get_gate("test").in_flight == 1
+    assert response.get_data(as_text=True) == "ab"
+    response.close()
+    assert admission.get_gate("test").in_flight == 0
+
+
+def test_only_score_recomputes_wait_for_the_gate(db_path, monkeypatch):
+    monkeypatch.setitem(config.ADMISSION_LIMITS, "scores", {"concurrency": 1, "queue": 0, "timeout_s": 1.0})
+    monkeypatch.setattr(admission, "_gates", {})
+    service = ScoreService(ScoreRepository(db_path), scorer=lambda pid: {"Vietnam": dict(
+        policy_score=0.5, currency_score=0.5, supply_score=0.5, uq=0.1, final_score=0.5)})
+    container = DependencyContainer(configure=False)
+    container.register_instance(ScoreService, service)
+    app = Flask(__name__)
+    app.extensions["container"] = container
+    app.register_blueprint(scores_bp)
+    client = app.test_client()
+    fresh = client.get("/api/scores/1")  # Computed and stored while the gate is free
+
+    with admission.get_gate("scores"):  # Saturated, e.g. by a long recompute
+        stored = client.get("/api/scores/1")
+        assert stored.status_code == 200 and stored.headers["X-Score-Source"] == "stored"
+        assert client.get("/api/scores/1", headers={"If-None-Match": fresh.headers["ETag"]}).status_code == 304
+        assert client.get("/api/scores/top?product_id=1").status_code == 200
+        shed = client.get("/api/scores/2")  # Stale: needs the scorer
+        assert shed.status_code == 503 and shed.headers["Retry-After"] == "1" and shed.json["gate"] == "scores"
+    assert client.get("/api/scores/2").status_code == 200
@@ -0,0 +1,73 @@
+from typing import Any, Dict, List
+
+import pytest
+from flask import Flask
+
+from config import config
+from core.dependency_container import DependencyContainer
+from core.logging_decorator import LoggingAIDecorator
+from src.business.ai.local_stub_api import LocalStubAIService
+from src.business.interfaces.IAIService import IAIInterface
+from src.presentation.api_server.flask_app.routes.ai_routes import ai_bp
+
+
+class NonStreamingService(IAIInterface):
+    def process_text(self, text: str, **kwargs) -> Dict[str, Any]:
+        return {"output": text.upper()}
+
+    def generate_image(self, prompt: str, **kwargs) -> bytes:
+        return b""
+
+    def embed_text(self, text: str, **kwargs) -> List[float]:
+        return []
+
+
+class CountingStream(IAIInterface):
+    """Records how far the consumer has read when each chunk is produced."""
+    def __init__(self):
+        self.produced = 0
+
+    def stream_text(self, text: str, **kwargs):
+        for chunk in ("a", "b", "c"):
+            self.produced += 1
+            yield chunk
+
+    process_text = NonStreamingService.process_text
+    generate_image = NonStreamingService.generate_image
+    embed_text = NonStreamingService.embed_text
+
+
+def test_default_stream_falls_back_to_one_process_text_chunk():
+    assert list(NonStreamingService().stream_text("hello")) == ["HELLO"]
+
+
+def test_logging_decorator_passes_chunks_through_unbuffered():
+    wrapped = CountingStream()
+    stream = LoggingAIDecorator(wrapped).stream_text("hi", request_id="r1")
+    assert next(stream) == "a" and wrapped.produced == 1  # Yielded before the next chunk is produced
+    assert list(stream) == ["b", "c"]
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(config, "ADMISSION_ENABLED", False)
+    container = DependencyContainer(configure=False)
+    stub = LocalStubAIService(latency_distribution="constant", latency_ms=0, ms_per_token=0, error_rate=0)
+    container.register_instance(IAIInterface, LoggingAIDecorator(stub))
+    app = Flask(__name__)
+    app.extensions["container"] = container
+    app.register_blueprint(ai_bp)
+    return app.test_client()
+
+
+def test_stream_endpoint_sends_chunked_text_with_request_id(client):
+    response = client.post("/api/ai/stream", json={"text": "two words"}, headers={"X-Request-ID": "abc123"})
+    assert response.status_code == 200 and response.is_streamed and response.mimetype == "text/plain"
+    assert response.headers["X-Request-ID"] == "abc123"
+    assert list(response.response) == [b"Stub", b" processed:", b" two", b" words"]
+    response.close()
+
+
+@pytest.mark.parametrize("body", [{}, {"text": ""}, ["text"], "text"])
+def test_stream_endpoint_rejects_bodies_without_text(client, body):
+    assert client.post("/api/ai/stream", json=body).status_code == 400
@@ -0,0 +1,115 @@
+import gzip
+import json
+import re
+from pathlib import Path
+
+import pytest
+from flask import Flask, render_template_string
+
+from admin.build_brand_assets import build_assets
+from src.presentation.api_server import flask_app
+from src.presentation.api_server.flask_app.assets import AssetManifest, init_assets
+
+
+@pytest.fixture
+def built(tmp_path):
+    source, output = tmp_path / "brand", tmp_path / "build"
+    (source / "icons").mkdir(parents=True)
+    (source / "favicon.ico").write_bytes(b"\x00\x00\x01\x00" + b"\x10" * 4000)
+    (source / "icons" / "site.webmanifest").write_text(json.dumps({"name": "JennAI", "icons": []} ) + " " * 200)
+    (source / "notes.html").write_text("<p>not an asset</p>")
+    manifest = build_assets(source, output, widths=(16,))
+    return source, output, manifest
+
+
+def test_build_writes_hashed_files_precompressed_siblings_and_a_manifest(built):
+    source, output, manifest = built
+    assert set(manifest["assets"]) == {"favicon.ico", "icons/site.webmanifest"}
+    favicon = manifest["assets"]["favicon.ico"]
+    assert favicon["file"].startswith("favicon.") and favicon["file"].endswith(".ico")
+    assert (output / favicon["file"]).read_bytes() == (source / "favicon.ico").read_bytes()
+    assert "gzip" in favicon["encodings"]
+    assert gzip.decompress((output / (favicon["file"] + ".gz")).read_bytes()) == (source / "favicon.ico").read_bytes()
+    assert json.loads((output / "manifest.json").read_text()) == manifest
+
+    (source / "favicon.ico").write_bytes(b"\x00\x00\x01\x00" + b"\x20" * 4000)  # Changed image: new name, old one pruned
+    rebuilt = build_assets(source, output, widths=(16,))
+    assert rebuilt["assets"]["favicon.ico"]["file"] != favicon["file"]
+    assert not (output / favicon["file"]).exists()
+
+
+def test_manifest_resolves_widths_and_formats():
+    manifest = AssetManifest({"logo.png": {"file": "logo.a.png", "width": 1000, "variants": [
+        {"file": "logo-480w.b.png", "width": 480, "format": "png"},
+        {"file": "logo-480w.c.webp", "width": 480, "format": "webp"},
+        {"file": "logo-1000w.d.webp", "width": 1000, "format": "webp"},
+    ]}})
+    assert manifest.resolve("logo.png", width=400) == "logo-480w.b.png"
+    assert manifest.resolve("logo.png", width=600, fmt="webp") == "logo-1000w.d.webp"
+    assert manifest.resolve("logo.png") == "logo.a.png"
+    assert manifest.resolve("logo.png", fmt="avif") == "logo.a.png"  # Format not built: the original
+    assert manifest.srcset("logo.png", "webp") == [("logo-480w.c.webp", 480), ("logo-1000w.d.webp", 1000)]
+
+
+def test_resized_and_webp_variants_are_built(tmp_path):
+    Image = pytest.importorskip("PIL.Image")
+    (tmp_path / "brand").mkdir()
+    Image.new("RGB", (1000, 500), "orange").save(tmp_path / "brand" / "hero.jpg")
+    entry = build_assets(tmp_path / "brand", tmp_path / "build", widths=(480, 2000))["assets"]["hero.jpg"]
+    assert (entry["width"], entry["height"]) == (1000, 500)
+    assert sorted((v["width"], v["format"]) for v in entry["variants"]) == [(480, "jpg"), (480, "webp"), (1000, "webp")]
+    with Image.open(tmp_path / "build" / entry["variants"][0]["file"]) as resized:
+        assert resized.size == (480, 240)
+
+
+def test_built_assets_are_served_immutable_and_precompressed(built):
+    source, output, manifest = built
+    app = Flask(__name__)
+    init_assets(app, build_dir=output, source_dir=source)
+    client = app.test_client()
+
+    with app.test_request_context():
+        url = render_template_string("{{ asset_url('favicon.ico') }}")
+        fallback = render_template_string("{{ asset_url('notes.html') }}")
+    assert url == f"/assets/{manifest['assets']['favicon.ico']['file']}"
+    assert fallback == "/assets/src/notes.html"
+
+    response = client.get(url, headers={"Accept-Encoding": "gzip"})
+    assert response.headers["Cache-Control"] == "public, max-age=31536000, immutable"
+    assert response.headers["Content-Encoding"] == "gzip" and response.mimetype == "image/vnd.microsoft.icon"
+    response.close()
+    plain = client.get(url)
+    assert "Content-Encoding" not in plain.headers and plain.data == (source / "favicon.ico").read_bytes()
+    plain.close()
+
+    assert client.get("/assets/manifest.json").status_code == 404  # Only manifest-listed files are served
+    source_response = client.get(fallback)
+    assert source_response.status_code == 200 and "immutable" not in source_response.headers["Cache-Control"]
+    source_response.close()
+
+
+def test_asset_type_follows_the_resolved_file(tmp_path):
+    build = tmp_path / "build"
+    build.mkdir()
+    template = "{{ asset_type('header_background.jpg', width=1920, format='webp') }}"
+
+    unbuilt = Flask(__name__)
+    init_assets(unbuilt, build_dir=build, source_dir=tmp_path)
+    with unbuilt.test_request_context():
+        assert render_template_string(template) == "image/jpeg"  # No build yet: the JPEG original is served
+
+    (build / "manifest.json").write_text(json.dumps({"assets": {"header_background.jpg": {
+        "file": "header_background.a.jpg", "width": 2400,
+        "variants": [{"file": "header_background-1920w.b.webp", "width": 1920, "format": "webp"}]}}}))
+    app = Flask(__name__)
+    init_assets(app, build_dir=build, source_dir=tmp_path)
+    with app.test_request_context():
+        assert render_template_string(template) == "image/webp"
+
+
+def test_header_background_preload_matches_the_image_the_header_uses():
+    templates = Path(flask_app.__file__).parent / "templates"
+    base, index = (templates / "base.html").read_text(), (templates / "index.html").read_text()
+    background = re.search(r'--header-background: url\("\{\{ (asset_url\(.*?\)) }}"\)', base).group(1)
+    assert "var(--header-background)" in base
+    assert f'href="{{{{ {background} }}}}"' in index and "imagesrcset" not in index
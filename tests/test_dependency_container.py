@@ -0,0 +1,194 @@
+import json
+import os
+import threading
+import time
+from typing import Optional
+
+import pytest
+
+from core.dependency_container import DependencyContainer, DependencyResolutionError
+from src.business.interfaces.IAIService import IAIInterface
+
+
+class Repository:
+    instances = 0
+
+    def __init__(self):
+        Repository.instances += 1
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+class Service:
+    def __init__(self, repository: Repository, label: str = "default", extra: Optional[Repository] = None):
+        self.repository = repository
+        self.label = label
+        self.extra = extra
+
+
+@pytest.fixture
+def container():
+    Repository.instances = 0
+    return DependencyContainer(configure=False)
+
+
+def test_singleton_is_lazy_and_built_once(container):
+    container.register_singleton(Repository)
+    assert Repository.instances == 0
+    assert container.resolve(Repository) is container.resolve(Repository)
+    assert Repository.instances == 1
+
+
+def test_singleton_construction_is_thread_safe(container):
+    container.register_singleton(Repository)
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(container.resolve(Repository))) for _ in range(16)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert Repository.instances == 1
+    assert all(r is results[0] for r in results)
+
+
+def test_transient_builds_new_instances(container):
+    container.register_transient(Repository)
+    assert container.resolve(Repository) is not container.resolve(Repository)
+
+
+def test_scoped_instances_are_per_scope_and_closed(container):
+    container.register_scoped(Repository)
+    with container.create_scope() as scope:
+        first = scope.resolve(Repository)
+        assert scope.resolve(Repository) is first
+    assert first.closed
+    with container.create_scope() as other:
+        assert other.resolve(Repository) is not first
+    with pytest.raises(DependencyResolutionError):
+        container.resolve(Repository)
+
+
+def test_scoped_services_can_depend_on_scoped_services(container):
+    container.register_scoped(Repository)
+    container.register_scoped(Service)  # Constructor injection of a scoped Repository
+    container.register_scoped("report", lambda: {"service": scope.resolve(Service)})  # Factory resolving from the scope
+    with container.create_scope() as scope:
+        report = scope.resolve("report")
+        assert report["service"] is scope.resolve(Service)
+        assert scope.resolve(Service).repository is scope.resolve(Repository)
+
+
+def test_circular_scoped_dependency_is_reported(container):
+    container.register_scoped("a", lambda: scope.resolve("b"))
+    container.register_scoped("b", lambda: scope.resolve("a"))
+    with container.create_scope() as scope:
+        with pytest.raises(DependencyResolutionError, match="a -> b -> a"):
+            scope.resolve("a")
+
+
+def test_constructor_auto_wiring(container):
+    container.register_singleton(Repository)
+    container.register(Service)
+    service = container.resolve(Service)
+    assert service.repository is container.resolve(Repository)
+    assert service.extra is service.repository  # Optional[...] dependencies are wired too
+    assert service.label == "default"
+
+
+def test_unknown_interface_raises_key_error(container):
+    with pytest.raises(KeyError):
+        container.resolve(Service)
+
+
+def test_circular_dependency_is_reported(container):
+    container.register("a", lambda: container.resolve("b"))
+    container.register("b", lambda: container.resolve("a"))
+    with pytest.raises(DependencyResolutionError, match="Circular dependency"):
+        container.resolve("a")
+
+
+def test_circular_singleton_dependency_is_reported_not_deadlocked(container):
+    container.register_singleton("a", lambda: container.resolve("b"))
+    container.register_singleton("b", lambda: container.resolve("a"))
+    with pytest.raises(DependencyResolutionError, match="a -> b -> a"):
+        container.resolve("a")
+    assert not container._registrations["a"].lock.locked()
+
+
+def test_configured_container_defers_service_construction():
+    container = DependencyContainer()
+    assert container.is_registered(IAIInterface)
+    assert not container._registrations[IAIInterface].has_instance
+
+
+def test_resolution_stats_attribute_time_to_the_slow_dependency(container):
+    def slow_repository():
+        time.sleep(0.02)
+        return Repository()
+
+    container.register_singleton(Repository, slow_repository)
+    container.register(Service)
+    container.resolve(Service)
+    container.resolve(Service)
+
+    stats = {item["name"]: item for item in container.get_resolution_stats()}
+    service = stats[f"{__name__}.Service"]
+    repository = stats[f"{__name__}.Repository"]
+    assert service["resolve_count"] == 2 and service["construct_count"] == 2
+    assert repository["construct_count"] == 1 and repository["construct_self_ms"] >= 15
+    assert service["construct_total_ms"] >= repository["construct_total_ms"]
+    assert service["construct_self_ms"] < repository["construct_self_ms"]
+    assert service["dependencies"] == [f"{__name__}.Repository"]
+
+
+def test_export_graph_formats(container):
+    container.register("a", lambda: container.resolve("b"))
+    container.register_singleton("b", lambda: object())
+    container.resolve("a")
+
+    graph = json.loads(container.export_graph("json"))
+    assert {node["name"] for node in graph["nodes"]} == {"a", "b"}
+    assert graph["edges"] == [{"from": "a", "to": "b"}]
+    dot = container.export_graph("dot")
+    assert dot.startswith("digraph") and '"a" -> "b";' in dot
+    with pytest.raises(ValueError):
+        container.export_graph("svg")
+
+
+def test_warm_builds_fork_safe_singletons_and_after_fork_drops_the_rest(container):
+    container.register_singleton(Repository)
+    container.register_singleton("pool", lambda: object(), fork_safe=False)
+    container.register("transient", lambda: object())
+
+    assert container.warm() == [Repository]
+    shared = container.resolve(Repository)
+    pool = container.resolve("pool")
+
+    container.after_fork()
+    assert container.resolve(Repository) is shared
+    assert container.resolve("pool") is not pool
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+def test_forked_child_rebuilds_fork_unsafe_singletons(container):
+    import core.bootstrap as bootstrap
+
+    pools = []
+    container.register_singleton(Repository)
+    container.register_singleton("pool", lambda: pools.append(object()) or pools[-1], fork_safe=False)
+    container.warm()
+    parent_pool = container.resolve("pool")
+    bootstrap._register_fork_handler(container)
+
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:  # Child: report whether the shared singleton survived and the pool was rebuilt
+        ok = Repository.instances == 1 and container.resolve("pool") is not parent_pool and len(pools) == 2
+        os.write(write_fd, b"1" if ok else b"0")
+        os._exit(0)
+    os.close(write_fd)
+    assert os.read(read_fd, 1) == b"1"
+    os.close(read_fd)
+    os.waitpid(pid, 0)
@@ -0,0 +1,106 @@
+import csv
+import io
+import sqlite3
+
+import pytest
+from flask import Flask
+
+from admin.export_data import export
+from config import config
+from src.data.implementations.sqllite.export import DATASETS, ExportRange, connect_read_only, iter_chunks
+from src.presentation.api_server.flask_app.routes.export_routes import export_bp
+
+
+@pytest.fixture
+def db_path(tmp_path, monkeypatch):
+    path = tmp_path / "textile.db"
+    conn = sqlite3.connect(path)
+    conn.execute("""CREATE TABLE currency_data (id INTEGER PRIMARY KEY AUTOINCREMENT, region_id INTEGER,
+                    currency_code TEXT, rate_to_usd REAL, volatility REAL, timestamp TIMESTAMP, source_id INTEGER)""")
+    conn.executemany("INSERT INTO currency_data (region_id, currency_code, rate_to_usd, volatility, timestamp) "
+                     "VALUES (1, 'VND', ?, 0.1, ?)", [(i / 10, f"2024-01-{i:02d}") for i in range(1, 26)])
+    conn.commit()
+    conn.close()
+    monkeypatch.setattr(config, "DB_PATH", path)
+    return path
+
+
+def test_chunks_are_keyset_paginated_and_time_filtered(db_path):
+    conn = connect_read_only(db_path)
+    chunks = list(iter_chunks(conn, DATASETS["fx"], ExportRange(after_id=3, until_id=20), chunk_rows=5))
+    assert [len(c) for c in chunks] == [5, 5, 5, 2] and chunks[0][0][0] == 4 and chunks[-1][-1][0] == 20
+    window = ExportRange(since="2024-01-10", until="2024-01-12")
+    assert [row[0] for rows in iter_chunks(conn, DATASETS["fx"], window) for row in rows] == [10, 11]
+    conn.close()
+
+
+def test_csv_endpoint_streams_and_resumes(db_path):
+    app = Flask(__name__)
+    app.register_blueprint(export_bp)
+    client = app.test_client()
+
+    response = client.get("/api/export/fx.csv?chunk_rows=4")
+    assert response.is_streamed and response.headers["X-Export-Until-Id"] == "25"
+    rows = list(csv.reader(io.StringIO(response.get_data(as_text=True))))
+    response.close()
+    assert rows[0] == list(DATASETS["fx"].columns) and len(rows) == 26
+
+    resumed = client.get("/api/export/fx.csv?after_id=22&until_id=25")
+    assert [row[0] for row in csv.reader(io.StringIO(resumed.get_data(as_text=True)))] == ["23", "24", "25"]
+    resumed.close()  # No header: appends cleanly to the interrupted download
+    with_header = client.get("/api/export/fx.csv?after_id=22&until_id=25&header=1")
+    assert with_header.get_data(as_text=True).startswith(",".join(DATASETS["fx"].columns))
+    with_header.close()
+    assert client.get("/api/export/nope.csv").status_code == 404
+    assert client.get("/api/export/fx.csv?chunk_rows=0").status_code == 400
+
+
+def test_connection_is_closed_when_the_range_cannot_be_pinned(db_path, monkeypatch):
+    from src.presentation.api_server.flask_app.routes import export_routes
+
+    opened = []
+
+    def connect(path):
+        opened.append(connect_read_only(path))
+        return opened[-1]
+
+    def locked(*args):
+        raise sqlite3.OperationalError("database is locked")
+
+    monkeypatch.setattr(export_routes, "connect_read_only", connect)
+    monkeypatch.setattr(export_routes, "pin_range", locked)
+    app = Flask(__name__)
+    app.register_blueprint(export_bp)
+    assert app.test_client().get("/api/export/fx.csv").status_code == 503
+    with pytest.raises(sqlite3.ProgrammingError):  # Closed
+        opened[0].execute("SELECT 1")
+
+
+def test_cli_resumes_an_interrupted_csv(db_path, tmp_path):
+    output = tmp_path / "fx.csv"
+    export("fx", "csv", output, ExportRange(), chunk_rows=3, db_path=db_path)
+    lines = output.read_bytes().splitlines(keepends=True)
+    output.write_bytes(b"".join(lines[:11]) + lines[11][:7])  # Interrupted mid-row after id 10
+    with sqlite3.connect(db_path) as conn:  # Rows inserted before the resume
+        conn.execute("INSERT INTO currency_data (region_id, currency_code) VALUES (1, 'VND')")
+
+    export("fx", "csv", output, ExportRange(), chunk_rows=3, db_path=db_path, resume=True)
+    ids = [row[0] for row in csv.reader(output.open())][1:]
+    assert ids == [str(i) for i in range(1, 26)]  # Stops at the bound the first attempt was pinned to
+
+
+def test_cli_resume_without_a_pinned_bound_is_refused(db_path, tmp_path):
+    output = tmp_path / "fx.csv"
+    output.write_bytes(b"id,region_id\n1,1\n")
+    with pytest.raises(ValueError, match="--until-id"):
+        export("fx", "csv", output, ExportRange(), chunk_rows=3, db_path=db_path, resume=True)
+    export("fx", "csv", output, ExportRange(until_id=3), chunk_rows=3, db_path=db_path, resume=True)
+    assert [row[0] for row in csv.reader(output.open())][1:] == ["1", "2", "3"]
+
+
+def test_parquet_export_round_trips(db_path, tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    output = tmp_path / "fx.parquet"
+    export("fx", "parquet", output, ExportRange(), chunk_rows=7, db_path=db_path)
+    table = pq.read_table(output)
+    assert table.num_rows == 25 and table.column("id").to_pylist() == list(range(1, 26))
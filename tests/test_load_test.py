@@ -0,0 +1,51 @@
+import json
+
+import pytest
+from flask import Flask
+
+from admin import load_test
+
+
+@pytest.fixture
+def app():
+    app = Flask(__name__)
+
+    @app.route("/ok")
+    def ok():
+        return "ok"
+
+    @app.route("/broken")
+    def broken():
+        return "no", 503
+
+    return app
+
+
+def test_mix_parsing():
+    assert load_test.parse_mix(["GET /api/scores/top?k=10 2", "post /healthz"]) == [
+        ("GET", "/api/scores/top?k=10", 2.0), ("POST", "/healthz", 1.0)]
+    with pytest.raises(ValueError):
+        load_test.parse_mix(["GET api/scores"])
+    with pytest.raises(ValueError):
+        load_test.parse_mix(["GET /ok -1"])
+
+
+def test_percentiles_use_nearest_rank():
+    values = [i / 1000 for i in range(1, 101)]
+    assert load_test.percentile(values, 50) == 0.05 and load_test.percentile(values, 99) == 0.099
+    assert load_test.percentile([], 95) == 0.0
+
+
+def test_in_process_run_reports_throughput_latency_and_errors(app):
+    mix = load_test.parse_mix(["GET /ok 3", "GET /broken 1"])
+    results = load_test.run_load_test(load_test.in_process_sender_factory(app), mix, concurrency=2,
+                                      duration_s=0.3, seed=1)
+    ok, broken = results["endpoints"]["GET /ok"], results["endpoints"]["GET /broken"]
+    assert ok["requests"] > 0 and ok["error_rate"] == 0 and ok["status_codes"] == {"200": ok["requests"]}
+    assert broken["error_rate"] == 1.0
+    assert results["overall"]["requests"] == ok["requests"] + broken["requests"]
+    assert results["overall"]["latency_ms"]["p50"] <= results["overall"]["latency_ms"]["p99"]
+    json.dumps(results)  # Saved as-is
+
+    rows = load_test.compare_results(results, results)
+    assert rows[0]["request"] == "overall" and rows[0]["rps"][0] == rows[0]["rps"][1]
@@ -0,0 +1,77 @@
+import zipfile
+
+from admin.check_logs import parse_log_file
+from admin.log_analyzer import analyze_files, compile_patterns, scan_file
+
+LOG_LINES = [
+    "2025-07-25T10:00:01.000000+0000 | INFO | core.bootstrap:get_configured_container:11 | Bootstrapping",
+    "2025-07-25T10:00:02.000000+0000 | WARNING | src.data.seed:seed_data:4 | Slow insert",
+    "2025-07-25T10:01:03.000000+0000 | ERROR | src.data.seed:seed_data:9 | Failed: Exception: boom (error)",
+    "Traceback (most recent call last):",
+    "2025-07-25T11:05:00.000000+0000 | DEBUG | core.bootstrap:prewarm_container:40 | done",
+]
+
+
+def _write_log(path):
+    path.write_text("\n".join(LOG_LINES) + "\n", encoding="utf-8")
+    return path
+
+
+def test_scan_counts_each_line_once_per_category(tmp_path):
+    result = scan_file(_write_log(tmp_path / "jennai.log"), ["ERROR", "Exception:", r"Traceback \(most recent"], ["WARNING"])
+    assert result.error_count == 2 and result.warning_count == 1
+    assert [line.split(": ", 1)[0] for line in result.errors_found] == ["jennai.log:L3", "jennai.log:L4"]
+    assert result.levels == {"INFO": 1, "WARNING": 1, "ERROR": 1, "DEBUG": 1}
+    assert result.modules["core.bootstrap"] == 2
+    assert result.buckets == {"2025-07-25T10:00": 2, "2025-07-25T10:01": 1, "2025-07-25T11:05": 1}
+
+
+def test_small_chunks_and_zip_archives_give_the_same_result(tmp_path):
+    log = _write_log(tmp_path / "jennai.log")
+    archive = tmp_path / "jennai.2025-07-24_00-00-00_000000.log.zip"
+    with zipfile.ZipFile(archive, "w") as zf:
+        zf.write(log, "jennai.2025-07-24_00-00-00_000000.log")
+
+    whole = scan_file(log, ["ERROR"], ["WARNING"], bucket="hour")
+    chunked = scan_file(archive, ["ERROR"], ["WARNING"], bucket="hour", chunk_size=16)
+    assert (chunked.error_count, chunked.warning_count, chunked.lines) == (whole.error_count, whole.warning_count, 5)
+    assert chunked.buckets == whole.buckets == {"2025-07-25T10": 3, "2025-07-25T11": 1}
+
+    combined = analyze_files([archive, log], ["ERROR"], ["WARNING"], workers=2)
+    assert combined.error_count == 2 * whole.error_count and len(combined.files) == 2
+
+
+def test_patterns_without_literal_prefix_still_match():
+    matcher = compile_patterns([r"(fatal|panic)"], [r"\bdeprecated"])
+    assert [m.lastgroup for m in matcher.finditer(b"PANIC then Deprecated")] == ["error", "warning"]
+
+
+def test_parse_log_file_keeps_its_return_shape(tmp_path):
+    ok, errors, warnings, error_lines, warning_lines = parse_log_file(_write_log(tmp_path / "app.log"), ["ERROR"], ["WARNING"])
+    assert (ok, errors, warnings) == (False, 1, 1)
+    assert error_lines[0].startswith("L3: ") and warning_lines[0].startswith("L2: ")
+
+
+def test_log_index_is_incremental_and_follows_rotation(tmp_path):
+    from admin.log_index import LogIndex
+
+    log = _write_log(tmp_path / "jennai.log")
+    with LogIndex(tmp_path / "index.sqlite") as index:
+        assert index.update([log]) == 4
+        assert index.update([log]) == 0
+
+        with open(log, "a", encoding="utf-8") as f:  # Continuation of the last record, then a new record
+            f.write("  more detail\n2025-07-25T11:06:00.000000+0000 | ERROR | core.x:f:1 | [Request ID: r-42] failed\n")
+        assert index.update([log]) == 1
+        last_debug = list(index.query(since="2025-07-25 11:05", until="2025-07-25T11:05"))
+        assert last_debug[0].text.endswith("done\n  more detail")
+
+        records = list(index.query(request_id="r-42"))
+        assert [(r.level, r.minute, r.module) for r in records] == [("ERROR", "2025-07-25T11:06", "core.x")]
+        errors = list(index.query(level="ERROR", since="2025-07-25T10:00"))
+        assert [r.minute for r in errors] == ["2025-07-25T10:01", "2025-07-25T11:06"]
+        assert errors[0].text.endswith("Traceback (most recent call last):")
+
+        log.write_text(LOG_LINES[0] + "\n", encoding="utf-8")  # Rotated: a new, shorter file replaces it
+        index.update([log])
+        assert not list(index.query(request_id="r-42"))
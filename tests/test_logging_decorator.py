@@ -0,0 +1,67 @@
+from typing import Any, Dict, List
+
+import pytest
+from loguru import logger
+
+from config import config
+from config.loguru_setup import setup_logging
+from core import logging_decorator
+from core.logging_decorator import LoggingAIDecorator
+from src.business.interfaces.IAIService import IAIInterface
+
+
+class EchoService(IAIInterface):
+    def process_text(self, text: str, **kwargs) -> Dict[str, Any]:
+        if text == "fail":
+            raise RuntimeError("provider down")
+        return {"output": text.upper()}
+
+    def generate_image(self, prompt: str, **kwargs) -> bytes:
+        return b""
+
+    def embed_text(self, text: str, **kwargs) -> List[float]:
+        return [0.0, 1.0]
+
+
+@pytest.fixture
+def capture_logs():
+    """Replaces the session sinks with a list sink at the given level; restores them afterwards."""
+    records = []
+
+    def start(level: str):
+        logger.remove()
+        logger.add(lambda message: records.append(message.record), level=level)
+        return records
+
+    yield start
+    setup_logging(log_file_name="pytest_session.log", debug_mode=config.DEBUG_MODE)
+
+
+def test_completion_records_carry_structured_fields(capture_logs):
+    records = capture_logs("INFO")
+    LoggingAIDecorator(EchoService()).process_text("hello", request_id="r1")
+    started, finished = records
+    assert started["message"].startswith("[Request ID: r1] AI: Initiating text processing")
+    extra = finished["extra"]
+    assert extra["component"] == "AI" and extra["request_id"] == "r1" and extra["operation"] == "text processing"
+    assert extra["input_size"] == 5 and extra["output_size"] == 5 and extra["duration_ms"] >= 0
+
+
+def test_nothing_is_formatted_when_no_sink_accepts_the_level(capture_logs, monkeypatch):
+    calls = []
+    monkeypatch.setattr(logging_decorator, "summarize", lambda *args: calls.append("summarize") or "")
+    monkeypatch.setattr(logging_decorator, "payload_size", lambda *args: calls.append("payload_size") or 0)
+    records = capture_logs("WARNING")
+    service = LoggingAIDecorator(EchoService())
+    assert service.process_text("hello", request_id="r1") == {"output": "HELLO"}
+    assert list(service.stream_text("hello", request_id="r1")) == ["HELLO"]
+    assert records == [] and calls == []
+
+
+def test_errors_are_logged_with_the_exception_and_re_raised(capture_logs):
+    records = capture_logs("ERROR")
+    with pytest.raises(RuntimeError, match="provider down"):
+        LoggingAIDecorator(EchoService()).process_text("fail", request_id="r2")
+    (error,) = records
+    assert error["level"].name == "ERROR" and error["message"].startswith("[Request ID: r2] AI: Error during text processing")
+    assert isinstance(error["exception"].value, RuntimeError) and error["extra"]["input_size"] == 4
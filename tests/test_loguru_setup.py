@@ -0,0 +1,36 @@
+from types import SimpleNamespace
+
+import pytest
+
+from config.loguru_setup import DebugSampler, setup_logging
+
+
+def _record(name: str, level_no: int = 10):
+    return {"name": name, "level": SimpleNamespace(no=level_no)}
+
+
+def test_sampler_keeps_one_in_n_debug_records_and_all_info():
+    sampler = DebugSampler(sample_rate=0.25)
+    kept = [sampler(_record("hot.path")) for _ in range(100)]
+    assert sum(kept) == 25
+    assert all(sampler(_record("hot.path", level_no=20)) for _ in range(10))
+
+
+def test_sampler_overrides_use_longest_prefix():
+    sampler = DebugSampler(sample_rate=1.0, overrides={"src": 0.0, "src.data": 1.0})
+    assert not sampler(_record("src.business.scorer"))
+    assert sampler(_record("src.data.seed_data"))
+    assert sampler(_record("srcx"))  # Prefixes match whole module path segments only
+
+
+def test_sampler_rate_limit_refills_over_time():
+    now = [0.0]
+    sampler = DebugSampler(sample_rate=1.0, rate_limit_per_s=5, clock=lambda: now[0])
+    assert sum(sampler(_record("burst")) for _ in range(20)) == 5
+    now[0] += 1.0
+    assert sum(sampler(_record("burst")) for _ in range(20)) == 5
+
+
+def test_unknown_profile_is_rejected():
+    with pytest.raises(ValueError):
+        setup_logging(profile="verbose")
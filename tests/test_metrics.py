@@ -0,0 +1,86 @@
+import math
+import threading
+
+import pytest
+from flask import Flask
+
+from core.metrics import MetricsRegistry, timed
+from src.presentation.api_server.flask_app.routes.metrics_routes import metrics_bp
+
+
+def test_counters_merge_per_thread_shards_including_finished_threads():
+    registry = MetricsRegistry()
+    calls = registry.counter("calls_total", "Calls.", ["backend"])
+    stub = calls.labels(backend="stub")
+
+    def work():
+        for _ in range(1000):
+            stub.inc()
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert stub.value == 8000
+    stub.inc(2)
+    assert stub.value == 8002  # Shards of exited threads were folded in, not lost
+    with pytest.raises(ValueError):
+        stub.inc(-1)
+    with pytest.raises(ValueError):
+        calls.labels(region="eu")
+
+
+def test_histogram_buckets_and_quantiles():
+    registry = MetricsRegistry()
+    latency = registry.histogram("latency_seconds", "Latency.", buckets=(0.1, 0.2, 0.5))
+    for value in (0.05, 0.15, 0.15, 0.3, 2.0):
+        latency.observe(value)
+
+    snapshot = latency._default.snapshot()
+    assert snapshot["counts"] == [1, 2, 1, 1] and snapshot["count"] == 5
+    assert snapshot["sum"] == pytest.approx(2.65)
+    assert latency.quantile(0.5) == pytest.approx(0.175)  # Rank 2.5 of 5, halfway through (0.1, 0.2]
+    assert latency.quantile(0.99) == 0.5  # Falls in +Inf: the highest finite bound
+    assert math.isnan(registry.histogram("empty_seconds", "Empty.").quantile(0.5))
+
+
+def test_render_prometheus_text():
+    registry = MetricsRegistry()
+    registry.counter("scored_total", "Regions scored.").inc(3)
+    registry.gauge("queue_depth", "Queued requests.").set_function(lambda: 7)
+    registry.histogram("load_seconds", 'Loader "time".', ["loader"], buckets=(0.5,)).labels(loader="fx").observe(0.25)
+
+    text = registry.render()
+    assert "# TYPE scored_total counter\nscored_total 3\n" in text
+    assert "queue_depth 7\n" in text
+    assert 'load_seconds_bucket{loader="fx",le="0.5"} 1\n' in text
+    assert 'load_seconds_bucket{loader="fx",le="+Inf"} 1\n' in text
+    assert 'load_seconds_sum{loader="fx"} 0.25\n' in text
+    with pytest.raises(ValueError):
+        registry.gauge("scored_total", "Same name, other type.")
+
+
+def test_timed_decorator_and_metrics_endpoint():
+    registry = MetricsRegistry()
+    seconds = registry.histogram("work_seconds", "Work.")
+
+    @timed(seconds)
+    def work():
+        return 42
+
+    assert work() == 42 and seconds._default.snapshot()["count"] == 1
+
+    app = Flask(__name__)
+    app.register_blueprint(metrics_bp)
+
+    @app.route("/scores/<int:product_id>")
+    def scores(product_id):
+        return {"product_id": product_id}
+
+    client = app.test_client()
+    client.get("/scores/1")
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.content_type.startswith("text/plain; version=0.0.4")
+    assert 'jennai_http_request_seconds_count{method="GET",route="/scores/<int:product_id>",status="200"} ' in response.text
@@ -0,0 +1,50 @@
+import sys
+
+import pytest
+
+from admin.profile_imports import diff_profiles, parse_importtime
+from core.lazy_import import lazy_import
+
+IMPORTTIME_STDERR = """\
+import time: self [us] | cumulative | imported package
+import time:       364 |        364 |       _json
+import time:       821 |       1184 |     json.scanner
+import time:       790 |      15239 |   json.decoder
+import time:       911 |        911 |   json.encoder
+import time:       554 |      16703 | json
+Traceback noise that is not an import line
+import time:   garbled line
+"""
+
+
+def test_importtime_output_is_parsed_with_nesting_depth():
+    modules = parse_importtime(IMPORTTIME_STDERR)
+    assert list(modules) == ["_json", "json.scanner", "json.decoder", "json.encoder", "json"]
+    assert modules["json"] == {"self_us": 554, "cumulative_us": 16703, "depth": 0}
+    assert modules["json.decoder"]["depth"] == 1 and modules["_json"]["depth"] == 3
+
+
+def test_diff_reports_package_changes_largest_first():
+    baseline = {"packages": {"json": 3000, "flask": 50000, "numpy": 90000}}
+    current = {"packages": {"json": 3000, "flask": 52000, "loguru": 8000}}
+    assert diff_profiles(current, baseline) == [
+        {"package": "numpy", "baseline_us": 90000, "current_us": 0, "delta_us": -90000},
+        {"package": "loguru", "baseline_us": 0, "current_us": 8000, "delta_us": 8000},
+        {"package": "flask", "baseline_us": 50000, "current_us": 52000, "delta_us": 2000},
+    ]
+
+
+def test_lazy_import_defers_loading_until_first_attribute_access(tmp_path, monkeypatch):
+    (tmp_path / "jennai_lazy_probe.py").write_text("import sys\nsys.jennai_lazy_probe_loads += 1\nVALUE = 42\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setattr(sys, "jennai_lazy_probe_loads", 0, raising=False)
+    monkeypatch.delitem(sys.modules, "jennai_lazy_probe", raising=False)
+
+    module = lazy_import("jennai_lazy_probe")
+    assert sys.jennai_lazy_probe_loads == 0
+    assert module.VALUE == 42 and sys.jennai_lazy_probe_loads == 1
+    assert lazy_import("jennai_lazy_probe") is module  # Already imported: returned as is
+    monkeypatch.delitem(sys.modules, "jennai_lazy_probe")
+
+    with pytest.raises(ModuleNotFoundError):
+        lazy_import("jennai_no_such_module")
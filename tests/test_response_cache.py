@@ -0,0 +1,79 @@
+import gzip
+import time
+
+import pytest
+from flask import Flask, jsonify
+
+from src.presentation.api_server.flask_app.response_cache import (
+    CachedResponse, DiskResponseCache, MemoryResponseCache, cache_response, init_response_cache,
+)
+from src.presentation.api_server.flask_app.serialization import init_compression
+
+
+@pytest.fixture
+def app():
+    app = Flask(__name__)
+    init_compression(app)
+    app.calls = []
+    app.version = ["v1"]
+
+    @app.route("/scores/<int:product_id>")
+    @cache_response
+    def scores(product_id):
+        app.calls.append(product_id)
+        response = jsonify({"product_id": product_id, "rows": ["Vietnam"] * 200, "version": app.version[0]})
+        response.set_etag(f"scores-{product_id}-{app.version[0]}")
+        return response
+
+    @app.route("/live")
+    def live():
+        return jsonify(calls=len(app.calls))
+
+    init_response_cache(app, MemoryResponseCache(), version=lambda: app.version[0])
+    return app
+
+
+def test_responses_are_cached_until_the_data_version_changes(app):
+    client = app.test_client()
+    first, second = client.get("/scores/1"), client.get("/scores/1")
+    assert (first.headers["X-Cache"], second.headers["X-Cache"]) == ("MISS", "HIT")
+    assert second.json == first.json and app.calls == [1]
+    assert client.get("/scores/1?format=columnar").headers["X-Cache"] == "MISS"  # Args are part of the key
+
+    app.version[0] = "v2"  # Ingest or a scoring run
+    assert client.get("/scores/1").headers["X-Cache"] == "MISS" and app.calls == [1, 1, 1]
+    assert "X-Cache" not in client.get("/live").headers
+
+
+def test_compressed_bodies_are_cached_per_encoding_and_revalidated(app):
+    client = app.test_client()
+    client.get("/scores/2", headers={"Accept-Encoding": "gzip"})
+    hit = client.get("/scores/2", headers={"Accept-Encoding": "gzip"})
+    assert hit.headers["X-Cache"] == "HIT" and hit.headers["Content-Encoding"] == "gzip"
+    assert b'"product_id":2' in gzip.decompress(hit.data).replace(b" ", b"")
+    assert client.get("/scores/2").headers["X-Cache"] == "MISS"  # Identity is a separate entry
+
+    not_modified = client.get("/scores/2", headers={"Accept-Encoding": "gzip", "If-None-Match": hit.headers["ETag"]})
+    assert not_modified.status_code == 304 and app.calls == [2, 2]
+
+
+def test_unreadable_version_bypasses_the_cache(app):
+    app.extensions["response_cache_version"] = lambda: None
+    client = app.test_client()
+    assert [client.get("/scores/3").headers["X-Cache"] for _ in range(2)] == ["BYPASS", "BYPASS"]
+
+
+def test_memory_backend_is_bounded_by_bytes():
+    cache = MemoryResponseCache(max_entries=10, max_bytes=10)
+    for key in "abc":
+        cache.set(key, CachedResponse(200, [], b"1234", time.time()))
+    assert cache.get("a") is None and cache.get("c") is not None and cache.size_bytes() == 8
+
+
+def test_disk_backend_round_trips_and_evicts(tmp_path):
+    cache = DiskResponseCache(tmp_path, max_bytes=2000, ttl_s=60)
+    cache.set("k1", CachedResponse(200, [("Content-Type", "application/json")], b"{}", time.time()))
+    assert DiskResponseCache(tmp_path).get("k1").headers == [("Content-Type", "application/json")]  # Another worker
+    for i in range(10):
+        cache.set(f"big{i}", CachedResponse(200, [], b"x" * 400, time.time()))
+    assert cache.size_bytes() <= 2000 and cache.get("big9") is not None
@@ -0,0 +1,75 @@
+import os
+import threading
+import time
+
+from flask import Flask
+
+from config import config
+from core.sampling_profiler import SamplingProfiler, profiler
+from src.presentation.api_server.flask_app.routes.admin_routes import admin_bp
+
+
+def _busy_loop(stop):
+    while not stop.is_set():
+        sum(range(1000))
+
+
+def test_samples_other_threads_into_collapsed_stacks(tmp_path):
+    stop = threading.Event()
+    worker = threading.Thread(target=_busy_loop, args=(stop,), name="scoring worker")
+    worker.start()
+    sampler = SamplingProfiler(interval_s=0.002)
+    try:
+        assert sampler.start() and not sampler.start()
+        time.sleep(0.1)
+    finally:
+        stacks = sampler.stop()
+        stop.set()
+        worker.join()
+
+    assert not sampler.running and sampler.samples > 0
+    worker_stacks = [stack for stack in stacks if stack.startswith("scoring_worker;")]
+    assert worker_stacks and all("_busy_loop_(test_sampling_profiler.py:" in stack for stack in worker_stacks)
+    assert not any(stack.startswith("sampling-profiler") for stack in stacks)
+
+    path = sampler.dump(tmp_path / "run.collapsed")
+    line = path.read_text().splitlines()[0]
+    stack, count = line.rsplit(" ", 1)
+    assert int(count) >= 1 and ";" in stack
+    assert sampler.stop() is stacks  # Stopping again is a no-op
+
+
+def test_admin_endpoints_need_the_token(monkeypatch, tmp_path):
+    app = Flask(__name__)
+    app.register_blueprint(admin_bp)
+    client = app.test_client()
+
+    monkeypatch.setattr(config, "ADMIN_API_TOKEN", "")
+    assert client.get("/admin/profiler").status_code == 404
+    monkeypatch.setattr(config, "ADMIN_API_TOKEN", "secret")
+    assert client.get("/admin/profiler", headers={"X-Admin-Token": "wrong"}).status_code == 403
+
+    monkeypatch.setattr(config, "PROFILE_DIR", tmp_path)
+    headers = {"X-Admin-Token": "secret"}
+    try:
+        assert client.post("/admin/profiler/start?interval_ms=2", headers=headers).status_code == 202
+        assert client.get("/admin/profiler", headers=headers).json["running"] is True
+        time.sleep(0.05)
+    finally:
+        response = client.post("/admin/profiler/stop", headers=headers)
+    assert response.status_code == 200 and not profiler.running
+    assert response.headers["X-Profile-Path"].startswith(str(tmp_path))
+    assert response.headers["X-Profile-Path"].endswith(f"-{os.getpid()}.collapsed")
+
+    stale = client.post("/admin/profiler/stop", headers=headers)  # Nothing running in this worker
+    assert stale.status_code == 409 and stale.json["pid"] == os.getpid()
+
+
+def test_interval_override_applies_to_one_run_only():
+    sampler = SamplingProfiler(interval_s=0.01)
+    sampler.start(interval_s=0.002)
+    assert sampler.status()["interval_ms"] == 2.0
+    sampler.stop()
+    sampler.start()
+    assert sampler.status()["interval_ms"] == 10.0 and sampler.interval_s == 0.01
+    sampler.stop()
@@ -0,0 +1,108 @@
+import sqlite3
+
+import pytest
+from flask import Flask
+
+from core.dependency_container import DependencyContainer
+from src.business.ai.pricing_engine.score_service import ScoreService
+from src.data.implementations.sqllite.reference_lookups import ReferenceLookups
+from src.data.implementations.sqllite.score_repository import SCORE_FIELDS, ScoreRepository, bump_data_version
+from src.presentation.api_server.flask_app.routes.score_routes import scores_bp
+
+SCORES = {
+    1: {"Mexico": 0.7, "Vietnam": 0.6},
+    2: {"Vietnam": 0.9, "Mexico": 0.1},
+}
+
+
+@pytest.fixture
+def service(db_path):
+    calls = []
+
+    def scorer(product_id):
+        calls.append(product_id)
+        return {region: {"policy_score": 0.5, "currency_score": 0.5, "supply_score": 0.5, "uq": 0.1, "final_score": score}
+                for region, score in SCORES.get(product_id, {}).items()}
+
+    service = ScoreService(ScoreRepository(db_path), scorer=scorer)
+    service.scorer_calls = calls
+    return service
+
+
+@pytest.fixture
+def client(service):
+    container = DependencyContainer(configure=False)
+    container.register_instance(ScoreService, service)
+    app = Flask(__name__)
+    app.extensions["container"] = container
+    app.register_blueprint(scores_bp)
+    return app.test_client()
+
+
+def test_scores_are_computed_once_then_served_from_sourcing_scores(service, db_path):
+    first = service.get_scores(1)
+    assert first.source == "computed" and list(first.scores) == ["Mexico", "Vietnam"]
+    second = service.get_scores(1)
+    assert second.source == "stored" and second.scores == first.scores
+    assert service.scorer_calls == [1]
+
+    conn = sqlite3.connect(db_path)
+    with conn:
+        bump_data_version(conn)  # New inputs: stored scores are stale
+    conn.close()
+    assert service.get_scores(1).source == "computed" and service.scorer_calls == [1, 1]
+
+
+def test_top_ranks_across_products(service):
+    top = service.top(3)
+    assert [(row["product_id"], row["region"]) for row in top] == [(2, "Vietnam"), (1, "Mexico"), (1, "Vietnam")]
+    assert service.top(1, product_id=1)[0]["region"] == "Mexico"
+
+
+def test_unstorable_scores_fall_back_to_computing(tmp_path):
+    service = ScoreService(ScoreRepository(tmp_path / "empty.db"), scorer=lambda product_id: {"Mexico": {"final_score": 1.0}})
+    result = service.get_scores(1)
+    assert result.source == "fallback" and result.scores == {"Mexico": {"final_score": 1.0}}
+    assert service.data_version() == 0
+    assert not (tmp_path / "empty.db").exists()  # A missing database is never created as a stub
+
+
+def test_etags_follow_the_data_version_and_give_304s(client, service):
+    response = client.get("/api/scores/1")
+    assert response.status_code == 200 and response.headers["X-Score-Source"] == "computed"
+    assert [row["region"] for row in response.json["scores"]] == ["Mexico", "Vietnam"]
+    etag = response.headers["ETag"]
+
+    cached = client.get("/api/scores/1", headers={"If-None-Match": etag})
+    assert cached.status_code == 304 and cached.headers["ETag"] == etag
+
+    service.repository.bump_data_version()
+    changed = client.get("/api/scores/1", headers={"If-None-Match": etag})
+    assert changed.status_code == 200 and changed.headers["ETag"] != etag
+    assert service.scorer_calls == [1, 1]
+
+
+def test_top_endpoint_and_validation(client):
+    response = client.get("/api/scores/top?k=2")
+    assert response.status_code == 200 and [row["final_score"] for row in response.json["scores"]] == [0.9, 0.7]
+    assert client.get("/api/scores/top?k=2", headers={"If-None-Match": response.headers["ETag"]}).status_code == 304
+    assert client.get("/api/scores/top?k=0").status_code == 400
+    assert client.get("/api/scores/99").status_code == 404
+
+
+def test_saving_scores_takes_region_ids_from_the_reference_lookups(db_path):
+    lookups = ReferenceLookups.from_database(db_path)
+    repository = ScoreRepository(db_path, lookups=lookups)
+    statements = []
+    repository._connection().set_trace_callback(statements.append)
+    scores = {"Vietnam": dict.fromkeys(SCORE_FIELDS, 0.5)}
+    repository.save_scores(1, scores, data_version=0)
+    assert repository.load_scores(1) == scores
+    assert not any("SELECT name, id FROM regions" in sql for sql in statements)
+
+    conn = sqlite3.connect(db_path)
+    with conn:
+        conn.execute("INSERT INTO regions (id, name) VALUES (3, 'Turkey')")  # Added after the lookups were loaded
+    conn.close()
+    repository.save_scores(2, {"Turkey": dict.fromkeys(SCORE_FIELDS, 0.4)}, data_version=0)
+    assert list(repository.load_scores(2)) == ["Turkey"]
@@ -0,0 +1,98 @@
+import json
+
+import pytest
+from flask import Flask
+
+from config import config
+from core.dependency_container import DependencyContainer
+from src.business.ai.pricing_engine.score_events import ScoreEventBroker
+from src.business.ai.pricing_engine.score_service import ScoreService
+from src.data.implementations.sqllite.score_repository import ScoreRepository
+from src.presentation.api_server.flask_app.routes.score_routes import scores_bp
+
+
+def _scores(**final_scores):
+    return {region: {"policy_score": 0.5, "currency_score": 0.5, "supply_score": 0.5, "uq": 0.1, "final_score": score}
+            for region, score in final_scores.items()}
+
+
+def test_only_changed_regions_reach_matching_subscribers():
+    broker = ScoreEventBroker()
+    everything, product_2 = broker.subscribe(), broker.subscribe(product_ids=[2])
+
+    broker.publish_scores(1, 1, _scores(Vietnam=0.9, Mexico=0.5))
+    assert broker.publish_scores(1, 1, _scores(Vietnam=0.9, Mexico=0.5)) is None  # Unchanged run: no event
+    broker.publish_scores(1, 2, _scores(Vietnam=0.8))
+
+    first, second = everything.get(timeout=0)
+    assert set(first.data["changed"]) == {"Vietnam", "Mexico"}
+    assert second.data["changed"] == _scores(Vietnam=0.8) and second.data["removed"] == ["Mexico"]
+    assert product_2.get(timeout=0) == []
+
+
+def test_slow_subscribers_get_a_resync_instead_of_blocking_publishers():
+    broker = ScoreEventBroker(max_queue=2)
+    slow = broker.subscribe()
+    for version in range(5):
+        broker.publish_scores(1, version, _scores(Vietnam=version / 10))
+    assert [event.event for event in slow.get(timeout=0)] == ["resync"]
+    broker.publish_scores(1, 9, _scores(Vietnam=0.9))
+    assert [event.event for event in slow.get(timeout=0)] == ["scores"]
+
+
+def test_reconnecting_clients_replay_what_they_missed():
+    broker = ScoreEventBroker(history=2)
+    for version in range(3):
+        broker.publish_scores(1, version, _scores(Vietnam=version / 10))
+    assert [e.id for e in broker.subscribe(last_event_id=2).get(timeout=0)] == [3]
+    assert [e.event for e in broker.subscribe(last_event_id=0).get(timeout=0)] == ["resync"]  # Beyond the history
+    assert [e.event for e in broker.subscribe(last_event_id=99).get(timeout=0)] == ["resync"]  # Another process's id
+
+
+def test_runs_committed_elsewhere_are_picked_up_by_the_watcher(db_path):
+    broker = ScoreEventBroker(ScoreRepository(db_path), poll_interval_s=0.05)
+    subscription = broker.subscribe(product_ids=[2])
+    ScoreRepository(db_path).save_scores(2, _scores(Mexico=0.4), data_version=0)  # e.g. another server worker
+    events = subscription.get(timeout=5)
+    assert [(e.event, e.product_id) for e in events] == [("scores", 2)]
+    broker.unsubscribe(subscription)
+
+
+def test_stream_endpoint_sends_server_sent_events(db_path, monkeypatch):
+    monkeypatch.setattr(config, "SCORE_EVENTS_MAX_STREAM_S", 0.2)
+    broker = ScoreEventBroker()
+    service = ScoreService(ScoreRepository(db_path), scorer=lambda pid: _scores(Vietnam=0.7), events=broker)
+    container = DependencyContainer(configure=False)
+    container.register_instance(ScoreService, service)
+    container.register_instance(ScoreEventBroker, broker)
+    app = Flask(__name__)
+    app.extensions["container"] = container
+    app.register_blueprint(scores_bp)
+
+    service.get_scores(1)  # Computed and stored: published as event 1
+    response = app.test_client().get("/api/scores/stream?product_id=1", headers={"Last-Event-ID": "0"})
+    assert response.mimetype == "text/event-stream"
+    messages = [block for block in response.get_data(as_text=True).split("\n\n") if block]
+    response.close()
+    assert messages[0].startswith("retry: 2000\nevent: data_version")
+    assert messages[1].startswith("id: 1\nevent: scores\ndata: ")
+    assert json.loads(messages[1].split("data: ", 1)[1])["changed"]["Vietnam"]["final_score"] == 0.7
+    assert broker.subscriber_count == 0
+
+
+def test_stream_endpoint_sheds_once_the_subscriber_cap_is_reached(db_path, monkeypatch):
+    assert config.SCORE_EVENTS_MAX_SUBSCRIBERS < config.SERVER_THREADS  # A worker thread always stays free
+    monkeypatch.setattr(config, "SCORE_EVENTS_MAX_SUBSCRIBERS", 1)
+    broker = ScoreEventBroker()
+    container = DependencyContainer(configure=False)
+    container.register_instance(ScoreService, ScoreService(ScoreRepository(db_path), scorer=lambda pid: {}))
+    container.register_instance(ScoreEventBroker, broker)
+    app = Flask(__name__)
+    app.extensions["container"] = container
+    app.register_blueprint(scores_bp)
+
+    open_stream = broker.subscribe()
+    response = app.test_client().get("/api/scores/stream")
+    assert response.status_code == 503 and response.headers["Retry-After"] == "30"
+    broker.unsubscribe(open_stream)
+    assert broker.subscriber_count == 0
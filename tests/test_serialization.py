@@ -0,0 +1,65 @@
+import gzip
+import json
+from dataclasses import dataclass
+from datetime import date
+
+import pytest
+from flask import Flask, jsonify
+
+from src.presentation.api_server.flask_app.serialization import FastJSONProvider, init_compression, rows_payload, to_columnar
+
+ROWS = [{"product_id": p, "region": f"Region {r}", "final_score": round(1 / (p + r + 1), 4)} for p in range(20) for r in range(20)]
+
+
+@dataclass
+class Point:
+    x: int
+
+
+def _app(backend="auto"):
+    app = Flask(__name__)
+    app.json = FastJSONProvider(app, backend=backend)
+    init_compression(app)
+
+    @app.route("/rows")
+    def rows():
+        response = jsonify({"scores": rows_payload(ROWS)})
+        response.set_etag("rows-v1")
+        return response
+
+    @app.route("/small")
+    def small():
+        return {"ok": True, "when": date(2025, 7, 25), "point": Point(1)}
+
+    return app
+
+
+@pytest.mark.parametrize("backend", ["auto", "json"])
+def test_backends_produce_the_same_json(backend):
+    client = _app(backend).test_client()
+    assert client.get("/rows").json == {"scores": ROWS}
+    assert client.get("/small").json == {"ok": True, "when": "Fri, 25 Jul 2025 00:00:00 GMT", "point": {"x": 1}}
+
+
+def test_columnar_format():
+    assert to_columnar(ROWS[:2]) == {
+        "columns": ["product_id", "region", "final_score"],
+        "rows": [[0, "Region 0", 1.0], [0, "Region 1", 0.5]],
+    }
+    body = _app().test_client().get("/rows?format=columnar").json["scores"]
+    assert body["columns"] == ["product_id", "region", "final_score"] and len(body["rows"]) == len(ROWS)
+
+
+def test_large_responses_are_gzipped_when_accepted():
+    client = _app().test_client()
+    plain = client.get("/rows")
+    assert "Content-Encoding" not in plain.headers and plain.headers["ETag"] == '"rows-v1"'
+
+    compressed = client.get("/rows", headers={"Accept-Encoding": "gzip"})
+    assert compressed.headers["Content-Encoding"] == "gzip" and compressed.headers["Vary"] == "Accept-Encoding"
+    assert compressed.headers["ETag"] == 'W/"rows-v1"'
+    assert json.loads(gzip.decompress(compressed.data)) == plain.json
+    assert len(compressed.data) < len(plain.data) / 4
+
+    small = client.get("/small", headers={"Accept-Encoding": "gzip"})
+    assert "Content-Encoding" not in small.headers  # Below COMPRESSION_MIN_BYTES
@@ -0,0 +1,49 @@
+import sqlite3
+
+import pytest
+from flask import Flask
+
+from config import config
+from src.presentation.api_server.flask_app import serve
+from src.presentation.api_server.flask_app.routes.health_routes import health_bp
+
+
+@pytest.fixture
+def client():
+    app = Flask(__name__)
+    app.register_blueprint(health_bp)
+    return app.test_client()
+
+
+def test_readiness_checks_the_database(client, tmp_path, monkeypatch):
+    db_path = tmp_path / "textile.db"
+    monkeypatch.setattr(config, "DB_PATH", db_path)
+    assert client.get("/healthz").status_code == 200
+
+    missing = client.get("/readyz")
+    assert missing.status_code == 503 and missing.json["checks"]["database"]["ok"] is False
+
+    sqlite3.connect(db_path).execute("CREATE TABLE products (id INTEGER)").connection.close()
+    ready = client.get("/readyz")
+    assert ready.status_code == 200 and ready.json["status"] == "ready"
+    assert ready.headers["Cache-Control"] == "no-store"
+
+
+def test_worker_count_follows_cores_and_is_capped(monkeypatch):
+    monkeypatch.setattr(config, "SERVER_MAX_WORKERS", 8)
+    assert serve.default_workers(cpu_count=1) == 3
+    assert serve.default_workers(cpu_count=16) == 8
+
+
+def test_gunicorn_options_preload_threaded_workers(monkeypatch):
+    monkeypatch.setattr(config, "SERVER_WORKERS", 0)
+    options = serve.gunicorn_options(bind="0.0.0.0:9000", threads=8)
+    assert options["bind"] == "0.0.0.0:9000" and options["threads"] == 8
+    assert options["preload_app"] is True and options["worker_class"] == "gthread"
+    assert options["workers"] == serve.default_workers()
+    assert options["graceful_timeout"] == config.SERVER_GRACEFUL_TIMEOUT_S
+
+
+def test_reload_without_a_running_server_fails_cleanly(tmp_path):
+    with pytest.raises(RuntimeError, match="No running server"):
+        serve.reload_server(tmp_path / "missing.pid")
@@ -0,0 +1,72 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from flask import Flask, render_template, render_template_string
+
+from config import config
+from core.metrics import registry
+from src.presentation.api_server.flask_app.templating import FragmentCache, init_templating
+
+TEMPLATES_DIR = Path(__file__).resolve().parents[1] / "src" / "presentation" / "api_server" / "flask_app" / "templates"
+
+
+def test_the_ui_templates_precompile(tmp_path):
+    app = Flask(__name__, template_folder=str(TEMPLATES_DIR))
+    init_templating(app, precompile=False, bytecode_dir=tmp_path)
+    from src.presentation.api_server.flask_app.templating import precompile_templates
+
+    compiled = precompile_templates(app)
+    assert {"base.html", "index.html", "404.html", "500.html", "_top_regions.html"} <= set(compiled)
+    assert list(tmp_path.iterdir())  # Bytecode written for the next process
+
+
+def test_fragments_render_once_per_version(tmp_path):
+    (tmp_path / "page.html").write_text(
+        '{% call cached_fragment("expensive", version) %}{{ load() }}{% endcall %}|{{ version }}'
+    )
+    app = Flask(__name__, template_folder=str(tmp_path))
+    fragments = init_templating(app, bytecode_dir=None)
+    calls = []
+
+    def load():
+        calls.append(1)
+        return f"rows {len(calls)}"
+
+    with app.test_request_context():
+        first = render_template("page.html", version=1, load=load)
+        second = render_template("page.html", version=1, load=load)
+        third = render_template("page.html", version=2, load=load)
+    assert first == second == "rows 1|1" and third == "rows 2|2"
+    assert len(calls) == 2 and len(fragments) == 2
+
+    render_seconds = registry.get("jennai_template_render_seconds").labels(template="page.html")
+    assert render_seconds.snapshot()["count"] >= 3
+
+
+def test_fragment_cache_evicts_and_expires():
+    now = [0.0]
+    cache = FragmentCache(max_entries=2, ttl_s=10, clock=lambda: now[0])
+    for key in ("a", "b", "c"):
+        cache.set((key,), key)
+    assert cache.get(("a",)) is None and cache.get(("c",)) == "c"
+    now[0] = 11
+    assert cache.get(("c",)) is None
+
+
+def test_escaping_is_preserved_through_the_cache():
+    app = Flask(__name__)
+    init_templating(app, precompile=False, bytecode_dir=None)
+    with app.test_request_context():
+        html = render_template_string('{% call cached_fragment("x", 1) %}{{ value }}{% endcall %}', value="<script>")
+    assert html == "&lt;script&gt;"
+
+
+@pytest.mark.parametrize("value, expected", [("", "None"), ("/tmp/jinja-bytecode", "/tmp/jinja-bytecode")])
+def test_bytecode_dir_can_be_disabled_from_the_environment(value, expected):
+    env = dict(os.environ, TEMPLATE_BYTECODE_DIR=value)
+    result = subprocess.run([sys.executable, "-c", "from config import config; print(config.TEMPLATE_BYTECODE_DIR)"],
+                            capture_output=True, text=True, cwd=config.ROOT, env=env, check=True)
+    assert result.stdout.strip().splitlines()[-1] == expected
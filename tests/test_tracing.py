@@ -0,0 +1,82 @@
+import json
+import threading
+
+import pytest
+from flask import Flask
+
+from core.tracing import current_trace_id, export_chrome_trace, start_trace, trace_span, traced, tracer
+from src.presentation.api_server.flask_app.request_tracing import init_request_tracing
+
+
+@pytest.fixture(autouse=True)
+def clean_tracer():
+    tracer.clear()
+    yield
+    tracer.clear()
+
+
+@traced("loader.test")
+def _loader():
+    with trace_span("loader.query", rows=3):
+        return current_trace_id()
+
+
+def test_spans_nest_and_share_the_trace_id():
+    with start_trace("trace-1"):
+        with trace_span("scorer.score_regions") as root:
+            assert _loader() == "trace-1"
+
+    spans = {span.name: span for span in tracer.spans("trace-1")}
+    assert set(spans) == {"scorer.score_regions", "loader.test", "loader.query"}
+    assert spans["loader.test"].parent_id == root.span_id
+    assert spans["loader.query"].parent_id == spans["loader.test"].span_id
+    assert spans["loader.query"].attributes == {"rows": 3}
+    assert root.end_ns >= spans["loader.test"].end_ns >= spans["loader.query"].end_ns
+
+
+def test_errors_are_recorded_and_context_is_restored():
+    with pytest.raises(ValueError):
+        with trace_span("boom"):
+            raise ValueError("bad input")
+    assert tracer.spans()[0].error == "ValueError: bad input"
+    with trace_span("after") as span:
+        assert span.parent_id is None
+
+
+def test_threads_start_independent_traces():
+    ids = []
+    threads = [threading.Thread(target=lambda: ids.append(_loader())) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(set(ids)) == 4
+
+
+def test_chrome_trace_export(tmp_path):
+    with start_trace("trace-2"):
+        _loader()
+    path = export_chrome_trace(tmp_path / "trace.json", trace_id="trace-2")
+    events = json.loads(path.read_text())["traceEvents"]
+    assert {event["name"] for event in events} == {"loader.test", "loader.query"}
+    assert all(event["ph"] == "X" and event["dur"] >= 0 for event in events)
+
+
+def test_flask_requests_get_a_root_span_and_request_id():
+    app = Flask(__name__)
+    init_request_tracing(app)
+
+    @app.route("/score/<int:product_id>")
+    def score(product_id):
+        return {"trace_id": _loader()}
+
+    client = app.test_client()
+    response = client.get("/score/1", headers={"X-Request-ID": "req-42"})
+    assert response.headers["X-Request-ID"] == "req-42" and response.json["trace_id"] == "req-42"
+    names = [span.name for span in tracer.spans("req-42")]
+    assert names[-1] == "http.GET /score/<int:product_id>"
+    assert tracer.spans("req-42")[-1].attributes["status"] == 200
+
+    generated = client.get("/score/2").headers["X-Request-ID"]
+    assert generated and generated != "req-42"
+    assert current_trace_id() is None